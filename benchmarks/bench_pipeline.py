@@ -0,0 +1,75 @@
+"""
+pytest-benchmark suite for the Mitigating Circumstances program, run on synthetic exports (see
+synthetic_export.py) - the same stages as run_benchmarks.py, but with pytest-benchmark keeping the
+results of every run so that they can be compared, and a build failed on a slowdown. Run from the
+repository root (see benchmarks/README.md):
+    python -m pytest benchmarks/bench_pipeline.py --benchmark-autosave
+    python -m pytest benchmarks/bench_pipeline.py --benchmark-compare --benchmark-compare-fail=min:20%
+The export sizes are MITCIRCS_BENCHMARK_SIZES (space-separated), 1000 and 10000 rows by default.
+"""
+import os
+import sys
+import contextlib
+import io
+import pytest
+from typing import List, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip("pytest_benchmark")
+
+from mitcircs import (DataFrame, REQUEST_ENGINES, read_cleaned_qualtrics, build_qualtrics_request_frame,
+                      build_tracker, write_tracker_spreadsheet)
+from synthetic_export import make_synthetic_export, write_synthetic_export
+from run_benchmarks import BENCHMARK_REPEAT, ROWS_ENGINE_MAXIMUM
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Each benchmark is run BENCHMARK_REPEAT times rather than as many times as pytest-benchmark would
+# like, since one round of the larger sizes takes seconds. As in run_benchmarks.py, each stage is
+# given the output of the stage before it, built once per size, so that only the stage is timed.
+
+BENCHMARK_SIZES: List[int] = [int(size) for size in os.environ.get("MITCIRCS_BENCHMARK_SIZES", "1000 10000").split()]
+
+
+@pytest.fixture(scope = "module", params = BENCHMARK_SIZES, ids = lambda size: f"{size}rows")
+def stages(request, tmp_path_factory) -> Dict[str, any]:
+    directory: str = str(tmp_path_factory.mktemp("benchmarks"))
+    csvpath:   str = write_synthetic_export(make_synthetic_export(request.param), os.path.join(directory, "Synthetic Export.csv"))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        qualtrics: DataFrame = read_cleaned_qualtrics(csvpath, cache_directory = None)
+        frame:     DataFrame = build_qualtrics_request_frame(qualtrics, False)
+
+    return {"students": request.param, "directory": directory, "csv": csvpath, "qualtrics": qualtrics,
+            "frame": frame, "tracker": build_tracker(frame)}
+
+
+def run(benchmark, stages: Dict[str, any], function) -> None:
+    benchmark.group = f"{stages['students']} rows"
+    benchmark.extra_info["rows"] = stages["students"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        benchmark.pedantic(function, rounds = BENCHMARK_REPEAT, iterations = 1)
+
+
+# - - - - - - >
+
+
+def test_read_csv(benchmark, stages):
+    run(benchmark, stages, lambda: read_cleaned_qualtrics(stages["csv"], cache_directory = None))
+
+
+@pytest.mark.parametrize("engine", REQUEST_ENGINES)
+def test_build_requests(benchmark, stages, engine):
+    if engine == "rows" and stages["students"] > ROWS_ENGINE_MAXIMUM:
+        pytest.skip(f"The row-by-row engine is only benchmarked up to {ROWS_ENGINE_MAXIMUM} rows")
+    run(benchmark, stages, lambda: build_qualtrics_request_frame(stages["qualtrics"], False, engine))
+
+
+def test_build_tracker(benchmark, stages):
+    run(benchmark, stages, lambda: build_tracker(stages["frame"]))
+
+
+def test_write_xlsx(benchmark, stages):
+    run(benchmark, stages, lambda: write_tracker_spreadsheet(stages["tracker"], os.path.join(stages["directory"], "Tracker.xlsx")))
@@ -0,0 +1,153 @@
+"""
+Benchmarks for the Mitigating Circumstances program, run on synthetic exports (see synthetic_export.py).
+Times reading an export, building the requests and writing the Tracker at each size - run from the
+repository root:
+    python benchmarks/run_benchmarks.py [--sizes 1000 10000 100000] [--repeat 3] [--save results.json]
+Saving the results of one run and passing them to a later one with --compare reports any benchmark
+that has become more than --tolerance slower, and exits with 1, so that a regression can be caught.
+The same stages are also a pytest-benchmark suite (bench_pipeline.py), which is what CI runs - see
+benchmarks/README.md.
+"""
+import os
+import sys
+import argparse
+import contextlib
+import io
+import json
+import platform
+import tempfile
+import time
+import pandas
+from typing import List, Dict, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mitcircs import (DataFrame, REQUEST_ENGINES, read_cleaned_qualtrics, build_qualtrics_request_frame,
+                      build_tracker, write_tracker_spreadsheet)
+from synthetic_export import make_synthetic_export, write_synthetic_export
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Each benchmark is timed "repeat" times and the fastest is kept, as the slower runs are mostly other
+# things happening on the machine at the same time. The row-by-row engine is far too slow to run at
+# the largest size, so it is only run up to ROWS_ENGINE_MAXIMUM rows, and the same goes for reading
+# a '.xlsx' export (writing the 100,000-row export with openpyxl alone takes minutes).
+
+BENCHMARK_SIZES:     List[int] = [1000, 10000, 100000]
+BENCHMARK_REPEAT:    int = 3
+BENCHMARK_TOLERANCE: float = 0.2
+ROWS_ENGINE_MAXIMUM: int = 10000
+XLSX_READ_MAXIMUM:   int = 10000
+
+
+# - - - - - - >
+# Fastest of "repeat" calls to the function, in seconds - the pipeline prints as it goes, which is
+# not wanted here (and would be timed along with everything else), so this is thrown away
+
+
+def best_time(function: Callable[[], any], repeat: int) -> float:
+    times: List[float] = []
+
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start: float = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+# - - - - - - >
+# Every benchmark at one size, as {benchmark name: seconds}. Each stage is given the output of the
+# stage before it, built once up-front, so that only the stage itself is timed.
+
+def run_size(students: int, directory: str, repeat: int, xlsx: bool) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    export:  DataFrame = make_synthetic_export(students)
+    csvpath: str = write_synthetic_export(export, os.path.join(directory, f"Synthetic Export {students}.csv"))
+
+    results["read csv"] = best_time(lambda: read_cleaned_qualtrics(csvpath, cache_directory = None), repeat)
+    if xlsx and students <= XLSX_READ_MAXIMUM:
+        xlsxpath: str = write_synthetic_export(export, os.path.join(directory, f"Synthetic Export {students}.xlsx"))
+        results["read xlsx"] = best_time(lambda: read_cleaned_qualtrics(xlsxpath, cache_directory = None), repeat)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        qualtrics: DataFrame = read_cleaned_qualtrics(csvpath, cache_directory = None)
+        frame:     DataFrame = build_qualtrics_request_frame(qualtrics, False)
+        tracker:   DataFrame = build_tracker(frame)
+
+    for engine in REQUEST_ENGINES:
+        if engine != "rows" or students <= ROWS_ENGINE_MAXIMUM:
+            results[f"build requests ({engine})"] = best_time(lambda: build_qualtrics_request_frame(qualtrics, False, engine), repeat)
+
+    results["build tracker"] = best_time(lambda: build_tracker(frame), repeat)
+    results["write xlsx"] = best_time(lambda: write_tracker_spreadsheet(tracker, os.path.join(directory, "Tracker.xlsx")), repeat)
+    return results
+
+
+# - - - - - - >
+# Benchmarks that are more than "tolerance" slower than in the saved results, as {benchmark: (then, now)}
+
+
+def find_regressions(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> Dict[str, tuple]:
+    regressions: Dict[str, tuple] = {}
+
+    for size, timings in results.items():
+        for name, seconds in timings.items():
+            previous: float = baseline.get(size, {}).get(name)
+            if previous is not None and seconds > previous * (1 + tolerance):
+                regressions[f"{name} @ {size} rows"] = (previous, seconds)
+
+    return regressions
+
+
+# - - - - - - >
+
+
+def results_table(results: Dict[str, Dict[str, float]]) -> str:
+    rows: List[Dict[str, any]] = [{"Rows": int(size), "Benchmark": name, "Seconds": seconds, "Rows/sec": int(size) / seconds}
+                                  for size, timings in results.items() for name, seconds in timings.items()]
+    return pandas.DataFrame(rows).to_string(index = False, float_format = lambda value: f"{value:.3f}")
+
+
+# - - - - - - >
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description = "Benchmark the Mitigating Circumstances program on synthetic exports.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = BENCHMARK_SIZES, metavar = "ROWS", help = f"Export sizes to benchmark (default: {BENCHMARK_SIZES})")
+    parser.add_argument("--repeat", type = int, default = BENCHMARK_REPEAT, help = f"Times each benchmark is run, keeping the fastest (default: {BENCHMARK_REPEAT})")
+    parser.add_argument("--no-xlsx", action = "store_true", help = "Skip reading '.xlsx' exports")
+    parser.add_argument("--save", metavar = "JSON", help = "Write the results to this file")
+    parser.add_argument("--compare", metavar = "JSON", help = "Results saved by an earlier run to compare against")
+    parser.add_argument("--tolerance", type = float, default = BENCHMARK_TOLERANCE, help = f"How much slower counts as a regression (default: {BENCHMARK_TOLERANCE:.0%})")
+    arguments = parser.parse_args(argv)
+
+    # Sizes are strings in the results so that they look the same once they have been through JSON
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for students in arguments.sizes:
+            print(f"Benchmarking {students} rows...")
+            results[str(students)] = run_size(students, directory, arguments.repeat, not arguments.no_xlsx)
+
+    print(results_table(results))
+
+    if arguments.save:
+        with open(arguments.save, "w", encoding = "utf-8") as handle:
+            json.dump({"python": platform.python_version(), "pandas": pandas.__version__, "results": results}, handle, indent = 2)
+        print(f"Results written to '{arguments.save}'")
+
+    if arguments.compare:
+        with open(arguments.compare, encoding = "utf-8") as handle:
+            regressions: Dict[str, tuple] = find_regressions(results, json.load(handle)["results"], arguments.tolerance)
+        for name, (previous, seconds) in regressions.items():
+            print(f"Regression: {name} took {seconds:.3f}s, up from {previous:.3f}s", file = sys.stderr)
+        if regressions:
+            return 1
+        print(f"No benchmark is more than {arguments.tolerance:.0%} slower than in '{arguments.compare}'")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Synthetic Qualtrics exports for benchmarking the Mitigating Circumstances program.
+Real exports contain student data and cannot be shared, so this builds exports of any size with the
+same layout as the current Qualtrics form, taken from the column names and header strings in
+mitcircs.py - run from the repository root:
+    python benchmarks/synthetic_export.py 10000 "Synthetic Export.csv" [--groups 30] [--seed 1]
+"""
+import os
+import sys
+import argparse
+import numpy
+import pandas
+from typing import List, Dict, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mitcircs import (DataFrame, Array, QUALTRICS_SHEET_NAME, RESPONSE_COLUMN_INDICES,
+                      HEADER_SEARCH_PROGRAMME, HEADER_SEARCH_COURSEYEAR, HEADER_SEARCH_EVIDENCE, HEADER_SEARCH_SUPERVISOR,
+                      COLNAME_SUFFIX_DIVISION, COLNAME_SUFFIX_PROGRAMME, COLNAME_SUFFIX_COURSEYEAR, COLNAME_SUFFIX_UNITASSESSMENT,
+                      COLNAME_SUFFIX_OTHERINFORMATION, COLNAME_SUFFIX_RESUBMISSION, COLNAME_SUFFIX_RESUB_FIRST,
+                      COLNAME_SUFFIX_RESUB_SECOND, COLNAME_SUFFIX_SUBSTATUS,
+                      COLNAME_PREFIX_DATESUBMITTED, COLNAME_PREFIX_RESPONSEID, COLNAME_PREFIX_STUDENTNAME,
+                      COLNAME_PREFIX_EMAILADDRESS, COLNAME_PREFIX_STUDENTID, COLNAME_PREFIX_DASS_REGISTERED,
+                      COLNAME_PREFIX_ISPOSTGRADORRES, COLNAME_PREFIX_SUPERVISCONTACT, COLNAME_PREFIX_PROPOSEDDEADLINE,
+                      COLNAME_PREFIX_TIER4_VISA, COLNAME_PREFIX_ADVISORNAME, COLNAME_PREFIX_MITIGATIONDETAIL,
+                      COLNAME_PREFIX_PERIODAFFECTED, COLNAME_PREFIX_LATEAPPLICATION, COLNAME_PREFIX_ASSESSMENTCOUNT,
+                      COLNAME_PREFIX_PROVIDESEVIDENCE, COLNAME_PREFIX_EVIDENCEFILENAME)
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# The columns of the export, in order, as (column name, header text) pairs. The header text is the
+# question the students were asked, and is what build_header_index() searches for the Programme,
+# Year, Supervisor and Evidence columns - so these have to contain the HEADER_SEARCH strings.
+# Note that, as in the real export, the column names "Q1" and "Q3" each appear twice.
+
+SYNTHETIC_LEADING_COLUMNS: List[Tuple[str, str]] = [
+    ("StartDate",                     "Start Date"),
+    ("EndDate",                       "End Date"),
+    ("Status",                        "Response Type"),
+    ("IPAddress",                     "IP Address"),
+    ("Duration (in seconds)",         "Duration (in seconds)"),
+    (COLNAME_PREFIX_DATESUBMITTED,    "Recorded Date"),
+    (COLNAME_PREFIX_RESPONSEID,       "Response ID"),
+    (COLNAME_PREFIX_STUDENTNAME,      "What is your full name?"),
+    (COLNAME_PREFIX_EMAILADDRESS,     "What is your University email address?"),
+    (COLNAME_PREFIX_STUDENTID,        "What is your Student ID number?"),
+    (COLNAME_PREFIX_DASS_REGISTERED,  "Are you currently registered with DASS?"),
+    (COLNAME_PREFIX_ISPOSTGRADORRES,  "Is this application for a postgraduate dissertation or research project?"),
+    (COLNAME_PREFIX_SUPERVISCONTACT,  "Have you spoken to your dissertation supervisor?"),
+    (COLNAME_PREFIX_STUDENTNAME,      HEADER_SEARCH_SUPERVISOR),
+    (COLNAME_PREFIX_PROPOSEDDEADLINE, "Proposed new deadline"),
+    (COLNAME_PREFIX_TIER4_VISA,       "Are you on a Tier 4 visa?"),
+    (COLNAME_PREFIX_ADVISORNAME,      "Who is your academic advisor?"),
+    (COLNAME_PREFIX_MITIGATIONDETAIL, "Please give details of your circumstances"),
+    (COLNAME_PREFIX_PERIODAFFECTED,   "What period of time were you affected for?"),
+    (COLNAME_PREFIX_LATEAPPLICATION,  "If this application is late, why?"),
+    (COLNAME_PREFIX_ASSESSMENTCOUNT,  "How many assessments are you applying for?")]
+
+SYNTHETIC_TRAILING_COLUMNS: List[Tuple[str, str]] = [
+    (COLNAME_PREFIX_PROVIDESEVIDENCE, f"Are you {HEADER_SEARCH_EVIDENCE}?"),
+    (COLNAME_PREFIX_EVIDENCEFILENAME, "Upload your evidence - Name")]
+
+# ~ ~ ~ >
+# Each assessment group "N_..." has the subquestions in the order given by RESPONSE_COLUMN_INDICES
+
+SYNTHETIC_GROUP_QUESTIONS: Dict[str, Tuple[str, str]] = {
+    COLNAME_SUFFIX_DIVISION:         ("_Q161", "Division"),
+    COLNAME_SUFFIX_PROGRAMME:        ("_Q161", HEADER_SEARCH_PROGRAMME),
+    COLNAME_SUFFIX_COURSEYEAR:       ("_Q161", f"{HEADER_SEARCH_COURSEYEAR} of study"),
+    COLNAME_SUFFIX_UNITASSESSMENT:   ("_Q161", "Unit and assessment"),
+    COLNAME_SUFFIX_OTHERINFORMATION: ("",      "Other assessment details"),
+    COLNAME_SUFFIX_RESUBMISSION:     ("",      "Is this a resubmission? - Selected Choice"),
+    COLNAME_SUFFIX_RESUB_FIRST:      ("_Q165", "Is this a resubmission? - Yes, first attempt - Text"),
+    COLNAME_SUFFIX_RESUB_SECOND:     ("_Q165", "Is this a resubmission? - Yes, second attempt - Text"),
+    COLNAME_SUFFIX_SUBSTATUS:        ("",      "Submission status")}
+
+SYNTHETIC_MAXIMUM_GROUPS:   int = 99
+SYNTHETIC_MAXIMUM_APPLIED:  int = 4
+SYNTHETIC_DIVISIONS:        List[str] = ["Nursing, Midwifery and Social Work", "Medical Education", "Pharmacy and Optometry", "Dentistry"]
+SYNTHETIC_UNIT_CODES:       List[str] = ["NURS", "MEDI", "PHAR", "DENT", "OPTO"]
+SYNTHETIC_ASSESSMENTS:      List[str] = ["Essay", "Exam", "Report", "Portfolio", "Presentation", "OSCE"]
+SYNTHETIC_STATUSES:         List[str] = ["I have submitted the work", "I will submit the work late", "I have not attended the exam"]
+
+
+def synthetic_columns(groups: int) -> List[Tuple[str, str]]:
+    columns: List[Tuple[str, str]] = list(SYNTHETIC_LEADING_COLUMNS)
+
+    for number in range(1, groups + 1):
+        for suffix in sorted(RESPONSE_COLUMN_INDICES, key = RESPONSE_COLUMN_INDICES.get):
+            question, text = SYNTHETIC_GROUP_QUESTIONS[suffix]
+            columns.append((f"{number}{question}{suffix}", f"Assessment {number} - {text}"))
+
+    return columns + SYNTHETIC_TRAILING_COLUMNS
+
+
+# - - - - - - >
+# Build an export of the given number of students, a column at a time. Each student applies for
+# between 0 and SYNTHETIC_MAXIMUM_APPLIED of the assessment groups, a few of which are only partly
+# filled in (so that they fall below MINIMUM_REQUIRED_RESPONSES), and roughly a fifth of every
+# optional answer is left blank - including the odd student ID, to exercise the "None given" paths.
+# The header row and the ImportId junk row are the first two rows, as they are in a real export.
+
+def make_synthetic_export(students: int, groups: int = 30, seed: int = 1) -> DataFrame:
+    if not 1 <= groups <= SYNTHETIC_MAXIMUM_GROUPS:
+        raise ValueError(f"There can only be 1 to {SYNTHETIC_MAXIMUM_GROUPS} assessment groups, not {groups}")
+
+    rng:     numpy.random.Generator = numpy.random.default_rng(seed)
+    columns: List[Tuple[str, str]] = synthetic_columns(groups)
+    numbers: Array = numpy.arange(students)
+    days:    Array = pandas.Timestamp("2025-01-06") + pandas.to_timedelta(numbers * 600, unit = "s")
+
+    def blanked(values: Array, fraction: float = 0.2) -> Array:
+        values = numpy.asarray(values, dtype = object)
+        values[rng.random(students) < fraction] = numpy.nan
+        return values
+
+    def choice(options: List[any]) -> Array:
+        return numpy.asarray(options, dtype = object)[rng.integers(0, len(options), students)]
+
+    data: List[Array] = [
+        days.strftime("%Y-%m-%d %H:%M:%S"),
+        (days + pandas.to_timedelta(rng.integers(30, 3000, students), unit = "s")).strftime("%Y-%m-%d %H:%M:%S"),
+        numpy.full(students, "IP Address", dtype = object),
+        numpy.full(students, "10.0.0.1", dtype = object),
+        rng.integers(30, 3000, students),
+        days.strftime("%Y-%m-%d %H:%M:%S"),
+        numpy.char.add("R_", numpy.char.zfill(numbers.astype(str), 15)),
+        blanked(numpy.char.add(numpy.char.add("  Student ", numbers.astype(str)), " "), 0.05),
+        blanked(numpy.char.add(numpy.char.add("student", numbers.astype(str)), "@student.manchester.ac.uk")),
+        blanked(10000000 + numbers, 0.05),
+        choice([numpy.nan, "Yes", "No", 0, ""]),
+        blanked(choice(["Yes", "No"])),
+        blanked(choice(["Yes", "No"]), 0.7),
+        blanked(numpy.char.add("Dr Supervisor ", (numbers % 7).astype(str)), 0.7),
+        blanked(numpy.full(students, "01/06/2025", dtype = object), 0.7),
+        blanked(choice(["Yes", "No"])),
+        blanked(numpy.char.add("Prof Advisor ", (numbers % 11).astype(str))),
+        blanked(choice(["I was unwell\nfor two weeks", "Bereavement", "I was in hospital " * 5, "Caring responsibilities\nat home\nsince March"])),
+        blanked(numpy.full(students, "01/01/25 to 14/01/25", dtype = object)),
+        blanked(numpy.full(students, "My GP appointment was delayed", dtype = object), 0.9)]
+
+    # Which groups each student has applied for - the first "applied" of a random ordering of them
+    applied: Array = rng.integers(0, SYNTHETIC_MAXIMUM_APPLIED + 1, students)
+    ranks:   Array = rng.random((students, groups)).argsort(axis = 1).argsort(axis = 1)
+    data.append(applied.astype(str))
+
+    for group in range(groups):
+        filled:  Array = ranks[:, group] < applied
+        partial: Array = filled & (rng.random(students) < 0.1)
+        code:    Array = numpy.char.add(choice(SYNTHETIC_UNIT_CODES).astype(str), rng.integers(10000, 99999, students).astype(str))
+        values: List[Array] = [
+            choice(SYNTHETIC_DIVISIONS + [0, ""]),
+            numpy.full(students, f"Programme {group + 1}", dtype = object),
+            choice([1, 2, "3", "4", "PGT"]),
+            numpy.char.add(numpy.char.add(code, ": "), choice(SYNTHETIC_ASSESSMENTS).astype(str)),
+            blanked(numpy.char.add(code, " - submission date 12/05/2025"), 0.7),
+            choice(["No", "Yes, first attempt", "Yes, second attempt"]),
+            blanked(numpy.full(students, "20/06/2025", dtype = object), 0.5),
+            blanked(numpy.full(students, "21/07/2025", dtype = object), 0.8),
+            choice(SYNTHETIC_STATUSES)]
+
+        for position, column in enumerate(values):
+            column = numpy.asarray(column, dtype = object)
+            column[~filled] = numpy.nan
+            if position not in (0, 3):
+                column[partial] = numpy.nan
+            data.append(column)
+
+    data.append(blanked(choice(["Yes", "No"])))
+    data.append(blanked(numpy.char.add(numbers.astype(str), "_evidence.pdf"), 0.6))
+
+    export: DataFrame = pandas.DataFrame(dict(enumerate(data)))
+    top:    DataFrame = pandas.DataFrame([[text for _, text in columns],
+                                          ['{"ImportId":"' + name + '"}' for name, _ in columns]])
+    export = pandas.concat([top, export], ignore_index = True)
+    export.columns = [name for name, _ in columns]
+    return export
+
+
+# - - - - - - >
+# Write the export as a '.csv' or as a '.xlsx' (on QUALTRICS_SHEET_NAME, as Qualtrics does)
+
+
+def write_synthetic_export(export: DataFrame, path: str) -> str:
+    if path.endswith(".csv"):
+        export.to_csv(path, index = False)
+    else:
+        export.to_excel(path, index = False, sheet_name = QUALTRICS_SHEET_NAME)
+    return path
+
+
+# - - - - - - >
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description = "Write a synthetic Qualtrics Mitigating Circumstances export.")
+    parser.add_argument("students", type = int, help = "Number of student rows")
+    parser.add_argument("output", help = "Path of the export to write ('.csv' or '.xlsx')")
+    parser.add_argument("--groups", type = int, default = 30, help = f"Number of assessment groups, 1 to {SYNTHETIC_MAXIMUM_GROUPS} (default: 30)")
+    parser.add_argument("--seed", type = int, default = 1, help = "Random seed (default: 1)")
+    arguments = parser.parse_args(argv)
+    if not 1 <= arguments.groups <= SYNTHETIC_MAXIMUM_GROUPS:
+        parser.error(f"--groups must be between 1 and {SYNTHETIC_MAXIMUM_GROUPS}")
+
+    write_synthetic_export(make_synthetic_export(arguments.students, arguments.groups, arguments.seed), arguments.output)
+    print(f"Written {arguments.students} students to '{arguments.output}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,29 @@ Rowan Lawrence - new as of 13/01/2025
 """
 import os
 import re
+import sys
+import argparse
+import collections
+import contextlib
+import cProfile
+import glob
+import hashlib
+import json
+import logging
+import logging.handlers
+import multiprocessing
+import pickle
+import platform
+import pstats
+import time
+import threading
+import tracemalloc
+import numpy
 import pandas
 from datetime import datetime
 from datetime import date
-from typing import TypeVar, List, Dict
-from dataclasses import dataclass
-import tkinter as tk
-from tkinter import filedialog
-from tkinter.messagebox import showinfo
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar, List, Dict, Tuple
 
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
@@ -47,14 +62,7 @@ COLNAME_SUFFIX_RESUB_FIRST      = "_1_TEXT"    # Resubmission deadline *if* this
 COLNAME_SUFFIX_RESUB_SECOND     = "_3_TEXT"    # Resubmission deadline *if* this is a 2nd attempt
 COLNAME_SUFFIX_SUBSTATUS        = "_Q163"      # Submission status and intentions - have you submitted the work, attended exam, etc? Will you?
 
-# OLD_COLNAME_SUFFIX_PROGRAMME    = "_1"         # Name of degree programme the student is currently on 
-# OLD_COLNAME_SUFFIX_COURSEYEAR   = "_2"         # Integer, Current Year within that course (1, 2, 3, etc.)
-# OLD_COLNAME_SUFFIX_UNITCODE     = "_3"         # Unit code for the Module the Assessment being applied for is from
-# OLD_COLNAME_SUFFIX_ASSESSMENT   = "_4"         # Name (and / or submission date) of the Assessment
-# OLD_COLNAME_SUFFIX_RESUBMISSION = "_Q1"        # Is this a Resubmission? Date is provided if it is (otherwise "No")
-# OLD_COLNAME_SUFFIX_RESUB_FIRST  = "_1_TEXT"    # Resubmission deadline *if* this is a 1st attempt
-# OLD_COLNAME_SUFFIX_RESUB_SECOND = "_4_TEXT"    # Resubmission deadline *if* this is a 2nd attempt
-# OLD_COLNAME_SUFFIX_SUBSTATUS    = "_Q165"      # Submission status - have you submitted the work, attended exam, etc?
+# The suffixes used by older versions of the Qualtrics form are kept in COLUMN_PROFILES, below
 
 
 # - - - - - - >
@@ -68,14 +76,8 @@ RESPONSE_COLUMN_INDICES: Dict[str, int] = {COLNAME_SUFFIX_DIVISION:         0, C
                                            COLNAME_SUFFIX_SUBSTATUS:        8}
 
 # NOTE:
-# Another artefact of the previous 2024 Qualtrics version that we were using as input.
-# The same is true for the COLNAME_PREFIX global variables defined above.
-# The newest (NOVEMBER 2024) version of the Qualtrics output has had it's Q-columns rearranaged and,
-# it seems, had new ones added to it. Again, these are kept here in case of another change / reversion.
-#OLD_RESPONSE_COLUMN_INDICES: Dict[str, int] = {COLNAME_SUFFIX_PROGRAMME:    0, COLNAME_SUFFIX_COURSEYEAR:  1,
-#                                               COLNAME_SUFFIX_UNITCODE:     2, COLNAME_SUFFIX_ASSESSMENT:  3,
-#                                               COLNAME_SUFFIX_RESUBMISSION: 4, COLNAME_SUFFIX_RESUB_FIRST: 5,
-#                                               COLNAME_SUFFIX_RESUB_SECOND: 6, COLNAME_SUFFIX_SUBSTATUS:   7}
+# The previous 2024 version of the Qualtrics form had its Q-columns in a different order, with
+# no Division column - see the "2024" entry of COLUMN_PROFILES, below.
 
 
 # - - - - - - >
@@ -92,6 +94,7 @@ RESPONSE_COLUMN_INDICES: Dict[str, int] = {COLNAME_SUFFIX_DIVISION:         0, C
 #       in the top "Header" row of the sheet instead
 
 COLNAME_PREFIX_DATESUBMITTED    = "RecordedDate" # String - Date and time the application was submitted
+COLNAME_PREFIX_RESPONSEID       = "ResponseId"   # Qualtrics' own unique ID for each response (used by incremental runs)
 COLNAME_PREFIX_STUDENTNAME      = "Q1"           # Full name of the student applying
 COLNAME_PREFIX_EMAILADDRESS     = "Q3"           # UoM (I assume) email address of the student applying
 COLNAME_PREFIX_STUDENTID        = "Q4"           # Student ID number of applicant (as on student card)
@@ -110,30 +113,88 @@ COLNAME_PREFIX_PROVIDESEVIDENCE = "Q3"           # Will you be providing evidenc
 COLNAME_PREFIX_EVIDENCEFILENAME = "Q164_Name"    # If "Yes", the filename of the evidence submitted
 
 # INFORMATION:
-# Column name Q160, containing the specified assessment application count, *used* to be 
-# column name Q163 in the older test data. Making a note of this here in case the format 
-# changes again or reverts in the future.
-#COLNAME_PREFIX_ASSESSMENTCOUNT  = "Q163"         # How many assessments are you applying for?
+# Column name Q160, containing the specified assessment application count, *used* to be
+# column name Q163 in the older test data - see the "2024" entry of COLUMN_PROFILES.
+
+
+# - - - - - - >
+# The Qualtrics form keeps changing between academic years, so each version of it is described here
+# as a "column profile", rather than by editing the constants above (and commenting out the old ones)
+# whenever an older export has to be processed again. Each profile gives:
+#   "renames":   the columns which that version of the form named differently, as
+#                {name in that version: COLNAME_PREFIX_* it corresponds to}
+#   "responses": the subquestions of each numbered assessment group in that version, in order, as
+#                (suffix in that version, COLNAME_SUFFIX_* it corresponds to, or None if there is none)
+# Every export is translated into the current layout (see apply_column_profile()) as soon as it has
+# been read, so nothing after that needs to know which version it came from. Add a new version of
+# the form as a new entry at the top - the first profile that matches an export is the one used.
+
+COLUMN_PROFILES: Dict[str, Dict[str, any]] = {
+    "2024-11": {"renames":   {},
+                "responses": [(suffix, suffix) for suffix in sorted(RESPONSE_COLUMN_INDICES, key = RESPONSE_COLUMN_INDICES.get)]},
+    "2024":    {"renames":   {"Q163": COLNAME_PREFIX_ASSESSMENTCOUNT},
+                "responses": [("_1",      COLNAME_SUFFIX_PROGRAMME),         # Name of degree programme the student is currently on
+                              ("_2",      COLNAME_SUFFIX_COURSEYEAR),        # Integer, Current Year within that course (1, 2, 3, etc.)
+                              ("_3",      COLNAME_SUFFIX_UNITASSESSMENT),    # Unit code for the Module the Assessment being applied for is from
+                              ("_4",      COLNAME_SUFFIX_OTHERINFORMATION),  # Name (and / or submission date) of the Assessment
+                              ("_Q1",     COLNAME_SUFFIX_RESUBMISSION),      # Is this a Resubmission? Date is provided if it is (otherwise "No")
+                              ("_1_TEXT", COLNAME_SUFFIX_RESUB_FIRST),       # Resubmission deadline *if* this is a 1st attempt
+                              ("_4_TEXT", COLNAME_SUFFIX_RESUB_SECOND),      # Resubmission deadline *if* this is a 2nd attempt
+                              ("_Q165",   COLNAME_SUFFIX_SUBSTATUS)]},       # Submission status - have you submitted the work, attended exam, etc?
+}
+
+DEFAULT_COLUMN_PROFILE: str = "2024-11"
 
 
 # - - - - - - >
 
 
-COLUMN_KEY_ERROR_MESSAGES: Dict[int, str] = {
+COLUMN_KEY_ERROR_MESSAGES: Dict[str, str] = {
+    COLNAME_PREFIX_STUDENTNAME:      "Could not read 'Student Name' column!\nExpected column name to be 'Q1' - please check this and run again.",
     COLNAME_PREFIX_STUDENTID:        "Could not read 'Student ID' column!\nExpected column name to be 'Q4' - please check this and run again.",
-    COLNAME_PREFIX_EMAILADDRESS:     "Could not read 'Email Address' column!\n Expected column name to be 'Q3' - please check this and run again.",
-    COLNAME_PREFIX_DATESUBMITTED:    "Could not read '' column!\n Expected column name to be '' - please check this and run again.",
-    COLNAME_PREFIX_ISPOSTGRADORRES:  "Could not read 'Is Postgrad. or Research' column!\n Expected column name to be 'Q150' - please check this and run again.",
-    COLNAME_PREFIX_ASSESSMENTCOUNT:  "Could not read 'Assessment Count' column!\n Expected column name to be 'Q160' - please check this and run again.",
-    COLNAME_PREFIX_MITIGATIONDETAIL: "Could not read 'Details of Mitigation' column!\n Expected column name to be 'Q19' - please check this and run again.",
-    COLNAME_PREFIX_PERIODAFFECTED:   "Could not read 'Period Affected' column!\n Expected column name to be 'Q20' - please check this and run again.",
-    COLNAME_PREFIX_ADVISORNAME:      "Could not read 'Advisor Name' column!\n Expected column name to be 'Q17' - please check this and run again.",
-    COLNAME_PREFIX_LATEAPPLICATION:  "Could not read 'Application Outside of Deadline' column!\n Expected column name to be 'Q21' - please check this and run again.",
-    COLNAME_PREFIX_SUPERVISCONTACT:  "Could not read 'Supervisor Spoken To' column!\n Expected column name to be 'Q152' - please check this and run again.",
-    COLNAME_PREFIX_TIER4_VISA:       "Could not read 'On Tier 4 Visa?' column!\n Expected column name to be 'Q153' - please check this and run again.",
-    COLNAME_PREFIX_PROPOSEDDEADLINE: "Could not read 'Proposed New Submission Date' column!\n Expected column name to be 'Q151' - please check this and run again."
+    COLNAME_PREFIX_EMAILADDRESS:     "Could not read 'Email Address' column!\nExpected column name to be 'Q3' - please check this and run again.",
+    COLNAME_PREFIX_DATESUBMITTED:    "Could not read 'Date Submitted' column!\nExpected column name to be 'RecordedDate' - please check this and run again.",
+    COLNAME_PREFIX_ISPOSTGRADORRES:  "Could not read 'Is Postgrad. or Research' column!\nExpected column name to be 'Q150' - please check this and run again.",
+    COLNAME_PREFIX_ASSESSMENTCOUNT:  "Could not read 'Assessment Count' column!\nExpected column name to be 'Q160' - please check this and run again.",
+    COLNAME_PREFIX_MITIGATIONDETAIL: "Could not read 'Details of Mitigation' column!\nExpected column name to be 'Q19' - please check this and run again.",
+    COLNAME_PREFIX_PERIODAFFECTED:   "Could not read 'Period Affected' column!\nExpected column name to be 'Q20' - please check this and run again.",
+    COLNAME_PREFIX_ADVISORNAME:      "Could not read 'Advisor Name' column!\nExpected column name to be 'Q17' - please check this and run again.",
+    COLNAME_PREFIX_LATEAPPLICATION:  "Could not read 'Application Outside of Deadline' column!\nExpected column name to be 'Q21' - please check this and run again.",
+    COLNAME_PREFIX_SUPERVISCONTACT:  "Could not read 'Supervisor Spoken To' column!\nExpected column name to be 'Q152' - please check this and run again.",
+    COLNAME_PREFIX_TIER4_VISA:       "Could not read 'On Tier 4 Visa?' column!\nExpected column name to be 'Q153' - please check this and run again.",
+    COLNAME_PREFIX_PROPOSEDDEADLINE: "Could not read 'Proposed New Submission Date' column!\nExpected column name to be 'Q151' - please check this and run again.",
+    COLNAME_PREFIX_DASS_REGISTERED:  "Could not read 'DASS Registered' column!\nExpected column name to be 'Q2' - please check this and run again.",
+    COLNAME_PREFIX_RESPONSEID:       "Could not read 'Response ID' column!\nExpected column name to be 'ResponseId' - please check this and run again."
 }
 
+# The COLNAME_PREFIX_* columns that the request builders read (the supervisor and evidence columns
+# are found through the header instead, see build_header_index())
+REQUEST_COLNAME_PREFIXES: List[str] = [COLNAME_PREFIX_DATESUBMITTED,    COLNAME_PREFIX_STUDENTNAME,      COLNAME_PREFIX_EMAILADDRESS,
+                                       COLNAME_PREFIX_STUDENTID,        COLNAME_PREFIX_ISPOSTGRADORRES,  COLNAME_PREFIX_SUPERVISCONTACT,
+                                       COLNAME_PREFIX_TIER4_VISA,       COLNAME_PREFIX_PROPOSEDDEADLINE, COLNAME_PREFIX_ADVISORNAME,
+                                       COLNAME_PREFIX_MITIGATIONDETAIL, COLNAME_PREFIX_PERIODAFFECTED,   COLNAME_PREFIX_LATEAPPLICATION,
+                                       COLNAME_PREFIX_ASSESSMENTCOUNT,  COLNAME_PREFIX_DASS_REGISTERED]
+
+
+# - - - - - - >
+# Resolve each of the required columns to its position in the export, once, from the column names
+# alone - so that the builders can take each column by position (the first column of that name, as
+# with df['Q1']) rather than looking up its label again for every row. Every missing column is
+# reported at once, in a single ColumnNameError, rather than one per run as they are found.
+
+def resolve_qualtrics_columns(colnames: List[str], required: List[str] = REQUEST_COLNAME_PREFIXES) -> Dict[str, int]:
+    colnames: List[str] = list(colnames)
+    missing:  List[str] = [name for name in required if name not in colnames]
+
+    if missing:
+        check: str = "\n\n".join(COLUMN_KEY_ERROR_MESSAGES[name] for name in missing)
+        if len(missing) > 1:
+            check = f"{len(missing)} columns are missing from the Qualtrics file:\n\n{check}"
+        LOGGER.error(check)
+        raise ColumnNameError(check)
+
+    return {name: colnames.index(name) for name in required}
+
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
 
@@ -224,67 +285,54 @@ class StudentRequest:
 
 
 # - - - - - - >
+# Raised by resolve_qualtrics_columns() when any of the expected COLNAME_PREFIX_* columns are missing
+# from the Qualtrics data. The message is made of the relevant entries from COLUMN_KEY_ERROR_MESSAGES,
+# so it can be shown to the user as-is by whichever front-end (GUI or batch) is running the program.
 
-
-@dataclass
-class Counter:
-    counter: int
-
-    def __init__(self):
-        self.counter = 1
+class ColumnNameError(Exception):
+    pass
 
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
-# Given an column of input cells in a dataframe which contain one or more newline-separated
-# strings, identify the maximum character-width of the column required to accomodate the longest
-# string. Basically - if we were to display all of the strings in each cell on new lines, how
-# wide would the resulting column need to be to ensure that none of the strings are cut off?
-
-def required_column_width(dataframe: DataFrame, column: str) -> int:
-    cell_max: int = 0
-    this_max: str = 0
-    
-    for cell in dataframe[column]:
-        lines: List[str] = cell.split('\n')
-        this_max = max(lines, key = len)
-        if len(this_max) > cell_max:
-            cell_max = len(this_max)
+# Qualtrics exports carry some metadata rows of their own beneath the question-text "header" row -
+# in the current version this is the "ImportId" row (Excel row 3), which has a small JSON string in
+# every column. Any strings which identify such rows are listed here, and any row containing one of
+# them is removed before processing.
+# These rows are always right at the top of the export, so only the first QUALTRICS_JUNK_SCAN_ROWS
+# rows below the header are searched - there is no point scanning thousands of student rows for it.
 
-    print(f"{column} required width = {cell_max} (string: '{this_max}')")
-    return cell_max
+QUALTRICS_JUNK_STRINGS:    List[str] = ["ImportId"]
+QUALTRICS_JUNK_SCAN_ROWS:  int = 5
 
 
-# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
-# Locate the index of a row in a dataframe containing some string.
-# If no row containing the target string can be found, this function returns None.
-# This is checked for in the drop_row() function and the entire row is dropped in place if found.
+# - - - - - - >
+# Locate the indices of any rows near the top of a dataframe which contain one of the strings.
+# The header row itself (row 0) is never matched, as it is needed later on. The search is a single
+# str.contains() over every cell in the scanned rows, rather than a Python loop over each cell.
+# If no rows contain any of the strings, this returns an empty list.
 
-def row_containing(dataframe: DataFrame, string: str) -> int:
-    location: int = None
+def find_junk_rows(dataframe: DataFrame, strings: List[str] = QUALTRICS_JUNK_STRINGS, scan_rows: int = QUALTRICS_JUNK_SCAN_ROWS) -> List[int]:
+    rows: DataFrame = dataframe.iloc[1:1 + scan_rows]
+    if rows.empty or not strings:
+        return []
 
-    for index, row in dataframe.iterrows():
-        values: List[str] = [value for value in row]
-        try:
-            contains: List[bool] = [True for value in values if string in value]
-            if any(contains):
-                location = index
-        except:
-            continue
-    
-    return location
+    pattern: str = "|".join(re.escape(string) for string in strings)
+    cells:   Series = pandas.Series(rows.to_numpy(dtype = object).ravel()).astype(str)
+    found:   Array = cells.str.contains(pattern, na = False).to_numpy().reshape(rows.shape)
+
+    return rows.index[found.any(axis = 1)].tolist()
 
 
 # - - - - - - >
 
 
-def drop_row_by_string(dataframe: DataFrame, string: str) -> DataFrame:
-    index: int = row_containing(dataframe, string)
+def drop_junk_rows(dataframe: DataFrame, strings: List[str] = QUALTRICS_JUNK_STRINGS, scan_rows: int = QUALTRICS_JUNK_SCAN_ROWS) -> DataFrame:
+    indices: List[int] = find_junk_rows(dataframe, strings, scan_rows)
     
-    if not index:
+    if not indices:
         return dataframe
     
-    dataframe.drop(index, inplace = True)
-    return dataframe.reset_index(drop = True)
+    return dataframe.drop(indices).reset_index(drop = True)
 
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
@@ -298,8 +346,13 @@ def max_string_length(strings: List[str]) -> int:
 # - - - - - - >
 
 
-def create_output_filename(directory: str, N_applications: int) -> bool:
+def create_output_filename(directory: str, N_applications: int, layout: str = "students", incremental: bool = False) -> bool:
    filename: str = f"Mitigating Circumstances Tracker - {N_applications} Students - {date_today()}.xlsx"
+   if incremental:
+       # Incremental runs can happen more than once a day, and each one's Tracker needs to be kept
+       filename = f"Mitigating Circumstances Tracker - {N_applications} New Students - {date_today()} {current_time()}.xlsx"
+   if layout == "assessments":
+       filename = filename.replace(".xlsx", " - By Assessment.xlsx")
    return os.path.join(directory, filename)
 
 
@@ -319,24 +372,323 @@ def display_dict(dct: Dict[any, any]):
         print(f"{key} => {dct[key]}")
 
 
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Logging.
+# Everything goes through the standard library "mitcircs" logger, so there is no longer a logfile
+# and counter to pass around every function. Nothing is written to a logfile unless the front-end
+# calls configure_logging() (the GUI checkbox or --log), and the chattier per-column and per-request
+# messages are DEBUG level and guarded with LOGGER.isEnabledFor(), so they cost nothing when off.
+# Records are buffered in a MemoryHandler and handed to the (already open) logfile in batches of
+# LOG_FLUSH_EVERY records, or straight away for anything at LOG_FLUSH_LEVEL or above, rather than
+# opening and closing the file for every line as before.
+
+LOGGER: logging.Logger = logging.getLogger("mitcircs")
+LOGGER.addHandler(logging.NullHandler())
+
+LOG_LEVELS:      List[str] = ["DEBUG", "INFO", "WARNING", "ERROR"]
+LOG_FLUSH_EVERY: int = 500
+LOG_FLUSH_LEVEL: int = logging.ERROR
+
+
+# - - - - - - >
+# Keeps the old "Log <N> > <message>" layout of the text logfile
+
+class LogFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__()
+        self.count: int = 0
+
+    def format(self, record: logging.LogRecord) -> str:
+        self.count = self.count + 1
+        return f"Log {self.count} > {record.getMessage()}"
+
+
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ >
+# One JSON object per line, for feeding the logfile into other tools
+
+class JSONLinesLogFormatter(LogFormatter):
+    def format(self, record: logging.LogRecord) -> str:
+        self.count = self.count + 1
+        return json.dumps({"log": self.count, "time": self.formatTime(record, "%d/%m/%Y %H:%M:%S"),
+                           "level": record.levelname, "function": record.funcName, "message": record.getMessage()})
+
+
+# - - - - - - >
+# Start writing the log to a new, timestamped logfile in the given directory. Returns the path to it.
+
+def configure_logging(directory: str, level: str = "DEBUG", json_lines: bool = False, flush_every: int = LOG_FLUSH_EVERY) -> str:
+    extension: str = "jsonl" if json_lines else "txt"
+    logpath:   str = os.path.join(directory, f"MitCircLog_{current_time()}_{current_date()}.{extension}")
+
+    logfile = logging.FileHandler(logpath, mode = 'w', encoding = "utf-8")
+    logfile.setFormatter(JSONLinesLogFormatter() if json_lines else LogFormatter())
+
+    LOGGER.addHandler(logging.handlers.MemoryHandler(max(1, flush_every), flushLevel = LOG_FLUSH_LEVEL, target = logfile))
+    LOGGER.setLevel(level)
+
+    # Where the log went is a message about the run rather than part of its output, so it is kept off
+    # stdout (which may be piped somewhere)
+    LOGGER.info(f"Logging to '{logpath}'")
+    print(f"Logging to '{logpath}'", file = sys.stderr)
+    return logpath
+
+
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ >
+# Flush anything still buffered, close the logfile and go back to not logging at all. This needs
+# to be called once the run is finished (the GUI can run the program several times over).
+
+def shutdown_logging() -> None:
+    for handler in list(LOGGER.handlers):
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            handler.flush()
+            handler.target.close()
+            handler.close()
+            LOGGER.removeHandler(handler)
+
+    LOGGER.setLevel(logging.NOTSET)
+
+
+# - - - - - - >
+# Worker processes are started with "spawn", so they have none of the logging set up here. While a
+# logfile is open, their records are sent back over a queue and handed to the logfile by a listener
+# in this process - the queue and log level are passed to start_worker_logging() by each worker's
+# initializer. Without a logfile there is nothing to send, and this yields (None, NOTSET).
+
+@contextlib.contextmanager
+def worker_logging():
+    handlers: List[logging.Handler] = [handler for handler in LOGGER.handlers if isinstance(handler, logging.handlers.MemoryHandler)]
+    if not handlers:
+        yield None, logging.NOTSET
+        return
+
+    records  = multiprocessing.get_context("spawn").Queue()
+    listener = logging.handlers.QueueListener(records, *handlers)
+    listener.start()
+    try:
+        yield records, LOGGER.level
+    finally:
+        listener.stop()
+
+
+# ~ ~ ~ >
+
+
+def start_worker_logging(records: any, level: int) -> None:
+    if records is not None:
+        LOGGER.addHandler(logging.handlers.QueueHandler(records))
+        LOGGER.setLevel(level)
+
+
 # - - - - - - >
 
 
-def log_string(logfile: str, string: str, logcount: Counter) -> None:
-    string = f"Log {logcount.counter} > {string}\n"
-    with open(logfile, 'a') as fptr:
-        fptr.write(string)
-    logcount.counter = logcount.counter + 1
+def log_request(request: StudentRequest) -> None:
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(f"Request instance at location: {hex(id(request))}\n{request.to_string()}")
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Progress and cancellation, for front-ends which run the pipeline in the background (the GUI runs
+# it on a worker thread so that its window keeps responding). As with the logger and profiler there
+# is one module-level PROGRESS, which does nothing unless a listener has been set. The listener is
+# called, from whichever thread is running the pipeline, with:
+#    ("stage", name, rows)     as each PROFILER stage starts (rows is None if it is not known yet)
+#    ("rows",  done, total)    every PROGRESS_ROW_INTERVAL rows of the row-by-row loops in a stage
+# Cancelling only sets a flag - the pipeline checks it at the start of every stage and with every
+# "rows" report, and raises PipelineCancelled from there. This goes up through the same error
+# handling as any other failure, so no partial Tracker (or incremental state) is left behind.
+
+PROGRESS_ROW_INTERVAL: int = 250
+
+
+class PipelineCancelled(Exception):
+    pass
+
+
+class ProgressReporter:
+    def __init__(self):
+        self.listener:  any = None
+        self.cancelled: threading.Event = threading.Event()
+
+
+    def reset(self, listener: any = None) -> None:
+        self.listener = listener
+        self.cancelled.clear()
+
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+
+    def check(self) -> None:
+        if self.cancelled.is_set():
+            raise PipelineCancelled("Cancelled by the user")
+
+
+    def stage(self, name: str, rows: int = None) -> None:
+        self.check()
+        if self.listener is not None:
+            self.listener("stage", name, rows)
+
+
+    def rows(self, done: int, total: int) -> None:
+        self.check()
+        if self.listener is not None:
+            self.listener("rows", done, total)
+
+
+PROGRESS: ProgressReporter = ProgressReporter()
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Profiling.
+# Like the logger, there is one module-level PROFILER that every stage of the pipeline reports to,
+# and it does nothing unless the front-end calls configure_profiling() (--profile). Each stage is
+# wrapped in "with PROFILER.stage(name):", which records its wall time and the peak resident memory
+# of the process once it has finished, and the rows per second if the stage says how many rows it
+# handled. Stages with the same name (e.g. one per chunk of a chunked read) are added together.
+# With trace_memory the peak of Python's own allocations (tracemalloc) is recorded for each stage as
+# well, and with cprofile the whole run is also profiled and the statistics dumped next to the report.
+# Stages are never nested, so that one stage's tracemalloc peak is not reset by another inside it.
+# Only the process that calls configure_profiling() is profiled - not its worker processes.
+
+PROFILE_TOP_FUNCTIONS: int = 15
+MEGABYTE:              int = 1024 * 1024
+
+
+class StageProfiler:
+    def __init__(self):
+        self.enabled:  bool = False
+        self.tracing:  bool = False
+        self.profile:  cProfile.Profile = None
+        self.started:  float = None
+        self.stages:   Dict[str, Dict[str, any]] = {}
+
+
+    # Yields a dict in which the stage can set "rows" once it knows how many rows it has handled
+    @contextlib.contextmanager
+    def stage(self, name: str, rows: int = None):
+        record: Dict[str, any] = {"rows": rows}
+        PROGRESS.stage(name, rows)
+        if not self.enabled:
+            yield record
+            return
+
+        if self.tracing:
+            tracemalloc.reset_peak()
+        start: float = time.perf_counter()
+        try:
+            yield record
+        finally:
+            seconds: float = time.perf_counter() - start
+            totals:  Dict[str, any] = self.stages.setdefault(name, {"stage": name, "calls": 0, "seconds": 0.0, "rows": None,
+                                                                    "peak_rss_mb": None, "traced_peak_mb": None})
+            totals["calls"]       = totals["calls"] + 1
+            totals["seconds"]     = totals["seconds"] + seconds
+            totals["peak_rss_mb"] = peak_rss_megabytes()
+            if record["rows"] is not None:
+                totals["rows"] = (totals["rows"] or 0) + record["rows"]
+            if self.tracing:
+                totals["traced_peak_mb"] = max(totals["traced_peak_mb"] or 0.0, tracemalloc.get_traced_memory()[1] / MEGABYTE)
+
+
+    def report(self) -> Dict[str, any]:
+        stages: List[Dict[str, any]] = []
+        for totals in self.stages.values():
+            rate: float = totals["rows"] / totals["seconds"] if totals["rows"] and totals["seconds"] > 0 else None
+            stages.append({**totals, "rows_per_second": rate})
+
+        return {"started":     self.started,
+                "seconds":     time.time() - self.started,
+                "peak_rss_mb": peak_rss_megabytes(),
+                "python":      platform.python_version(),
+                "pandas":      pandas.__version__,
+                "stages":      stages}
+
+
+# ~ ~ ~ >
+# Peak resident memory of this process so far, in MB. The resource module is Unix-only (and gives
+# kilobytes, except on macOS where it gives bytes) - on Windows this needs psutil, if it is installed
+
+def peak_rss_megabytes() -> float:
+    try:
+        import resource
+        peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / MEGABYTE if sys.platform == "darwin" else peak / 1024
+    except ModuleNotFoundError:
+        pass
+
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / MEGABYTE
+    except (ModuleNotFoundError, AttributeError):
+        return None
+
+
+PROFILER: StageProfiler = StageProfiler()
 
 
 # - - - - - - >
+# Start recording stage timings (and, optionally, tracemalloc peaks and a cProfile of the whole run)
+
+
+def configure_profiling(trace_memory: bool = False, cprofile: bool = False) -> None:
+    PROFILER.enabled = True
+    PROFILER.tracing = trace_memory
+    PROFILER.started = time.time()
+    PROFILER.stages  = {}
+
+    if trace_memory:
+        tracemalloc.start()
+    if cprofile:
+        PROFILER.profile = cProfile.Profile()
+        PROFILER.profile.enable()
+
 
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ >
+# Stop profiling, print the summary table and write the report (and the cProfile statistics, if any)
+# into the given directory. Returns the path of the JSON report, or None if profiling was never started.
+
+def finish_profiling(directory: str, label: str = None) -> str:
+    if not PROFILER.enabled:
+        return None
+
+    if PROFILER.profile is not None:
+        PROFILER.profile.disable()
+    if PROFILER.tracing:
+        tracemalloc.stop()
+
+    report:   Dict[str, any] = {"input": label, **PROFILER.report()}
+    basepath: str = os.path.join(directory, f"MitCircs Profile - {date_today()} {current_time()}")
+    with open(f"{basepath}.json", "w", encoding = "utf-8") as handle:
+        json.dump(report, handle, indent = 2)
+
+    print(profile_summary_table(report))
+
+    if PROFILER.profile is not None:
+        PROFILER.profile.dump_stats(f"{basepath}.prof")
+        pstats.Stats(PROFILER.profile).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+        print(f"cProfile statistics written to '{basepath}.prof'")
+
+    print(f"Profile written to '{basepath}.json'")
+    PROFILER.__init__()
+    return f"{basepath}.json"
 
-def log_request(logfile: str, request: StudentRequest, logcount: Counter):
-    request_string: str = f"\nLog {logcount.counter}\nRequest instance at location: {hex(id(request))}\n{request.to_string()}"
 
-    with open(logfile, 'a') as fptr:
-        fptr.write(request_string)
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ >
+
+
+def profile_summary_table(report: Dict[str, any]) -> str:
+    columns: Dict[str, str] = {"stage": "Stage", "calls": "Calls", "seconds": "Seconds", "rows": "Rows",
+                               "rows_per_second": "Rows/sec", "peak_rss_mb": "Peak RSS (MB)", "traced_peak_mb": "Traced peak (MB)"}
+    table:   DataFrame = pandas.DataFrame(report["stages"], columns = list(columns)).rename(columns = columns)
+    table["Rows"] = table["Rows"].map(lambda rows: "" if pandas.isna(rows) else int(rows))
+    if table["Traced peak (MB)"].isna().all():
+        table = table.drop(columns = "Traced peak (MB)")
+
+    peak: str = "n/a" if report["peak_rss_mb"] is None else f"{report['peak_rss_mb']:.1f} MB"
+    return (f"Profile of '{report['input']}' - {report['seconds']:.3f}s in total, peak RSS {peak}\n"
+            + table.to_string(index = False, na_rep = "", float_format = lambda value: f"{value:.3f}"))
 
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
@@ -404,19 +756,6 @@ def create_file(filepath: str):
 # - - - - - - >
 
 
-def create_log_if_requested(directory: str, logging: bool) -> str:
-    if not logging:
-        return None
-    else:
-        logpath: str = os.path.join(directory, f"MitCircLog_{current_time()}_{current_date()}.txt")
-        print(f"Creating file: '{logpath}'...")
-        create_file(logpath)
-        return logpath
-
-
-# - - - - - - >
-
-
 def find_columns(colnames: List[str], pattern: str) -> List[str]:
     pat = re.compile(pattern)
     names: List[str] = [name for name in colnames if pat.match(name)]
@@ -436,20 +775,315 @@ def find_columns(colnames: List[str], pattern: str) -> List[str]:
 # Otherwise, a placeholder is created from the first 9 characters of the input - since it's
 # *possible* that they have provided something sensible here but simply in the wrong format,
 # we want to try and include this information on the output spreadsheet rather than binning it.
+# The accepted formats are listed per faculty in UNIT_CODE_FORMATS, and are all compiled (once)
+# into the one UNIT_CODE_PATTERN - to accept another format, add it to the list. Each format is a
+# regex WITHOUT any capturing groups of its own (and, as it is compiled with re.VERBOSE, with any
+# spaces escaped), and must be followed by something other than a digit (so that e.g. "NURS104555"
+# is not cut short as "NURS10455" by a 5-digit format).
+# NOTE: Until this was compiled with re.VERBOSE, the comments in the old pattern were taken as
+#       part of the pattern itself, so nothing ever matched and every code was a placeholder.
+
+UNIT_CODE_FORMATS: Dict[str, List[str]] = {
+    "Biology, Medicine and Health": [r"[A-Z]{4}[0-9]{5}"],      # e.g. NURS34555, MEDN10101
+    "Any":                          [r"[A-Z]{1,5}[0-9]{2,6}"],  # Between 1 and 5 uppercase letters, then between 2 and 6 digits
+}
+UNIT_CODE_PLACEHOLDER_LENGTH: int = 9
+
+
+def compile_unit_code_pattern(formats: Dict[str, List[str]] = UNIT_CODE_FORMATS) -> re.Pattern:
+    alternatives: List[str] = [f"(?:{form})(?![0-9])" for faculty in formats.values() for form in faculty]
+    return re.compile(r"""
+    ^\s*                 # Ignoring any leading whitespace, the cell starts with
+    (?P<code>{codes})     # one of the accepted formats
+    """.replace("{codes}", "|".join(alternatives)), re.VERBOSE)
+
+
+UNIT_CODE_PATTERN: re.Pattern = compile_unit_code_pattern()
+
 
 def detect_return_unitcode(string: str) -> str:
     string = string.strip()
-    pattern = re.compile(r"""
-    ^[A-Z]{1,5}    # Starts with between 1 and 5 uppercase letters
-    [0-9]{2,6}     # Immediately followed by between 2 and 6 digits
-    """)
+    result = UNIT_CODE_PATTERN.match(string)
 
-    result = re.search(pattern, string)
+    if UNIT_CATALOGUE is not None and not (result and result.group("code") in UNIT_CATALOGUE.known):
+        resolved: str = UNIT_CATALOGUE.resolve(string)
+        if resolved is not None:
+            return resolved
 
     if not result:
-        return f"{string[:9]}"
+        return f"{string[:UNIT_CODE_PLACEHOLDER_LENGTH]}"
     else:
-        return result.group(0)
+        return result.group("code")
+
+
+# ~ ~ ~ >
+# detect_return_unitcode() for a whole column of cells at once. How many of them were not in any of
+# the accepted formats (and so were given the placeholder instead) is logged, to help decide whether
+# UNIT_CODE_FORMATS is missing one. With a unit catalogue, every (distinct) cell whose code is not
+# in the catalogue is looked up in it - what the catalogue resolves replaces whatever was found (see
+# UnitCodeCatalogue.lookup() for how a guess is shown), and only those it cannot resolve and are in
+# no accepted format are given the placeholder.
+
+def extract_unit_codes(cells: Series) -> Series:
+    strings:  Series = cells.astype(str).str.strip()
+    codes:    Series = strings.str.extract(UNIT_CODE_PATTERN, expand = False)
+    fallback: Series = codes.isna()
+
+    if UNIT_CATALOGUE is not None:
+        unknown:  Series = strings.notna() & (fallback | ~codes.isin(UNIT_CATALOGUE.known))
+        # Kept as objects, or a chunk with every code already in the catalogue (nothing to resolve)
+        # gives an empty float Series, which the .str accessor below refuses
+        resolved: Series = strings[unknown].map({string: UNIT_CATALOGUE.resolve(string) for string in strings[unknown].unique()}).astype(object)
+        guessed:  Series = resolved.str.endswith("?)", na = False)
+        LOGGER.info(f"{int(resolved.notna().sum())} of {int(unknown.sum())} unit codes not in the unit catalogue resolved against it "
+                    f"({int(guessed.sum())} of them only as a likely match, shown alongside what the student entered)")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            for string, guess in zip(strings[unknown][guessed], resolved[guessed]):
+                LOGGER.debug(f"Unit code '{string}' -> '{guess}'")
+        codes    = resolved.reindex(codes.index).fillna(codes)
+        fallback = codes.isna()
+
+    if fallback.any():
+        LOGGER.info(f"{int(fallback.sum())} of {len(cells)} unit codes are not in a recognised format - "
+                    f"using the first {UNIT_CODE_PLACEHOLDER_LENGTH} characters instead")
+
+    return codes.where(~fallback, strings.str[:UNIT_CODE_PLACEHOLDER_LENGTH]).astype(object)
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Unit catalogue. Most of the panel's manual cleanup is of unit codes the students have mangled
+# ("nurs 34555", "NRUS34555", or just the assessment's name), so an optional catalogue of the real
+# unit codes (a '.csv' with a UNIT_CATALOGUE_CODE_COLUMN, and optionally any of the
+# UNIT_CATALOGUE_NAME_COLUMNS) can be given to resolve these. A code in one of the accepted formats
+# that is simply not in the catalogue is usually a real unit the catalogue is missing, so it is only
+# ever matched to a catalogue code one typo away: the same letters with one digit added, dropped or
+# changed, or the same digits with one letter added, dropped or changed, or two neighbouring letters
+# swapped ("NRUS34555") - and only if exactly one catalogue code is. Otherwise, a cell is resolved
+# by, in order:
+#   1. An exact lookup of the code at the start of the cell, ignoring case, spaces and punctuation
+#   2. The closest catalogue code to the code-like start of the cell by the trigrams (3-character
+#      substrings) they share - if close enough (UNIT_CATALOGUE_CODE_SIMILARITY) and there is no tie
+#   3. Only if the cell does not start with anything like a code at all, the catalogue name with
+#      most of its trigrams in the cell (UNIT_CATALOGUE_NAME_COVERAGE)
+# Anything but an exact match is a guess, and the panel rules on the unit code, so what the student
+# entered is kept in front of it, e.g. "NURS3455 (catalogue: NURS34555?)".
+# The trigrams are kept in an inverted index (trigram -> catalogue entries containing it), so only
+# entries sharing at least one trigram with the cell are ever scored, and every cell is only
+# resolved once however many students typed it.
+# Like the logger, the catalogue is module-level (UNIT_CATALOGUE, None without one) and set by the
+# front-end - worker processes are handed it when they start, see set_unit_catalogue().
+
+UNIT_CATALOGUE_CODE_COLUMN:     str = "Unit Code"
+UNIT_CATALOGUE_NAME_COLUMNS:    List[str] = ["Unit Title", "Assessment Name"]
+UNIT_CATALOGUE_CODE_SIMILARITY: float = 0.6
+UNIT_CATALOGUE_NAME_COVERAGE:   float = 0.8
+UNIT_CATALOGUE_CODE_PREFIX:     re.Pattern = re.compile(r"^\s*([A-Za-z]{1,5}[\s._-]*[0-9]{2,6})")
+UNIT_CATALOGUE_SEPARATOR:       re.Pattern = re.compile(r":|\s-\s")
+UNIT_CATALOGUE_CODE_LETTERS:    re.Pattern = re.compile(r"^[A-Z]*")
+
+
+def normalise_unit_code(string: str) -> str:
+    return re.sub(r"[^A-Z0-9]", "", string.upper())
+
+
+# ~ ~ ~ >
+# The (normalised) code a cell starts with - letters then digits, however they are spaced out, or
+# failing that everything up to the first ":" or " - "
+
+
+def unit_code_key(string: str) -> str:
+    prefix: re.Match = UNIT_CATALOGUE_CODE_PREFIX.match(string)
+    return normalise_unit_code(prefix.group(1) if prefix else UNIT_CATALOGUE_SEPARATOR.split(string, maxsplit = 1)[0])
+
+
+# ~ ~ ~ >
+
+
+def string_trigrams(string: str) -> set:
+    padded: str = f"  {string} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+# ~ ~ ~ >
+# Whether one string can be turned into the other by adding, dropping or changing a single character
+
+
+def within_one_edit(first: str, second: str) -> bool:
+    if len(first) > len(second):
+        first, second = second, first
+    if len(second) - len(first) > 1:
+        return False
+
+    for index, (one, two) in enumerate(zip(first, second)):
+        if one != two:
+            skip: int = 0 if len(first) == len(second) else -1
+            return first[index + 1 + skip:] == second[index + 1:]
+    return True
+
+
+# ~ ~ ~ >
+# within_one_edit(), or two neighbouring characters swapped round
+
+
+def within_one_typo(first: str, second: str) -> bool:
+    if within_one_edit(first, second):
+        return True
+    if len(first) != len(second):
+        return False
+
+    differences: List[int] = [index for index, (one, two) in enumerate(zip(first, second)) if one != two]
+    return (len(differences) == 2 and differences[1] == differences[0] + 1
+            and first[differences[0]] == second[differences[1]] and first[differences[1]] == second[differences[0]])
+
+
+# ~ ~ ~ >
+# A (normalised) unit code's letters, and everything after them
+
+
+def split_unit_code(key: str) -> Tuple[str, str]:
+    letters: str = UNIT_CATALOGUE_CODE_LETTERS.match(key).group(0)
+    return letters, key[len(letters):]
+
+
+# - - - - - - >
+
+
+class UnitCodeCatalogue:
+    def __init__(self, codes: List[str], names: Dict[str, List[str]] = None):
+        self.codes:    Dict[str, str] = {normalise_unit_code(code): code for code in codes if normalise_unit_code(code)}
+        self.known:    set = set(self.codes.values())
+        self.resolved: Dict[str, str] = {}
+
+        # (trigrams, unit code) for each catalogue code and name, and the inverted index of each
+        self.code_entries: List[Tuple[set, str]] = [(string_trigrams(key), code) for key, code in self.codes.items()]
+        self.name_entries: List[Tuple[set, str]] = [(string_trigrams(name.lower()), code) for code, entries in (names or {}).items()
+                                                    for name in entries if name.strip()]
+        self.code_index:   Dict[str, List[int]] = trigram_index(self.code_entries)
+        self.name_index:   Dict[str, List[int]] = trigram_index(self.name_entries)
+
+        # The catalogue codes by their letters and by their digits, for the near-exact matches of
+        # well-formed codes
+        self.by_letters:   Dict[str, List[str]] = collections.defaultdict(list)
+        self.by_digits:    Dict[str, List[str]] = collections.defaultdict(list)
+        for key in self.codes:
+            letters, digits = split_unit_code(key)
+            self.by_letters[letters].append(key)
+            self.by_digits[digits].append(key)
+
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+    # The catalogue's unit code for a cell (alongside what the cell had, if it is only a guess), or
+    # None if it cannot be resolved
+    def resolve(self, string: str) -> str:
+        if string not in self.resolved:
+            self.resolved[string] = self.lookup(string)
+        return self.resolved[string]
+
+
+    def lookup(self, string: str) -> str:
+        string = string.strip()
+        well_formed: re.Match = UNIT_CODE_PATTERN.match(string)
+        if well_formed:
+            return self.near_exact(well_formed.group("code"))
+
+        key: str = unit_code_key(string)
+        if key in self.codes:
+            return self.codes[key]
+
+        # Dice similarity between the cell's code and a catalogue code...
+        if UNIT_CATALOGUE_CODE_PREFIX.match(string):
+            code: str = closest_trigram_entry(string_trigrams(key), self.code_index, self.code_entries, UNIT_CATALOGUE_CODE_SIMILARITY,
+                                              lambda shared, trigrams, entry: 2 * shared / (len(trigrams) + len(entry)))
+
+        # ...or, with nothing like a code in the cell, how much of a catalogue name is in it
+        else:
+            code: str = closest_trigram_entry(string_trigrams(string.lower()), self.name_index, self.name_entries, UNIT_CATALOGUE_NAME_COVERAGE,
+                                              lambda shared, trigrams, entry: shared / len(entry))
+
+        return None if code is None else f"{string[:UNIT_CODE_PLACEHOLDER_LENGTH]} (catalogue: {code}?)"
+
+
+    # A well-formed code - the catalogue's own, or if it does not have it, the one catalogue code (if
+    # there is exactly one) a single typo away in either its digits or its letters
+    def near_exact(self, code: str) -> str:
+        key: str = normalise_unit_code(code)
+        if key in self.codes:
+            return self.codes[key]
+
+        letters, digits = split_unit_code(key)
+        matches: set = {candidate for candidate in self.by_letters.get(letters, []) if within_one_edit(digits, split_unit_code(candidate)[1])}
+        matches |= {candidate for candidate in self.by_digits.get(digits, []) if within_one_typo(letters, split_unit_code(candidate)[0])}
+
+        if len(matches) != 1:
+            return None
+        return f"{code} (catalogue: {self.codes[matches.pop()]}?)"
+
+
+# ~ ~ ~ >
+
+
+def trigram_index(entries: List[Tuple[set, str]]) -> Dict[str, List[int]]:
+    index: Dict[str, List[int]] = collections.defaultdict(list)
+    for position, (trigrams, _) in enumerate(entries):
+        for trigram in trigrams:
+            index[trigram].append(position)
+    return index
+
+
+# ~ ~ ~ >
+# The unit code of the best-scoring entry sharing any trigrams with the cell - or None if even that
+# scores below the minimum, or it ties with an entry for a different unit code
+
+
+def closest_trigram_entry(trigrams: set, index: Dict[str, List[int]], entries: List[Tuple[set, str]], minimum: float, score) -> str:
+    shared: collections.Counter = collections.Counter(position for trigram in trigrams for position in index.get(trigram, []))
+    ranked: List[Tuple[float, str]] = sorted(((score(count, trigrams, entries[position][0]), entries[position][1])
+                                              for position, count in shared.items()), reverse = True)
+
+    if not ranked or ranked[0][0] < minimum:
+        return None
+    if len(ranked) > 1 and ranked[1][0] == ranked[0][0] and ranked[1][1] != ranked[0][1]:
+        return None
+    return ranked[0][1]
+
+
+# - - - - - - >
+# Read a unit catalogue '.csv'. Raises a ColumnNameError if there is no UNIT_CATALOGUE_CODE_COLUMN.
+
+
+def read_unit_catalogue(filepath: str) -> UnitCodeCatalogue:
+    catalogue: DataFrame = pandas.read_csv(filepath, dtype = str, keep_default_na = False)
+    catalogue.columns = catalogue.columns.str.strip()
+
+    if UNIT_CATALOGUE_CODE_COLUMN not in catalogue.columns:
+        raise ColumnNameError(f"Could not read the '{UNIT_CATALOGUE_CODE_COLUMN}' column of the unit catalogue '{os.path.basename(filepath)}'!\n"
+                              f"Expected a column named '{UNIT_CATALOGUE_CODE_COLUMN}' - please check this and run again.")
+
+    codes: Series = catalogue[UNIT_CATALOGUE_CODE_COLUMN].str.strip()
+    names: Dict[str, List[str]] = collections.defaultdict(list)
+    for colname in [colname for colname in UNIT_CATALOGUE_NAME_COLUMNS if colname in catalogue.columns]:
+        for code, name in zip(codes, catalogue[colname]):
+            # A name without a code would otherwise resolve cells to an empty Unit Code
+            if code:
+                names[code].append(name)
+
+    return UnitCodeCatalogue(codes.tolist(), names)
+
+
+# ~ ~ ~ >
+# Use the given catalogue (or None, for no catalogue) from now on - this is also the initializer for
+# worker processes, which do not share the module-level catalogue of the process that started them
+
+
+def set_unit_catalogue(catalogue: UnitCodeCatalogue) -> None:
+    global UNIT_CATALOGUE
+    UNIT_CATALOGUE = catalogue
+
+
+UNIT_CATALOGUE: UnitCodeCatalogue = None
 
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
@@ -467,7 +1101,7 @@ def detect_return_unitcode(string: str) -> str:
 #    ...      # Do the rest of em
 #    return responses
 
-def unique_response_locations(response_columns: Dict[str, int], response_numbers: int, logging: bool, logfile: str, logcount: Counter) -> Dict[str, List[int]]:
+def unique_response_locations(response_columns: Dict[str, int], response_numbers: int, log: bool = True) -> Dict[str, List[int]]:
     responses: Dict[str, List[int]] = {}
     column_names: List[str] = response_columns.keys()
     for response in response_numbers:
@@ -476,9 +1110,9 @@ def unique_response_locations(response_columns: Dict[str, int], response_numbers
         if indices:
             responses[response] = indices
     
-    if logging:
+    if log and LOGGER.isEnabledFor(logging.DEBUG):
         for resp in responses.keys():
-            log_string(logfile, f"Response: '{resp}'\n  > Indices:  {responses[resp]}", logcount)
+            LOGGER.debug(f"Response: '{resp}'\n  > Indices:  {responses[resp]}")
     
     return responses
 
@@ -490,9 +1124,11 @@ def unique_response_locations(response_columns: Dict[str, int], response_numbers
 # columns that have responses in them and structuring the relevant information.
 # So, these two functions are effectively the heart of identifying and restructuring the relevant
 # information for each assessment that a student selects.
+# With quiet, nothing is logged - for the column profile checks, which only look at the column names
+# of an export before it is read, so that the columns are only logged once, as the requests are built.
 
 
-def locate_response_columns(dataframe: DataFrame, display_index: bool, response_max: int, logging: bool, logfile: str, logcount: Counter) -> Dict[str, List[int]]:
+def locate_response_columns(dataframe: DataFrame, display_index: bool, response_max: int, quiet: bool = False) -> Dict[str, List[int]]:
     # All of the relevant response columns for each assessment start with a number
     # (at the moment the maximum is 30, though I assume this will grow as more
     # assessments are added so I've left some headroom here with range of 1-99).
@@ -506,18 +1142,19 @@ def locate_response_columns(dataframe: DataFrame, display_index: bool, response_
     indices = dataframe.columns.get_indexer(targets)
     columns = {}
 
-    if logging:
-        log_string(logfile, "Locating assessment response columns in dataframe:", logcount)
+    log_columns: bool = not quiet and LOGGER.isEnabledFor(logging.DEBUG)
+    if log_columns:
+        LOGGER.debug("Locating assessment response columns in dataframe:")
 
     for name, index in zip(targets, indices):
         columns[name] = index
 
         if display_index:
             print(f"  > Response Column: {name}   At: {index}")
-        if logging:
-            log_string(logfile, f" Response Column: {name}   At: {index}", logcount)
+        if log_columns:
+            LOGGER.debug(f" Response Column: {name}   At: {index}")
 
-    locations: Dict[str, List[int]] = unique_response_locations(columns, numbers, logging, logfile, logcount)
+    locations: Dict[str, List[int]] = unique_response_locations(columns, numbers, log = not quiet)
 
     return locations
 
@@ -544,11 +1181,12 @@ def delete_top_row(dataframe: DataFrame) -> DataFrame:
 # Note that the additional call to .strip() on fullname is necessary to prevent a leading or trailing space
 # should the student fail to provide a firstname or surname, respectively (again, probs won't happen but still)
 
-def create_student_name(row: DataFrame) -> str:
+def create_student_name(row: DataFrame, position: int = None) -> str:
     fullname: str = ""
+    cell = row[COLNAME_PREFIX_STUDENTNAME] if position is None else row.iloc[position]
 
-    if not pandas.isna(row['Q1']):
-        fullname = str(row['Q1'])
+    if not pandas.isna(cell):
+        fullname = str(cell)
 
     return fullname.strip()
 
@@ -556,8 +1194,8 @@ def create_student_name(row: DataFrame) -> str:
 # - - - - - - >
 
 
-def student_is_DASS(row: DataFrame, return_input_string: str) -> bool | str:
-    cell = row[COLNAME_PREFIX_DASS_REGISTERED]
+def student_is_DASS(row: DataFrame, return_input_string: str, position: int = None) -> bool | str:
+    cell = row[COLNAME_PREFIX_DASS_REGISTERED] if position is None else row.iloc[position]
     if cell == "" or cell == 0 or pandas.isna(cell):
         return False
     else:
@@ -570,34 +1208,55 @@ def student_is_DASS(row: DataFrame, return_input_string: str) -> bool | str:
 # The "header" is the top row (NOT the column names!) of the input Excel sheet. It contains
 # the full string of each question students were asked, and so provides some supplementary
 # information to the responses provided in each column.
-# This is used here to identify both the Programme and Year that the student is on from the
-# assessment(s) that they have applied for. This requires some massaging of the dataframe,
-# and is done by:
-#   1. Pulling all of the strings in the header out into a list
-#   2. Identifying the indices of columns which specify "Programme" in their header
-#   3. Subsetting the row to only those "Programme" columns
-#   4. Removing any cells which are empty / NaN
-#   5. Casting the value to a string and passing this to the "reformat if nan" function,
+# This is used to identify the Programme and Year that the student is on from the assessment(s)
+# that they have applied for, along with their evidence declaration and supervisor name (both of
+# which are in columns whose names clash with others, see COLNAME_PREFIX_SUPERVISORNAME).
+# Rather than re-reading the header for every student, it is scanned once here and the indices
+# of the columns containing each search string are kept in a "header index":
+#    {"Programme": [11, 20, 29, ...], "Year": [12, 21, 30, ...], ...}
+
+HEADER_SEARCH_PROGRAMME:  str = "Programme"
+HEADER_SEARCH_COURSEYEAR: str = "Year"
+HEADER_SEARCH_EVIDENCE:   str = "submitting evidence with your application"
+HEADER_SEARCH_SUPERVISOR: str = "Dissertation supervisor name"
+
+HEADER_SEARCH_STRINGS: List[str] = [HEADER_SEARCH_PROGRAMME, HEADER_SEARCH_COURSEYEAR,
+                                    HEADER_SEARCH_EVIDENCE,  HEADER_SEARCH_SUPERVISOR]
+
+
+def build_header_index(header: DataFrame, searchstrings: List[str] = HEADER_SEARCH_STRINGS) -> Dict[str, List[int]]:
+    strings: List[str] = [str(value) for value in header.iloc[0, :]]
+    index:   Dict[str, List[int]] = {searchstring: [] for searchstring in searchstrings}
+
+    for position, string in enumerate(strings):
+        for searchstring in searchstrings:
+            if searchstring in string:
+                index[searchstring].append(position)
+
+    return index
+
+
+# - - - - - - >
+# Given the indices of the columns for one search string in the header index:
+#   1. Subset the row to only those columns
+#   2. Remove any cells which are empty / NaN
+#   3. Cast the first remaining value to a string and pass this to the "reformat if nan" function,
 #      which will replace this with a more helpful "None Given" string if this is missing
 #      or there is some other issue with it
-#   6. Returning the contents of the first "Programme" column in the row as a string;
-#      given that the columns have been carefully selected and cleaned, this should
-#      contain their programme name
+#   4. Return this as a string; given that the columns have been carefully selected and cleaned,
+#      this should contain (e.g.) their programme name
 # NOTE: In the test Excel sheet, "students" have made applications for multiple assessments,
 #       some of which are on different Programmes. I'm not sure how often this will occur in
 #       reality, but if so this logic will need to be changed
 
-def string_parse_header(row: DataFrame, header: DataFrame, searchstring: str, logging: bool, logfile: str, logcount: Counter) -> str:
-    strings: List[str] = header.iloc[0, :].astype(str).tolist()
-    indices: List[int] = [index for index in range(len(strings)) if searchstring in strings[index]]
+def string_parse_header(row: DataFrame, indices: List[int]) -> str:
     years: DataFrame = row.iloc[indices]
     years = years.dropna(how = "all")
     
     try:
         return string_reformat_nan(str(years.iloc[0]))
     except IndexError as IdxErr:
-        if logging:
-            log_string(logfile, str(IdxErr), logcount)
+        LOGGER.debug(str(IdxErr))
         return "..."
 
 
@@ -642,20 +1301,31 @@ def minimum_responses_provided(cells: Series, minimum: int) -> bool:
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
 
 
-def build_student_requests(qualtrics: DataFrame, display: bool, logging: bool, logfile: str, logcount: Counter) -> List[StudentRequest]:
-    response_min: int = MINIMUM_REQUIRED_RESPONSES
-    requests:  List[StudentRequest] = []
-    header:    DataFrame = extract_top_row(qualtrics)
+def build_student_requests(qualtrics: DataFrame, display: bool) -> List[StudentRequest]:
+    columns:   Dict[str, int] = resolve_qualtrics_columns(qualtrics.columns)
+    header:    Dict[str, List[int]] = build_header_index(extract_top_row(qualtrics))
     qualtrics: DataFrame = delete_top_row(qualtrics)
     Q_cols:    Dict[str, List[int]] = locate_response_columns(qualtrics, display_index = True,
-                                                              response_max = 100,
-                                                              logging = logging, logfile = logfile, logcount = logcount)
+                                                              response_max = 100)
+
+    return build_student_request_rows(qualtrics, header, Q_cols, columns, display)
+
+
+# - - - - - - >
+# The row-by-row loop of build_student_requests(), once the header index, response columns and
+# required columns have been found - the row engine's equivalent of build_request_chunk(), so that
+# a partition of the student rows can be built without finding them all over again.
+
+def build_student_request_rows(qualtrics: DataFrame, header: Dict[str, List[int]], Q_cols: Dict[str, List[int]], columns: Dict[str, int],
+                               display: bool) -> List[StudentRequest]:
+    response_min: int = MINIMUM_REQUIRED_RESPONSES
+    requests:     List[StudentRequest] = []
 
     # Begin looping over each row in the Qualtrics data, with each row containing the submission
     # of one student. First, error-check and read some essential data including Name, ID, Email,
-    # Date of Submission, Affected Dates, Via Type etc... If any of these are missing or their
-    # columns are named incorrectly, then provide a clear error message from the
-    # COLUMN_KEY_ERROR_MESSAGES dict, log it, and exit the program, since these are needed.
+    # Date of Submission, Affected Dates, Via Type etc... These have all been found up-front by
+    # resolve_qualtrics_columns() (which has already stopped the program, with a clear error
+    # message, if any of them are missing or named incorrectly), so they are read by position.
     # Otherwise, pull out all of their Q question response columns. Start by getting the Division
     # from the first of these - since the Division is in all of them (for some reason), we only
     # want to do this on the first iteration. Ensure that a given Q has actually been filled in
@@ -663,35 +1333,30 @@ def build_student_requests(qualtrics: DataFrame, display: bool, logging: bool, l
     # If we are below this required minimum then we can safely say this Q is not one of the ones
     # that has been filled in, so we can continue to the next *_Q
 
-    for _, row in qualtrics.iterrows():
-        try:
-            req: StudentRequest = StudentRequest()
-            req.name            = create_student_name(row)
-            req.ID              = string_reformat_nan(str(row[COLNAME_PREFIX_STUDENTID]).strip())
-            req.email           = string_reformat_nan(str(row[COLNAME_PREFIX_EMAILADDRESS]).strip())
-            req.subdate         = string_reformat_nan(str(row[COLNAME_PREFIX_DATESUBMITTED]).strip())
-            req.programme       = string_parse_header(row, header, "Programme", logging, logfile, logcount)
-            req.courseyear      = string_parse_header(row, header, "Year", logging, logfile, logcount)
-            req.isPGR           = string_reformat_nan(str(row[COLNAME_PREFIX_ISPOSTGRADORRES]).strip())
-            req.NAffected       = string_reformat_nan(str(row[COLNAME_PREFIX_ASSESSMENTCOUNT]).strip())
-            req.circumstances   = string_reformat_nan(str(row[COLNAME_PREFIX_MITIGATIONDETAIL]).strip())
-            req.dates_affected  = string_reformat_nan(str(row[COLNAME_PREFIX_PERIODAFFECTED]).strip())
-            req.DASS            = str(student_is_DASS(row, return_input_string = True))
-            req.semester        = "..."
-            req.advisor         = string_reformat_nan(str(row[COLNAME_PREFIX_ADVISORNAME]).strip())
-            req.latereason      = string_reformat_nan(str(row[COLNAME_PREFIX_LATEAPPLICATION]).strip())
-            req.evidence        = string_parse_header(row, header, "submitting evidence with your application", logging, logfile, logcount)
-            req.superinformed   = string_reformat_nan(str(row[COLNAME_PREFIX_SUPERVISCONTACT]).strip())
-            req.supervisor      = string_parse_header(row, header, "Dissertation supervisor name", logging, logfile, logcount)
-            req.T4Visa          = string_reformat_nan(str(row[COLNAME_PREFIX_TIER4_VISA]).strip())
-            req.proposedDL      = string_reformat_nan(str(row[COLNAME_PREFIX_PROPOSEDDEADLINE]).strip())
-        except KeyError as kerr:
-            check = COLUMN_KEY_ERROR_MESSAGES[str(kerr).replace("'", "")]
-            if logging:
-                log_string(logfile, check, logcount)
-            tk.messagebox.showinfo(title = "Column Name Error...", message = check)
-            destroy_window()
-            exit(1)
+    for number, (_, row) in enumerate(qualtrics.iterrows(), start = 1):
+        if number % PROGRESS_ROW_INTERVAL == 0:
+            PROGRESS.rows(number, len(qualtrics))
+
+        req: StudentRequest = StudentRequest()
+        req.name            = create_student_name(row, columns[COLNAME_PREFIX_STUDENTNAME])
+        req.ID              = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_STUDENTID]]).strip())
+        req.email           = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_EMAILADDRESS]]).strip())
+        req.subdate         = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_DATESUBMITTED]]).strip())
+        req.programme       = string_parse_header(row, header[HEADER_SEARCH_PROGRAMME])
+        req.courseyear      = string_parse_header(row, header[HEADER_SEARCH_COURSEYEAR])
+        req.isPGR           = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_ISPOSTGRADORRES]]).strip())
+        req.NAffected       = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_ASSESSMENTCOUNT]]).strip())
+        req.circumstances   = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_MITIGATIONDETAIL]]).strip())
+        req.dates_affected  = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_PERIODAFFECTED]]).strip())
+        req.DASS            = str(student_is_DASS(row, return_input_string = True, position = columns[COLNAME_PREFIX_DASS_REGISTERED]))
+        req.semester        = "..."
+        req.advisor         = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_ADVISORNAME]]).strip())
+        req.latereason      = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_LATEAPPLICATION]]).strip())
+        req.evidence        = string_parse_header(row, header[HEADER_SEARCH_EVIDENCE])
+        req.superinformed   = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_SUPERVISCONTACT]]).strip())
+        req.supervisor      = string_parse_header(row, header[HEADER_SEARCH_SUPERVISOR])
+        req.T4Visa          = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_TIER4_VISA]]).strip())
+        req.proposedDL      = string_reformat_nan(str(row.iloc[columns[COLNAME_PREFIX_PROPOSEDDEADLINE]]).strip())
 
         # Once we're done with the above, we need to move on to the multiple-choice questions. If the
         # corresponding cell for one of these contains NaN, then the student has not selected it and
@@ -742,8 +1407,7 @@ def build_student_requests(qualtrics: DataFrame, display: bool, logging: bool, l
         # finally add the completed request to the request list.
         if display:
             print(req)
-        if logging:
-            log_request(logfile, req, logcount)
+        log_request(req)
 
         req.division = division
         requests.append(req)
@@ -752,518 +1416,1839 @@ def build_student_requests(qualtrics: DataFrame, display: bool, logging: bool, l
 
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
-# TODO: This entire function could be replaced by:
-#
-# pandas.DataFrame.from_dict(df, orient = "index", columns = colnames)
-#
-# ...Which would also almost certainly be faster and less error-prone
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Column-wise request engine.
+# build_student_requests() above walks the Qualtrics data one student at a time, which is fine for
+# a weekly export but is by far the slowest part of the program on the end-of-semester ones. The
+# functions below do exactly the same cleaning, but a whole column at a time using pandas string
+# operations, and produce a "request frame" - one row per student, one column per StudentRequest
+# attribute (the asm_* columns hold the per-assessment lists). StudentRequest instances can still
+# be produced from this with requests_from_frame() if they are wanted for display or logging.
+# NOTE: The output of this engine must match build_student_requests() exactly - if you change the
+#       cleaning rules in one, change them in the other!
 
-def requests_to_spreadsheet(requests: List[StudentRequest], output: str):
-    # DataFrame will be formed of a Dict[str, List[...]] where the key is the column name
-    # and the List is the contents of the column. Each column is here represented by a list
-    subdates:      List[str] = []
-    names:         List[str] = []
-    emails:        List[str] = []
-    IDs:           List[str] = []
-    PGRs:          List[str] = []
-    N_affected:    List[str] = []
-    divisions:     List[str] = []
-    programmes:    List[str] = []
-    years:         List[str] = []
-    asmcodes:      List[str] = []
-    asmnames:      List[str] = []
-    otherinfo:     List[str] = []
-    isresubs:      List[str] = []
-    resubdates:    List[str] = []
-    substats:      List[str] = []
-    advisors:      List[str] = []
-    circumstances: List[str] = []
-    periods:       List[str] = []
-    latereasons:   List[str] = []
-    isDASS:        List[str] = []
-    evidences:     List[str] = []
-    toldsupervi:   List[str] = []
-    supervisors:   List[str] = []
-    onT4Visas:     List[str] = []
-    proposedDL:    List[str] = []
-    evidencesumm:  List[str] = []
-    outcomes:      List[str] = []
-    emailtypes:    List[str] = []
-    sendbyperson:  List[str] = []
-    notes:         List[str] = []
-    panelnotes:    List[str] = []
-    outcomesent:   List[str] = []
-    outcomedate:   List[str] = []
-
-    # Loop over the Student Requests and build the column lists. The columns related to
-    # outcomes or other data filled in during the review process are indicated by "Pending"
-    # or ellipsis
-    for req in requests:
-        subdates.append(req.subdate)
-        names.append(req.name)
-        emails.append(req.email)
-        IDs.append(req.ID)
-        PGRs.append(req.isPGR)
-        N_affected.append(req.NAffected)
-        divisions.append(req.division)
-        programmes.append(req.programme)
-        years.append(req.courseyear)
-        advisors.append(req.advisor)
-        circumstances.append(req.circumstances)
-        periods.append(req.dates_affected)
-        latereasons.append(req.latereason)
-        isDASS.append(req.DASS)
-        evidences.append(req.evidence)
-        toldsupervi.append(req.superinformed)
-        supervisors.append(req.supervisor)
-        onT4Visas.append(req.T4Visa)
-        proposedDL.append(req.proposedDL)
-        evidencesumm.append(req.evidencesummary)
-        outcomes.append("Pending Outcome...")
-        emailtypes.append("...")
-        sendbyperson.append("Pending Outcome...")
-        notes.append("...")
-        panelnotes.append("...")
-        outcomesent.append("Pending Send...")
-        outcomedate.append("Pending Send...")
-
-        # The assessment Names and Codes applied for are to be presented in the same cell, but
-        # on separate lines. This is achieved here by joining the lists of assessments together
-        # with newlines
-        code_string:      str = "\n".join(req.asm_codes)
-        name_string:      str = "\n".join(req.asm_names)
-        other_string:     str = "\n".join(req.other_asm)
-        isresub_string:   str = "\n".join(req.asm_is_resub)
-        resubdate_string: str = "\n".join(req.asm_resubdate)
-        status_string:    str = "\n".join(req.asm_resubstatus)
-        
-        asmcodes.append(code_string)
-        asmnames.append(name_string)
-        otherinfo.append(other_string)
-        isresubs.append(isresub_string)
-        resubdates.append(resubdate_string)
-        substats.append(status_string)
-
-    # Column dictionary as explained above
-    columns: Dict[str, any] = {'Date Submitted': subdates, 'Full Name': names, 'University Email': emails, 'Student ID Number': IDs,
-                               'Are you applying for a postgraduate dissertation or research project?': PGRs, 'No. Assessments/Exams': N_affected,
-                               'Division': divisions, 'Programme': programmes, 'Year': years, 'Unit Code': asmcodes,
-                               'Assessment name and submission date': asmnames, 'Is this a resubmission (including date)?': isresubs,
-                               'Other Assessment Info.': otherinfo,
-                               'Submission Status': substats, 'Academic Advisor(s)': advisors, 'Reason for Mitigation': circumstances, 'Period Affected': periods,
-                               'Late Application - Reason': latereasons, 'DASS Registration': isDASS, 'Evidence Declaration': evidences,
-                               'Supervisor Aware?': toldsupervi, 'Supervisor Name': supervisors, 'Tier 4 Visa': onT4Visas, 'Proposed New Deadline': proposedDL,
-                               'Evidence Summary': evidencesumm, 'Outcome': outcomes, 'Email Type': emailtypes, 'To Be Sent By (Initials)...': sendbyperson,
-                               'Notes': notes, 'Panel Notes': panelnotes, 'Outcome Sent to Student': outcomesent, 'Outcome Sent Date': outcomedate}
-
-    # Create the dataframe from the column dictionary, including the number of unique students
-    # making requests in the Excel spreadsheet sheet name
-    dataframe: DataFrame = pandas.DataFrame(columns)
-    sheetname: str = f"Mitigating Circumstances ({len(requests)})"
-
-    # Using the .set_column() method of the ExcelWriter, it is possible to change the formatting and size of 
-    # columns in the output spreadsheet.
-    # All of the column widths need to be changed to some degree to tidy the spreadsheet and ensure that the
-    # unique Assessment Names and Codes appear on separate lines correctly, as explained above - specifically,
-    # these are the columns that will need to be resized manually, so the column names are listed here to
-    # check against while writing to the spreadsheet.
-    # manual_resize_fudge is simply how many additional pixels these columns should be widened by to ensure
-    # that this isn't too tight
-    manual_resize_fudge: int = 10
-    cols_to_manually_resize: List[str] = ["Unit Code",
-                                          "Assessment name and submission date",
-                                          "Is this a resubmission (including date)?",
-                                          "Submission Status"]
-    
-    print(dataframe)
+REQUEST_ENGINES: List[str] = ["columns", "rows"]
 
-    # The xlsxwriter library is frequently missing, for some reason - check to see if it is available
-    # here, and download with Pip if it is not found (this will only happen the first time that the program runs)
-    # Bit of a sledgehammer solution, but it gets the job done for now
-    # TODO: Is there a less shit way of doing this?
-    try:
-        from xlsxwriter import Workbook
-    except ModuleNotFoundError as mnfe:
-        os.system("python -m pip install xlsxwriter")
+ASSESSMENT_FIELDS: List[str] = ["asm_codes", "asm_names", "other_asm", "asm_is_resub", "asm_resubdate", "asm_resubstatus"]
 
-    with pandas.ExcelWriter(output, engine = 'xlsxwriter') as xlwriter:
-        # Write the dataframe to the output spreadsheet, and get an instance of
-        # the WorkBook so that we can begin reformatting the spreadsheet as needed
-        dataframe.to_excel(xlwriter, sheet_name = sheetname, index = False)
-        workbook = xlwriter.book
-
-        # To ensure that the newlines ("\n") function correctly, text wrapping needs to be
-        # enabled for the manually-resized Assessment Name / Code / Status columns
-        cellformat = workbook.add_format({'text_wrap': True})
-
-        for colname in dataframe:
-            column_index = dataframe.columns.get_loc(colname)
-
-            # If this is one of those columns, then find the length of the longest line that the
-            # cell will need to accomodate using required_column_width(), and add on the extra
-            # fudge space - then use set_column() to resize this column and enable text wrapping
-            if colname in cols_to_manually_resize:
-                column_width = required_column_width(dataframe, colname) + manual_resize_fudge
-                xlwriter.sheets[sheetname].set_column(column_index, column_index, column_width, cell_format = cellformat)
-
-            # Otherwise we don't need to care about the within-cell newlines and can do this
-            # automagically - simply find the longest string in any cell of this column and set
-            # the width to that (or, if the *name* of the column is longer, simply use that
-            # instead) - note again that these columns don't need to care about newlines within
-            # cells and so I do not enable text wrapping for these
-            else:
-                column_width = max(dataframe[colname].astype(str).map(len).max(), len(colname))
-                xlwriter.sheets[sheetname].set_column(column_index, column_index, column_width)
 
-    print("    ...Done!")
+# - - - - - - >
+# Column-wise equivalent of string_reformat_nan(str(cell).strip()) - missing cells become "nan"
+# (which is exactly what str() would have made of them), and anything empty or "nan" once
+# stripped is replaced with the helpful empty_string
 
+def column_reformat_nan(column: Series, empty_string: str = "None given", strip: bool = True) -> Series:
+    strings: Series = column.astype(object).where(column.notna(), "nan").astype(str)
+    if strip:
+        strings = strings.str.strip()
 
-# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
-# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+    missing: Series = strings.eq("") | strings.str.lower().eq("nan")
+    return strings.mask(missing, empty_string)
 
 
-def run_startup_checks(qualtrics: str, output: str, logging: bool, verbose: bool) -> None:
-    startup_error: bool = False
-    info_message: str = date_today()
+# - - - - - - >
+# Column-wise equivalent of the "not cell or pandas.isna(cell)" style checks used by
+# string_parse_division() and student_is_DASS(), i.e. which cells are empty, zero or missing
 
-    # Firstly, check whether the user selected an output directory. If not, prompt them
-    # again to select one. If, for whatever reason, they select 'No' here, then close down
-    # the window and exit the program. Return 0 as this is not technically an error.
-    if not output:
-        result = tk.messagebox.askquestion("Select Directory", "No Output folder was selected!\nSelect one now?", icon = "warning")
-        if result == "yes":
-            select_output_folder_window()
-            output = output_directory_entry.get()
-        else:
-            destroy_window()
-            exit(0)
-
-    # As with the Output directory above, we also prompt the user to select a Qualtrics file
-    # if they have not done this already, and exit the program if they choose not to do so.
-    if not qualtrics:
-        result = tk.messagebox.askquestion("Select Spreadsheet", "No Qualtrics Spreadsheet was selected!\nSelect one now?", icon = "warning")
-        if result == "yes":
-            select_spreadsheet_file_window()
-            qualtrics = input_requests_entry.get()
-        else:
-            destroy_window()
-            exit(0)
-    
-    # Second, ensure that the input Qualtrics file is actually of the expected type (an Excel .xlsx file, or 
-    # a Comma-Separated .csv file), and then ensure that the path actually points to a file that exists.
-    # Show a helpful error window and exit the program if any of these checks fail.
-    try:
-        _, extension = os.path.splitext(qualtrics)
+def column_is_blank(column: Series) -> Series:
+    values: Series = column.astype(object)
+    return values.isna() | values.eq("") | values.eq(0)
 
-        if not extension in [".xlsx", ".csv"]:
-            filetype_error_message: str = f"File '{os.path.basename(qualtrics)}' is not of the required type!\nCompatible files are '.xlsx' or '.csv'"
-            tk.messagebox.showinfo(title = "Error!", message = filetype_error_message)
-            startup_error = True
 
-    except Exception as expt:
-        print(f"Filepath error!\n  > Exception: '{expt}'")
-        file_error_message: str = f"Path to file '{os.path.basename(qualtrics)}' is malformed!\nCheck the filepath and retry."
-        tk.messagebox.showinfo(title = "Error!", message = file_error_message)
-        startup_error = True
+# - - - - - - >
+# Return one of the COLNAME_PREFIX_* columns of the dataframe, by its position (see resolve_qualtrics_columns())
 
-    if object_exists(qualtrics, suppress = True):
-        info_message = info_message + f"\nQualtrics file '{os.path.basename(qualtrics)}': Found"
-    else:
-        info_message = info_message + f"\nQualtrics file '{os.path.basename(qualtrics)}' missing! Check path and retry..."
-        startup_error = True
-
-    # Finally, check if the selected Output directory currently exists. If it does
-    # not, then display a message box asking the user if they would like it to be
-    # created. If, for some reason, they select 'no', then this is considered a
-    # startup error which will cause the program to be shut down
-    if object_exists(output, suppress = True):
-        info_message = info_message + f"\nOutput directory '{output}': Found"
-    else:
-        info_message = info_message + f"\nNew Output directory '{output}' was created."
-        result = tk.messagebox.askquestion("Create Directory", "Create New Output Directory?", icon = "warning")
-        if result == 'yes':
-            print("New folder on the way!")
-            os.mkdir(output)
-        else:
-            print("No new folder will be created.\nExiting...")
-            startup_error = True
-            
-    # Once complete, check if we hit any major points of failure and exit if the program
-    # now if so. Otherwise, display the accrued startup information message to the user.            
-    if startup_error:
-        destroy_window()
-        exit(1)
-    else:
-        showinfo("Startup Information...", message = info_message)
+def resolved_column(dataframe: DataFrame, columns: Dict[str, int], name: str) -> Series:
+    return dataframe.iloc[:, columns[name]]
 
 
 # - - - - - - >
+# Column-wise version of string_parse_header(): for every student, take the first non-empty cell
+# out of all of the columns whose header contains the search string - in effect
+# qualtrics.iloc[:, indices].bfill(axis = 1).iloc[:, 0], done directly on the underlying array
+# as one argmax over the "is present" mask. Students with nothing in any of those columns get
+# the same "..." placeholder as before
 
+def column_first_valid(qualtrics: DataFrame, indices: List[int]) -> Series:
+    if not indices:
+        return pandas.Series([None] * len(qualtrics), index = qualtrics.index, dtype = object)
 
-def main() -> None:
-    # Run some basic startup checks and display results to the user in an information window
-    # Ensure that the input Qualtrics file exists, that the output folder exists / can be
-    # created, and whether the user has selected logging and / or verbose running.
-    # Check if the user has requested logging of information as the program runs, and create
-    # this log.txt file (if it does not already exist for some reason)
-    run_startup_checks(input_requests_entry.get(), output_directory_entry.get(), write_logfile_flag.get(), display_running_information.get())
-    logfile: str = create_log_if_requested(output_directory_entry.get(), write_logfile_flag.get())
-    logging: bool = write_logfile_flag.get()
-    logcount: Counter = Counter()
-    _, extension = os.path.splitext(input_requests_entry.get())
+    cells:   Array = qualtrics.iloc[:, indices].to_numpy(dtype = object)
+    present: Array = qualtrics.iloc[:, indices].notna().to_numpy()
+    first:   Array = cells[numpy.arange(len(cells)), present.argmax(axis = 1)]
 
-    if logging:
-        log_string(logfile, f"Starting up: [{current_datetime()}]", logcount)
+    return pandas.Series(first, index = qualtrics.index, dtype = object).where(present.any(axis = 1))
 
-    # The Uni-controlled laptops do not have Openpyxl installed, but Pandas seems to require
-    # this in order to *read* files - so, we need to ensure this is available here and install
-    # it using the command-line if it is missing
-    try:
-        import openpyxl
-    except ModuleNotFoundError as mnfe:
-        command: str = "python -m pip install openpyxl"
-        if logging:
-            log_string(logfile, f"openpyxl dependency missing. Installing using command '{command}'", logcount)
-        os.system(command)
 
-    # Read the raw data from the Qualtrics output into a DataFrame. 
-    # Data can be read from either a .csv or a .xlsx file.
-    # If the file is a .xlsx, then the sheet containing this should have a pre-specified name ("Sheet0").
-    # If this is not present in the Excel file then assume it is contained in the first sheet
-    try:
-        if "csv" in extension:
-            qualtrics: DataFrame = pandas.read_csv(input_requests_entry.get())
-        else:
-            qualtrics: DataFrame = pandas.read_excel(input_requests_entry.get(), sheet_name = "Sheet0")
-    except ValueError as verr:
-        if logging:
-            log_string(logfile, f"{verr}: Sheet name 'Sheet0' not in spreadsheet - using sheet index = 0 instead.", logcount)
-        qualtrics: DataFrame = pandas.read_excel(input_requests_entry.get(), sheet_name = 0)
-    
+def column_parse_header(qualtrics: DataFrame, indices: List[int]) -> Series:
+    found: Series = column_first_valid(qualtrics, indices)
+    return column_reformat_nan(found, strip = False).where(found.notna(), "...")
 
-    # The new version of the Qualtrics output appears to contain some Qualtrics-specific junk in
-    # Excel row 3 - regardless of whether the user has asked for this to be cleaned, we need to
-    # check for it and ensure it is removed otherwise it will produce mess in the output
-    qualtrics = drop_row_by_string(qualtrics, "ImportId")
 
+# - - - - - - >
+# Resolve every header-searched field for all of the students at once, keyed by search string
 
-    # Parse the raw Qualtrics output data into a list of StudentRequest instances, a class which
-    # contains all of the information on a given students' application (Name, ID, Year and Programme,
-    # Assessments applied for, Unit Codes, Circumstances leading to their application, etc.)
-    requests:  List[StudentRequest] = build_student_requests(qualtrics, display_running_information.get(), logging, logfile, logcount)
+def resolve_header_columns(qualtrics: DataFrame, header: Dict[str, List[int]]) -> Dict[str, Series]:
+    return {searchstring: column_parse_header(qualtrics, indices) for searchstring, indices in header.items()}
 
 
-    # Write the parsed Student Requests out to a spreadsheet, formatted following the "Tracker"
-    output_filename: str = create_output_filename(output_directory_entry.get(), len(requests))
-    
-    print(f"Emitting to: {os.path.basename(output_filename)}")
-    
-    requests_to_spreadsheet(requests, output_filename)
+# - - - - - - >
+# Gather every response group (1_*, 2_*, ...) into one (students x groups x fields) array, so that
+# all of the assessments for all of the students can be checked against MINIMUM_REQUIRED_RESPONSES
+# in a single count of the filled-in cells rather than one group (or one student) at a time.
+# Groups with fewer than the usual 9 columns are padded with empty cells, which count as omitted.
+# Returns the array of cell values, the matching "is filled in" mask, and the width of each group.
+
+def reshape_response_blocks(qualtrics: DataFrame, Q_cols: Dict[str, List[int]]) -> Tuple[Array, Array, Array]:
+    groups: List[List[int]] = list(Q_cols.values())
+    widths: Array = numpy.array([len(group) for group in groups], dtype = int)
+    used:   List[int] = sorted(set(index for group in groups for index in group))
+
+    # Only the response columns are copied out of the dataframe, with one extra all-empty
+    # column on the end for the padding to point at
+    cells:   Array = numpy.full((len(qualtrics), len(used) + 1), numpy.nan, dtype = object)
+    present: Array = numpy.zeros((len(qualtrics), len(used) + 1), dtype = bool)
+    cells[:, :-1]   = qualtrics.iloc[:, used].to_numpy(dtype = object)
+    present[:, :-1] = qualtrics.iloc[:, used].notna().to_numpy()
+
+    lookup:    Dict[int, int] = {index: position for position, index in enumerate(used)}
+    positions: Array = numpy.full((len(groups), int(widths.max())), len(used), dtype = int)
+    for order, group in enumerate(groups):
+        positions[order, :len(group)] = [lookup[index] for index in group]
+
+    return cells[:, positions], present[:, positions], widths
+
+
+# - - - - - - >
+# Pull out every assessment that has been filled in. The result is a "long" dataframe with one row
+# per assessment, in the same order that build_student_requests() would have appended them: by
+# student, then by response group. 'position' is the (0-based) row of the student in the qualtrics
+# dataframe and 'order' is the index of the response group in Q_cols.
+
+def extract_assessments(qualtrics: DataFrame, Q_cols: Dict[str, List[int]], response_min: int) -> DataFrame:
+    if not Q_cols or len(qualtrics) == 0:
+        return pandas.DataFrame(columns = ["position", "order", "division"] + ASSESSMENT_FIELDS)
+
+    values, present, widths = reshape_response_blocks(qualtrics, Q_cols)
+
+    for width in sorted(set(widths[widths < response_min].tolist())):
+        print(f"! Warning !   Length of Series ({width}) is less than the required minimum responses ({response_min})!")
+        print("    > How have you managed that?")
+
+    # numpy.nonzero() walks the (students x groups) mask in row-major order, so the assessments
+    # come out sorted by student and then by response group without any further sorting
+    provided: Array = present.sum(axis = 2) >= numpy.minimum(widths, response_min)
+    students, groups = numpy.nonzero(provided)
+    cells: DataFrame = pandas.DataFrame(values[students, groups])
+
+    unitassessment: Series = cells.iloc[:, RESPONSE_COLUMN_INDICES[COLNAME_SUFFIX_UNITASSESSMENT]]
+    division:       Series = cells.iloc[:, 0]
+
+    return pandas.DataFrame({
+        "position":        students,
+        "order":           groups,
+        "division":        division.astype(str).mask(column_is_blank(division), "None provided"),
+        "asm_codes":       extract_unit_codes(unitassessment.where(unitassessment.notna(), "nan")),
+        "asm_names":       column_reformat_nan(unitassessment, strip = False),
+        "other_asm":       column_reformat_nan(cells.iloc[:, RESPONSE_COLUMN_INDICES[COLNAME_SUFFIX_OTHERINFORMATION]], empty_string = "-", strip = False),
+        "asm_is_resub":    column_reformat_nan(cells.iloc[:, RESPONSE_COLUMN_INDICES[COLNAME_SUFFIX_RESUBMISSION]], strip = False),
+        "asm_resubdate":   column_reformat_nan(cells.iloc[:, RESPONSE_COLUMN_INDICES[COLNAME_SUFFIX_RESUB_FIRST]], strip = False),
+        "asm_resubstatus": column_reformat_nan(cells.iloc[:, RESPONSE_COLUMN_INDICES[COLNAME_SUFFIX_SUBSTATUS]], strip = False),
+    })
+
+
+# - - - - - - >
+# Gather one column of the long assessment dataframe back up into one value per student (of the
+# N_students in the qualtrics dataframe) - either the list of all of their entries, or just the
+# first of them (or "" if they have not filled in any assessment)
+
+def group_assessments(assessments: DataFrame, field: str, N_students: int, first_only: bool = False) -> List[any]:
+    positions: Array = assessments["position"].to_numpy(dtype = int)
+    students:  Array = numpy.arange(N_students)
+    starts:    List[int] = numpy.searchsorted(positions, students, side = "left").tolist()
+    ends:      List[int] = numpy.searchsorted(positions, students, side = "right").tolist()
+    values:    List[str] = assessments[field].tolist()
+
+    if first_only:
+        return [values[start] if start < end else "" for start, end in zip(starts, ends)]
+    return [values[start:end] for start, end in zip(starts, ends)]
+
+
+# - - - - - - >
+
+
+REQUEST_CHUNK_ROWS: int = 10000
+
+
+def build_request_frame(qualtrics: DataFrame, display: bool) -> DataFrame:
+    with PROFILER.stage("locate response columns"):
+        columns:   Dict[str, int] = resolve_qualtrics_columns(qualtrics.columns)
+        header:    Dict[str, List[int]] = build_header_index(extract_top_row(qualtrics))
+        qualtrics: DataFrame = delete_top_row(qualtrics)
+        Q_cols:    Dict[str, List[int]] = locate_response_columns(qualtrics, display_index = True,
+                                                                  response_max = 100)
+
+    # The rows are built REQUEST_CHUNK_ROWS at a time, which costs next to nothing on top of building
+    # them all at once, so that the progress (and a cancel) can be reported part-way through
+    with PROFILER.stage("build requests", len(qualtrics)):
+        frames: List[DataFrame] = []
+        for start in range(0, max(len(qualtrics), 1), REQUEST_CHUNK_ROWS):
+            frames.append(build_request_chunk(qualtrics.iloc[start:start + REQUEST_CHUNK_ROWS], header, Q_cols, columns, display))
+            PROGRESS.rows(min(start + REQUEST_CHUNK_ROWS, len(qualtrics)), len(qualtrics))
+        return frames[0] if len(frames) == 1 else pandas.concat(frames, ignore_index = True)
+
+
+# - - - - - - >
+# The part of build_request_frame() that works on the student rows alone, once the header index,
+# response columns and required columns have been found. This is what lets a large export be
+# processed a chunk of rows at a time - every chunk has the same columns, so the header, Q_cols
+# and columns only need to be found once.
+
+def build_request_chunk(qualtrics: DataFrame, header: Dict[str, List[int]], Q_cols: Dict[str, List[int]], columns: Dict[str, int],
+                        display: bool) -> DataFrame:
+    response_min: int = MINIMUM_REQUIRED_RESPONSES
+    qualtrics: DataFrame = qualtrics.reset_index(drop = True)
+    header_columns: Dict[str, Series] = resolve_header_columns(qualtrics, header)
+
+    studentname: Series = resolved_column(qualtrics, columns, COLNAME_PREFIX_STUDENTNAME)
+    DASS:        Series = resolved_column(qualtrics, columns, COLNAME_PREFIX_DASS_REGISTERED)
+    frame: DataFrame = pandas.DataFrame({
+        "name":            studentname.astype(object).astype(str).str.strip().where(studentname.notna(), ""),
+        "ID":              column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_STUDENTID)),
+        "email":           column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_EMAILADDRESS)),
+        "subdate":         column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_DATESUBMITTED)),
+        "programme":       header_columns[HEADER_SEARCH_PROGRAMME],
+        "courseyear":      header_columns[HEADER_SEARCH_COURSEYEAR],
+        "division":        "",
+        "isPGR":           column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_ISPOSTGRADORRES)),
+        "NAffected":       column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_ASSESSMENTCOUNT)),
+        "circumstances":   column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_MITIGATIONDETAIL)),
+        "dates_affected":  column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_PERIODAFFECTED)),
+        "DASS":            DASS.astype(object).astype(str).mask(column_is_blank(DASS), "False"),
+        "semester":        "...",
+        "advisor":         column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_ADVISORNAME)),
+        "latereason":      column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_LATEAPPLICATION)),
+        "evidence":        header_columns[HEADER_SEARCH_EVIDENCE],
+        "evidencesummary": "",
+        "superinformed":   column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_SUPERVISCONTACT)),
+        "supervisor":      header_columns[HEADER_SEARCH_SUPERVISOR],
+        "T4Visa":          column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_TIER4_VISA)),
+        "proposedDL":      column_reformat_nan(resolved_column(qualtrics, columns, COLNAME_PREFIX_PROPOSEDDEADLINE)),
+    })
+
+    # The Division is taken from the first assessment each student has filled in, and each of the
+    # per-assessment columns is gathered back up into one list per student. Since the assessments
+    # are already sorted by student, each student's assessments are one contiguous slice of the
+    # long dataframe, so a pair of searchsorted() calls does the job of a groupby(...).agg(list)
+    assessments: DataFrame = extract_assessments(qualtrics, Q_cols, response_min)
+    frame["division"] = group_assessments(assessments, "division", len(frame), first_only = True)
+    for field in ASSESSMENT_FIELDS:
+        frame[field] = group_assessments(assessments, field, len(frame))
+
+    if display or LOGGER.isEnabledFor(logging.DEBUG):
+        for req in requests_from_frame(frame):
+            if display:
+                print(req)
+            log_request(req)
+
+    return frame
+
+
+# - - - - - - >
+# StudentRequest "view" of a request frame, one instance per row
+
+def requests_from_frame(frame: DataFrame) -> List[StudentRequest]:
+    requests: List[StudentRequest] = []
+
+    for record in frame.to_dict("records"):
+        req: StudentRequest = StudentRequest()
+        req.__dict__.update(record)
+        requests.append(req)
+
+    return requests
 
-    if logging:
-        log_string(logfile, f"Closing down: [{current_datetime()}]", logcount)
-    
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# The layout of the Tracker spreadsheet, in column order. Each output column is filled from a source:
+#   TRACKER_FIELD    - copied straight from the named StudentRequest attribute
+#   TRACKER_JOINED   - the named list attribute (one entry per assessment), joined with newlines
+#                      so that the entries appear on separate lines within the same cell
+#   TRACKER_CONSTANT - the given placeholder, for the columns filled in during the review process
+#                      ("Pending" or ellipsis). These are broadcast rather than built row by row.
+# Both request engines build their Tracker from this, as should any other output format.
+
+TRACKER_FIELD:    str = "field"
+TRACKER_JOINED:   str = "joined"
+TRACKER_CONSTANT: str = "constant"
+
+TRACKER_SCHEMA: List[Tuple[str, str, str]] = [
+    ('Date Submitted',                                                        TRACKER_FIELD,    "subdate"),
+    ('Full Name',                                                             TRACKER_FIELD,    "name"),
+    ('University Email',                                                      TRACKER_FIELD,    "email"),
+    ('Student ID Number',                                                     TRACKER_FIELD,    "ID"),
+    ('Are you applying for a postgraduate dissertation or research project?', TRACKER_FIELD,    "isPGR"),
+    ('No. Assessments/Exams',                                                 TRACKER_FIELD,    "NAffected"),
+    ('Division',                                                              TRACKER_FIELD,    "division"),
+    ('Programme',                                                             TRACKER_FIELD,    "programme"),
+    ('Year',                                                                  TRACKER_FIELD,    "courseyear"),
+    ('Unit Code',                                                             TRACKER_JOINED,   "asm_codes"),
+    ('Assessment name and submission date',                                   TRACKER_JOINED,   "asm_names"),
+    ('Is this a resubmission (including date)?',                              TRACKER_JOINED,   "asm_is_resub"),
+    ('Other Assessment Info.',                                                TRACKER_JOINED,   "other_asm"),
+    ('Submission Status',                                                     TRACKER_JOINED,   "asm_resubstatus"),
+    ('Academic Advisor(s)',                                                   TRACKER_FIELD,    "advisor"),
+    ('Reason for Mitigation',                                                 TRACKER_FIELD,    "circumstances"),
+    ('Period Affected',                                                       TRACKER_FIELD,    "dates_affected"),
+    ('Late Application - Reason',                                             TRACKER_FIELD,    "latereason"),
+    ('DASS Registration',                                                     TRACKER_FIELD,    "DASS"),
+    ('Evidence Declaration',                                                  TRACKER_FIELD,    "evidence"),
+    ('Supervisor Aware?',                                                     TRACKER_FIELD,    "superinformed"),
+    ('Supervisor Name',                                                       TRACKER_FIELD,    "supervisor"),
+    ('Tier 4 Visa',                                                           TRACKER_FIELD,    "T4Visa"),
+    ('Proposed New Deadline',                                                 TRACKER_FIELD,    "proposedDL"),
+    ('Evidence Summary',                                                      TRACKER_FIELD,    "evidencesummary"),
+    ('Outcome',                                                               TRACKER_CONSTANT, "Pending Outcome..."),
+    ('Email Type',                                                            TRACKER_CONSTANT, "..."),
+    ('To Be Sent By (Initials)...',                                           TRACKER_CONSTANT, "Pending Outcome..."),
+    ('Notes',                                                                 TRACKER_CONSTANT, "..."),
+    ('Panel Notes',                                                           TRACKER_CONSTANT, "..."),
+    ('Outcome Sent to Student',                                               TRACKER_CONSTANT, "Pending Send..."),
+    ('Outcome Sent Date',                                                     TRACKER_CONSTANT, "Pending Send..."),
+]
+
+TRACKER_COLUMNS: List[str] = [column for column, _, _ in TRACKER_SCHEMA]
+
+
+# - - - - - - >
+# Request frame (one column per StudentRequest attribute) -> Tracker dataframe, a column at a time
+
+def build_tracker_frame(frame: DataFrame, schema: List[Tuple[str, str, str]] = TRACKER_SCHEMA) -> DataFrame:
+    columns: Dict[str, any] = {}
+
+    for column, source, value in schema:
+        if source == TRACKER_FIELD:
+            columns[column] = frame[value]
+        elif source == TRACKER_JOINED:
+            columns[column] = frame[value].map("\n".join)
+        elif source == TRACKER_CONSTANT:
+            columns[column] = value
+        else:
+            raise ValueError(f"Unknown source '{source}' for Tracker column '{column}'")
+
+    return pandas.DataFrame(columns, index = frame.index)
+
+
+# - - - - - - >
+# The reverse of requests_from_frame(), so that the StudentRequests built by the row-by-row engine
+# can go through the same Tracker builder as the column-wise engine's request frame
+
+def requests_to_frame(requests: List[StudentRequest]) -> DataFrame:
+    return pandas.DataFrame([req.__dict__ for req in requests], columns = list(StudentRequest().__dict__))
+
+
+# - - - - - - >
+
+
+def requests_to_dataframe(requests: List[StudentRequest]) -> DataFrame:
+    return build_tracker_frame(requests_to_frame(requests))
+
+
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
-# - - - - - - - - - - - - - - ! BZZT, BZZT WARNING - GLOBAL SCOPE ! - - - - - - - - - - - - - - - >
-#  Set up the main GUI interface with buttons and text-boxes for entering parameters, files, etc. >
-#       Specify functions to be called on button-press, and entry-point for the main program      >
+# The alternative Tracker layout ('Option 2'), where each assessment is written to its own row rather
+# than all of a student's assessments sharing one row with their details on separate lines. This is
+# much easier to filter and pivot in Excel, and to append to or diff against an earlier Tracker.
+# It has the same columns as the usual layout, except that the per-assessment columns hold a single
+# entry each, and an "Assessment No." column numbers each student's assessments from 1 (or is "-"
+# for a student who has not filled any in - they still get a row, so no application goes missing).
+
+TRACKER_LAYOUTS: List[str] = ["students", "assessments"]
+
+TRACKER_ASSESSMENT_SCHEMA: List[Tuple[str, str, str]] = [(column, TRACKER_FIELD if source == TRACKER_JOINED else source, value)
+                                                         for column, source, value in TRACKER_SCHEMA]
+TRACKER_ASSESSMENT_SCHEMA.insert(TRACKER_COLUMNS.index('No. Assessments/Exams') + 1, ('Assessment No.', TRACKER_FIELD, "asm_number"))
+
+
+# - - - - - - >
+# Request frame -> one row per assessment. All of the asm_* lists of a student are the same length,
+# so they can be exploded together; the index (one value per student) is repeated on each of their
+# rows, which is what numbers the assessments
+
+def explode_request_frame(frame: DataFrame) -> DataFrame:
+    assessments: DataFrame = frame.explode(ASSESSMENT_FIELDS)
+    provided:    Series = assessments["asm_codes"].notna()
+
+    assessments["asm_number"] = assessments.groupby(level = 0).cumcount().add(1).astype(object).where(provided, "-")
+    assessments[ASSESSMENT_FIELDS] = assessments[ASSESSMENT_FIELDS].fillna("")
+    return assessments
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Merging into an existing Tracker. Once a Tracker has been written, the panel fill in the outcome
+# columns (the TRACKER_CONSTANT ones in the schema) by hand, and often tidy up the rest as well - so
+# rather than starting a new Tracker full of placeholders each time, a merge keeps every row of the
+# existing Tracker exactly as it is and only appends the applications that are not already in it.
+# Applications are matched on the Student ID and the date the application was submitted (and the
+# assessment number, for the one-row-per-assessment layout), using a MultiIndex lookup rather than
+# comparing rows one at a time.
+
+TRACKER_MERGE_KEY:     List[str] = ['Student ID Number', 'Date Submitted']
+TRACKER_PANEL_COLUMNS: List[str] = [column for column, source, _ in TRACKER_SCHEMA if source == TRACKER_CONSTANT]
+
+
+def read_existing_tracker(filepath: str) -> DataFrame:
+    ensure_reader_dependencies()
+    # Everything is read back as text, so that e.g. a Student ID is matched the same way whether
+    # or not Excel has decided that it is a number since
+    tracker: DataFrame = pandas.read_excel(filepath, sheet_name = 0, dtype = str)
+    LOGGER.info(f"Read {len(tracker)} rows from the existing Tracker '{os.path.basename(filepath)}'")
+    return tracker
+
+
+# - - - - - - >
+
+
+def tracker_keys(tracker: DataFrame, by_student: bool = False) -> pandas.MultiIndex:
+    key: List[str] = list(TRACKER_MERGE_KEY)
+    if 'Assessment No.' in tracker.columns and not by_student:
+        key.append('Assessment No.')
+
+    missing: List[str] = [column for column in key if column not in tracker.columns]
+    if missing:
+        raise ValueError(f"Tracker has no {missing} column(s) to match applications on - is it the same layout?")
+
+    return pandas.MultiIndex.from_frame(tracker[key].fillna("").astype(str))
+
+
+# ~ ~ ~ >
+# How many applications a Tracker holds (in the one-row-per-assessment layout, several rows are the
+# same application)
+
+def count_tracker_applications(tracker: DataFrame) -> int:
+    if 'Assessment No.' not in tracker.columns:
+        return len(tracker)
+    return tracker_keys(tracker, by_student = True).nunique()
+
+
+# - - - - - - >
+# The rows of a freshly built Tracker that are not already in the existing one
+
+def new_tracker_rows(existing: DataFrame, fresh: DataFrame) -> DataFrame:
+    if ('Assessment No.' in existing.columns) != ('Assessment No.' in fresh.columns):
+        raise ValueError("The existing Tracker is not in the same layout (one row per student / per assessment) as this one")
+    return fresh[~tracker_keys(fresh).isin(tracker_keys(existing))]
+
+
+# ~ ~ ~ >
+
+
+def merge_trackers(existing: DataFrame, fresh: DataFrame) -> DataFrame:
+    appended: DataFrame = new_tracker_rows(existing, fresh)
+    LOGGER.info(f"Merging: keeping {len(existing)} existing rows and appending {len(appended)} new ones")
+    return pandas.concat([existing, appended], ignore_index = True)
+
+
+# - - - - - - >
+# Request frame -> Tracker dataframe in the chosen layout
+
+def build_tracker(frame: DataFrame, layout: str = "students") -> DataFrame:
+    if layout == "assessments":
+        return build_tracker_frame(explode_request_frame(frame), TRACKER_ASSESSMENT_SCHEMA)
+    return build_tracker_frame(frame)
+
+
+# - - - - - - >
+
+
+def requests_to_spreadsheet(requests: List[StudentRequest], output: str):
+    write_tracker_spreadsheet(requests_to_dataframe(requests), output)
+
+
+# - - - - - - >
+# Using the .set_column() method of the ExcelWriter, it is possible to change the formatting and size of 
+# columns in the output spreadsheet.
+# All of the column widths need to be changed to some degree to tidy the spreadsheet and ensure that the
+# unique Assessment Names and Codes appear on separate lines correctly, as explained above - specifically,
+# these are the columns that will need to be resized manually, so the column names are listed here to
+# check against while writing to the spreadsheet.
+# TRACKER_WRAP_FUDGE is simply how many additional pixels these columns should be widened by to ensure
+# that this isn't too tight
+
+TRACKER_WRAP_FUDGE:      int = 10
+TRACKER_WRAPPED_COLUMNS: List[str] = ["Unit Code",
+                                      "Assessment name and submission date",
+                                      "Is this a resubmission (including date)?",
+                                      "Submission Status"]
+
+# The same header style that pandas.to_excel() gives the column names
+TRACKER_HEADER_FORMAT: Dict[str, any] = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+# Excel will not show a column any wider than this many characters, so there is no point asking for more
+EXCEL_MAX_COLUMN_WIDTH: int = 255
+
+# ...and will not open a workbook with a sheet name any longer than this
+EXCEL_MAX_SHEETNAME_LENGTH: int = 31
+
+
+# - - - - - - >
+# The xlsxwriter library is frequently missing, for some reason - check to see if it is available
+# here, and download with Pip if it is not found (this will only happen the first time that the program runs)
+# Bit of a sledgehammer solution, but it gets the job done for now
+# TODO: Is there a less shit way of doing this?
+
+def ensure_writer_dependencies() -> None:
+    try:
+        from xlsxwriter import Workbook
+    except ModuleNotFoundError as mnfe:
+        os.system("python -m pip install xlsxwriter")
+
+
+# - - - - - - >
+# Write a Tracker dataframe (one row per student, in the column layout built above) out to the
+# Excel spreadsheet, including the number of unique students making requests in the sheet name.
+# This is shared by both request engines, so it only ever sees the finished dataframe.
+
+def write_tracker_spreadsheet(dataframe: DataFrame, output: str, width_sample: int = None, N_applications: int = None):
+    print(dataframe)
+
+    ensure_writer_dependencies()
+    from xlsxwriter import Workbook
+
+    # All of the column widths are measured up-front, in one go - see tracker_text_widths()
+    with PROFILER.stage("column widths", len(dataframe)):
+        widths: Series = tracker_column_widths(tracker_text_widths(dataframe, width_sample))
+
+    # The workbook is written in xlsxwriter's constant_memory mode, where each row is flushed to disk
+    # as soon as the next one is started, rather than going through pandas.ExcelWriter / to_excel(),
+    # which builds the whole workbook in memory before writing any of it. Since the widths are already
+    # known, everything else (header, column formats) can be set before the rows go in.
+    with PROFILER.stage("write xlsx", len(dataframe)):
+        workbook  = Workbook(output, {'constant_memory': True})
+        worksheet = workbook.add_worksheet(tracker_sheet_name(len(dataframe) if N_applications is None else N_applications))
+        worksheet.write_row(0, 0, list(dataframe.columns), workbook.add_format(TRACKER_HEADER_FORMAT))
+        format_tracker_columns(workbook, worksheet, list(dataframe.columns), widths)
+
+        # The workbook is closed however the loop ends, so that xlsxwriter's temporary files are
+        # cleaned up - but a Tracker cut off part-way through (cancelled, or failed) is removed again
+        written: bool = False
+        try:
+            for row, values in enumerate(dataframe.fillna("").itertuples(index = False, name = None), start = 1):
+                worksheet.write_row(row, 0, values)
+                if row % PROGRESS_ROW_INTERVAL == 0:
+                    PROGRESS.rows(row, len(dataframe))
+            written = True
+        finally:
+            workbook.close()
+            if not written:
+                with contextlib.suppress(OSError):
+                    os.remove(output)
+    print("    ...Done!")
+
+
+# - - - - - - >
+# Excel refuses sheet names longer than EXCEL_MAX_SHEETNAME_LENGTH characters, which the usual name
+# goes over once there are 10000 or more students - use a shortened version of the name for those
+
+def tracker_sheet_name(N_applications: int) -> str:
+    sheetname: str = f"Mitigating Circumstances ({N_applications})"
+    if len(sheetname) > EXCEL_MAX_SHEETNAME_LENGTH:
+        sheetname = f"Mitigating Circs. ({N_applications})"
+    return sheetname
+
+
+# - - - - - - >
+# Column layout of a Tracker sheet. Using the .set_column() method, it is possible to
+# change the formatting and size of columns in the output spreadsheet. To ensure that the newlines
+# ("\n") function correctly, text wrapping needs to be enabled for the manually-resized Assessment
+# Name / Code / Status columns; the other columns don't need to care about newlines within cells
+# and so text wrapping is not enabled for these.
+
+def format_tracker_columns(workbook: any, worksheet: any, columns: List[str], widths: Series) -> None:
+    cellformat = workbook.add_format({'text_wrap': True})
+
+    for column_index, colname in enumerate(columns):
+        if colname in TRACKER_WRAPPED_COLUMNS:
+            worksheet.set_column(column_index, column_index, widths[colname], cell_format = cellformat)
+        else:
+            worksheet.set_column(column_index, column_index, widths[colname])
+
+
+# - - - - - - >
+# Width needed by each column of (part of) a Tracker dataframe, before any fudge space is added.
+# The manually-resized (TRACKER_WRAPPED_COLUMNS) columns only need to fit the longest *line* in any
+# of their cells - if all of the strings in each cell are displayed on new lines, how wide does the
+# column need to be to ensure that none of them are cut off? - while the others simply need to fit
+# the longest string in any cell. Each column is measured with a single vectorised str.len() rather
+# than a Python loop over its cells (the wrapped columns being split into lines and exploded first).
+# Long free-text columns can make this noticeable on huge sheets, so sample_rows can be given to
+# only measure a (fixed, random) sample of that many rows instead of all of them.
+
+def tracker_text_widths(dataframe: DataFrame, sample_rows: int = None) -> Series:
+    if sample_rows is not None and len(dataframe) > sample_rows:
+        dataframe = dataframe.sample(n = sample_rows, random_state = 0)
+
+    def measure(column: Series) -> int:
+        if column.name in TRACKER_WRAPPED_COLUMNS:
+            column = column.str.split("\n").explode()
+        return column.str.len().max()
+
+    text:   DataFrame = dataframe.astype(str)
+    widths: Series = pandas.Series({colname: measure(text[colname]) for colname in text.columns}, index = text.columns, dtype = float)
+    return widths.fillna(0).astype(int)
+
+
+# ~ ~ ~ >
+# Measured text widths -> the widths the columns are actually set to: the wrapped columns get the
+# extra fudge space, the others are made wide enough for the column name as well, and none are
+# made wider than Excel will display
+
+def tracker_column_widths(text_widths: Series, cap: int = EXCEL_MAX_COLUMN_WIDTH) -> Series:
+    names:   Series = pandas.Series(text_widths.index.str.len(), index = text_widths.index)
+    wrapped: Series = text_widths.index.isin(TRACKER_WRAPPED_COLUMNS)
+    widths:  Series = text_widths.where(~wrapped, text_widths + TRACKER_WRAP_FUDGE).where(wrapped, numpy.maximum(text_widths, names))
+
+    return widths.clip(upper = cap)
+
+
+# - - - - - - >
+# Write a Tracker spreadsheet a piece at a time, for when the whole Tracker should not be held in
+# memory at once (see process_qualtrics_csv_in_chunks()). Each call to write() appends the rows
+# of a Tracker dataframe to the sheet straight away - xlsxwriter's constant_memory mode flushes
+# each row to disk as soon as the next one is started - and only the running column widths are
+# kept. Since the number of students (which goes in the sheet name and the filename) is not known
+# until the end, the sheet is renamed and the file moved to its usual name in close().
+
+class TrackerStreamWriter:
+    def __init__(self, directory: str, columns: List[str], width_sample: int = None, layout: str = "students", incremental: bool = False):
+        ensure_writer_dependencies()
+        from xlsxwriter import Workbook
+
+        self.directory: str = directory
+        self.columns:   List[str] = list(columns)
+        self.widths:    Series = pandas.Series(0, index = self.columns)
+        self.sample:    int = width_sample
+        self.rows:      int = 0
+        self.students:  int = 0
+        self.layout:    str = layout
+        self.increment: bool = incremental
+        self.partial:   str = os.path.join(directory, "Mitigating Circumstances Tracker - In Progress.xlsx")
+
+        self.workbook  = Workbook(self.partial, {'constant_memory': True})
+        self.worksheet = self.workbook.add_worksheet("Mitigating Circumstances")
+        self.worksheet.write_row(0, 0, self.columns, self.workbook.add_format(TRACKER_HEADER_FORMAT))
+
+        # xlsxwriter gives a cell its column's format when the cell is written, so the wrap formats
+        # have to be in place before any rows are - the widths are then filled in by close()
+        format_tracker_columns(self.workbook, self.worksheet, self.columns, pandas.Series(None, index = self.columns))
+
+
+    # N_applications is how many students the rows are for, if not one per row (see TRACKER_LAYOUTS)
+    def write(self, dataframe: DataFrame, N_applications: int = None) -> None:
+        self.students = self.students + (len(dataframe) if N_applications is None else N_applications)
+        dataframe = dataframe.reindex(columns = self.columns)
+        self.widths = numpy.maximum(self.widths, tracker_text_widths(dataframe, self.sample))
+
+        for values in dataframe.fillna("").itertuples(index = False, name = None):
+            self.rows = self.rows + 1
+            self.worksheet.write_row(self.rows, 0, values)
+
+
+    def close(self) -> str:
+        format_tracker_columns(self.workbook, self.worksheet, self.columns, tracker_column_widths(self.widths))
+        self.worksheet.name = tracker_sheet_name(self.students)
+        self.workbook.close()
+
+        output: str = create_output_filename(self.directory, self.students, self.layout, self.increment)
+        os.replace(self.partial, output)
+        return output
+
+
+    # Give up on the spreadsheet (e.g. after a ColumnNameError) without leaving the partial file behind
+    def discard(self) -> None:
+        self.workbook.close()
+        if object_exists(self.partial, suppress = True):
+            os.remove(self.partial)
+
+
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# The processing pipeline itself. Nothing below this point touches Tk - the GUI lives in its own
+# module (mitcircs_gui.py) and calls into process_qualtrics_file() once its message-box checks have
+# passed, while the batch entry point (batch_main) runs the same pipeline from the command line
+# and reports any problems through the exit codes defined here instead of pop-up windows.
 
-def select_spreadsheet_file_window():
-    valid_filetypes = (("Excel", "*.xlsx"), ("CSV", "*.csv"), ("All files", "*.*"))
-    filename = filedialog.askopenfilename(title = "Select a spreadsheet...", filetypes = valid_filetypes)
+EXIT_SUCCESS:          int = 0      # Tracker written without any problems
+EXIT_FAILURE:          int = 1      # Unexpected error while processing the input file
+EXIT_USAGE:            int = 2      # Bad command-line arguments (this is also what argparse uses)
+EXIT_INPUT_MISSING:    int = 3      # The input Qualtrics file could not be found
+EXIT_INPUT_FILETYPE:   int = 4      # The input Qualtrics file is not a '.xlsx' or '.csv'
+EXIT_OUTPUT_DIRECTORY: int = 5      # The output directory does not exist and could not be created
+EXIT_COLUMN_ERROR:     int = 6      # An expected column is missing from the Qualtrics file
 
-    # Only show the information window if the user actually selects a file here - if they Cancel out,
-    # this would otherwise just show a blank window which looks busted
-    if filename:
-        showinfo(title = "Reading file...", message = filename)
+VALID_INPUT_EXTENSIONS: List[str] = [".xlsx", ".csv"]
 
-    input_requests_entry.delete(0, tk.END)
-    input_requests_entry.insert(0, filename)
 
 # - - - - - - >
+# The Uni-controlled laptops do not have Openpyxl installed, but Pandas seems to require
+# this in order to *read* files - so, we need to ensure this is available here and install
+# it using the command-line if it is missing
+
+def ensure_reader_dependencies() -> None:
+    try:
+        import openpyxl
+    except ModuleNotFoundError as mnfe:
+        command: str = "python -m pip install openpyxl"
+        LOGGER.warning(f"openpyxl dependency missing. Installing using command '{command}'")
+        os.system(command)
 
-def select_output_folder_window():
-    output_location = filedialog.askdirectory()
-    output_directory_entry.delete(0, tk.END)
-    output_directory_entry.insert(0, output_location)
 
 # - - - - - - >
+# Reading a '.xlsx' is by far the slowest part of a cold run, so the engine pandas uses for it is
+# picked here rather than left to the default: calamine (Rust, needs the python-calamine package) if
+# it is installed, otherwise openpyxl, which pandas already opens in read-only (streaming) mode.
+# A specific engine can be asked for instead, but if its package is missing we still fall back
+# down the list rather than failing, because openpyxl is always there (ensure_reader_dependencies).
+
+XLSX_READER_ENGINES: Dict[str, str] = {"calamine": "python_calamine",
+                                       "openpyxl": "openpyxl"}
+
+QUALTRICS_SHEET_NAME: str = "Sheet0"
 
-def check_verbose_running_flag():
-    check_flag_message: str = None
 
-    if display_running_information.get():
-        check_flag_message = "Additional information will be shown in the command window as the program runs.\nCheck for any issues / errors!"
-        tk.messagebox.showinfo(title = "Information...", message = check_flag_message)
+def excel_reader_engine(preferred: str = None) -> str:
+    candidates: List[str] = list(XLSX_READER_ENGINES)
+    if preferred in candidates:
+        candidates.remove(preferred)
+        candidates.insert(0, preferred)
+
+    for engine in candidates:
+        try:
+            __import__(XLSX_READER_ENGINES[engine])
+        except ModuleNotFoundError:
+            if engine == preferred:
+                LOGGER.warning(f"Excel reader engine '{engine}' is not installed - falling back to the next available engine")
+            continue
+        return engine
+
+    return None
 
-    del(check_flag_message)
 
 # - - - - - - >
+# Open the workbook once and decide which sheet to read from its sheet names, rather than trying
+# to parse "Sheet0" and then parsing the whole workbook a second time when that sheet is missing.
+# If the export does not have a "Sheet0" then assume the data is contained in the first sheet.
+
+def open_qualtrics_workbook(filepath: str, engine: str = None) -> Tuple[pandas.ExcelFile, any]:
+    workbook: pandas.ExcelFile = pandas.ExcelFile(filepath, engine = excel_reader_engine(engine))
+    LOGGER.info(f"Reading '{os.path.basename(filepath)}' with the '{workbook.engine}' engine")
 
-def check_logfile_flag():
-    check_logfile_flag_message: str = None
+    if QUALTRICS_SHEET_NAME in workbook.sheet_names:
+        return workbook, QUALTRICS_SHEET_NAME
 
-    if write_logfile_flag.get():
-        check_logfile_flag_message = "Each step of the cleanup procedure will be logged to a text file.\nYou will find this in your chosen Output folder."
-        tk.messagebox.showinfo(title = "Information...", message = check_logfile_flag_message)
+    LOGGER.warning(f"Sheet name '{QUALTRICS_SHEET_NAME}' not in spreadsheet {workbook.sheet_names} - using sheet index = 0 instead.")
+    return workbook, 0
 
-    del(check_logfile_flag_message)
 
 # - - - - - - >
+# Which of the COLUMN_PROFILES an export was written with is worked out from its column names alone:
+# a profile matches if the export has every one of the REQUIRED_COLNAME_PREFIXES (under the names
+# that version of the form used) and every numbered assessment group has exactly that version's
+# subquestions, in order. Checking this means locating the response columns, so the answer is kept
+# against a fingerprint of the column names (and of COLUMN_PROFILES, so that editing the profiles
+# invalidates it) - in memory, and in the input cache directory so that it outlives the run. Like the
+# cached exports, only the COLUMN_PROFILE_CACHE_MAX_ENTRIES most recently used fingerprints are kept
+# (the file lists them from least to most recently used).
 
-def check_alternative_output_flag():
-    check_output_flag_message: str = None
+COLUMN_PROFILE_CACHE_FILENAME:    str = "column-profiles.json"
+COLUMN_PROFILE_CACHE_MAX_ENTRIES: int = 64
+COLUMN_PROFILE_FINGERPRINTS:      Dict[str, str] = {}
+
+
+def column_fingerprint(colnames: List[str]) -> str:
+    digest = hashlib.sha256(json.dumps(COLUMN_PROFILES, sort_keys = True).encode())
+    digest.update("\x1f".join(str(colname) for colname in colnames).encode())
+    return digest.hexdigest()
+
+
+# ~ ~ ~ >
+
+
+def column_profile_matches(colnames: List[str], profile: str) -> bool:
+    colnames: List[str] = [str(colname) for colname in colnames]
+    own_name: Dict[str, str] = {current: name for name, current in COLUMN_PROFILES[profile]["renames"].items()}
+    suffixes: List[str] = [suffix for suffix, _ in COLUMN_PROFILES[profile]["responses"]]
+
+    if any(own_name.get(prefix, prefix) not in colnames for prefix in REQUIRED_COLNAME_PREFIXES):
+        return False
+
+    groups: Dict[str, List[int]] = locate_response_columns(pandas.DataFrame(columns = colnames), display_index = False, response_max = 100, quiet = True)
+    return bool(groups) and all(len(positions) == len(suffixes) and
+                                all(colnames[position].endswith(suffix) for position, suffix in zip(positions, suffixes))
+                                for positions in groups.values())
+
+
+# ~ ~ ~ >
+# Returns DEFAULT_COLUMN_PROFILE if none of the profiles match - any columns that are then missing
+# are reported by resolve_qualtrics_columns() as usual
+
+def detect_column_profile(colnames: List[str], cache_directory: str = None) -> str:
+    fingerprint: str = column_fingerprint(colnames)
+    path:        str = None if cache_directory is None else os.path.join(cache_directory, COLUMN_PROFILE_CACHE_FILENAME)
+
+    if fingerprint not in COLUMN_PROFILE_FINGERPRINTS and path is not None and os.path.exists(path):
+        try:
+            with open(path, "r", encoding = "utf-8") as file:
+                COLUMN_PROFILE_FINGERPRINTS.update(json.load(file))
+        except (OSError, ValueError) as expt:
+            LOGGER.warning(f"Could not read the column profile cache '{path}': {expt}")
+
+    # A fingerprint seen before becomes the most recently used one (and the file is only rewritten
+    # if it was not already)
+    profile: str = COLUMN_PROFILE_FINGERPRINTS.get(fingerprint)
+    if profile in COLUMN_PROFILES:
+        LOGGER.info(f"Using the '{profile}' column profile (seen before)")
+        if list(COLUMN_PROFILE_FINGERPRINTS)[-1] != fingerprint:
+            COLUMN_PROFILE_FINGERPRINTS[fingerprint] = COLUMN_PROFILE_FINGERPRINTS.pop(fingerprint)
+            if path is not None:
+                store_column_profiles(cache_directory, path)
+        return profile
+
+    matches: List[str] = [name for name in COLUMN_PROFILES if column_profile_matches(colnames, name)]
+    if not matches:
+        LOGGER.warning(f"The columns do not match any of the known column profiles ({', '.join(COLUMN_PROFILES)}) - assuming '{DEFAULT_COLUMN_PROFILE}'")
+        return DEFAULT_COLUMN_PROFILE
+
+    profile = matches[0]
+    LOGGER.info(f"Detected the '{profile}' column profile")
+    COLUMN_PROFILE_FINGERPRINTS[fingerprint] = profile
+
+    if path is not None:
+        store_column_profiles(cache_directory, path)
+    return profile
+
+
+# ~ ~ ~ >
+# Write COLUMN_PROFILE_FINGERPRINTS out, dropping all but the most recently used
+
+
+def store_column_profiles(cache_directory: str, path: str, max_entries: int = COLUMN_PROFILE_CACHE_MAX_ENTRIES) -> None:
+    for stale in list(COLUMN_PROFILE_FINGERPRINTS)[:-max_entries]:
+        del COLUMN_PROFILE_FINGERPRINTS[stale]
+
+    try:
+        os.makedirs(cache_directory, exist_ok = True)
+        partial: str = f"{path}.{os.getpid()}.partial"
+        with open(partial, "w", encoding = "utf-8") as file:
+            json.dump(COLUMN_PROFILE_FINGERPRINTS, file, indent = 1)
+        os.replace(partial, path)
+    except OSError as oserr:
+        LOGGER.warning(f"Could not write to the column profile cache '{path}': {oserr}")
+
+
+# ~ ~ ~ >
+# The profile to read an export with - the one asked for (e.g. on the command line), or else the detected one
+
+
+def choose_column_profile(colnames: List[str], profile: str = None, cache_directory: str = None) -> str:
+    if profile is None:
+        return detect_column_profile(colnames, cache_directory)
+
+    if not column_profile_matches(colnames, profile):
+        LOGGER.warning(f"The columns do not match the '{profile}' column profile that was asked for - using it anyway")
+    return profile
 
-    if alternative_output_format.get():
-        check_output_flag_message = "Output spreadsheet will use the alternative formatting ('Option 2')\nThis means each assessment will be written to its own unique row."
-        tk.messagebox.showinfo(title = "Information...", message = check_output_flag_message)
-    
-    del(check_output_flag_message)
 
 # - - - - - - >
+# How to translate an export written with the given profile into the current layout, as the position
+# in the export of each column of the translated export (-1 for a blank column, where that version of
+# the form had no such subquestion) and the name of each column. The prefix columns are renamed, and
+# the columns of each assessment group are put into the order given by RESPONSE_COLUMN_INDICES.
+# e.g. for a "2024" export, with no Division column:
+#    sources = [..., 41, -1, 42, 43, 44, ...]
+#    names   = [..., 'Q160', '1_2024_1', '1_Q161_1', '1_Q161_2', ...]
+
+def column_profile_plan(colnames: List[str], profile: str) -> Tuple[List[int], List[str]]:
+    colnames:  List[str] = list(colnames)
+    renames:   Dict[str, str] = COLUMN_PROFILES[profile]["renames"]
+    slots:     List[Tuple[str, str]] = COLUMN_PROFILES[profile]["responses"]
+    canonical: List[str] = sorted(RESPONSE_COLUMN_INDICES, key = RESPONSE_COLUMN_INDICES.get)
+    groups:    Dict[str, List[int]] = locate_response_columns(pandas.DataFrame(columns = colnames), display_index = False, response_max = 100, quiet = True)
+    starts:    Dict[int, str] = {positions[0]: number for number, positions in groups.items()}
+    grouped:   set = set(position for positions in groups.values() for position in positions)
+    sources:   List[int] = []
+    names:     List[str] = []
+
+    for position, colname in enumerate(colnames):
+        if position in starts:
+            number:    str = starts[position]
+            locations: Dict[str, int] = {current: location for location, (_, current) in zip(groups[number], slots) if current is not None}
+            for suffix in canonical:
+                source: int = locations.get(suffix, -1)
+                sources.append(source)
+                names.append(colnames[source] if source >= 0 else f"{number}_{profile}{suffix}")
+        elif position not in grouped:
+            sources.append(position)
+            names.append(renames.get(colname, colname))
+
+    return sources, names
+
+
+# ~ ~ ~ >
+# An export that is already in the current layout (by far the usual case) is returned as it is
+
+
+def apply_column_plan(dataframe: DataFrame, plan: Tuple[List[int], List[str]]) -> DataFrame:
+    sources, names = plan
+    if sources == list(range(len(dataframe.columns))) and names == list(dataframe.columns):
+        return dataframe
 
-def check_clean_input_flag():
-    check_cleaning_flag_message: str = None
+    blank:  Series = pandas.Series(numpy.nan, index = dataframe.index, dtype = object)
+    padded: DataFrame = pandas.concat([dataframe, blank], axis = 1)
+    return padded.iloc[:, [source if source >= 0 else len(dataframe.columns) for source in sources]].set_axis(names, axis = 1)
 
-    if delete_junk_rows.get():
-        check_cleaning_flag_message = "Junk rows in Qualtrics output will be removed prior to processing (typically Excel Row 3)\n"
-        check_cleaning_flag_message = f"{check_cleaning_flag_message}If unsure, check the Qualtrics output to ensure this is right for your data."
-        tk.messagebox.showinfo(title = "Information...", message = check_cleaning_flag_message)
 
-    del(check_cleaning_flag_message)
+# ~ ~ ~ >
+
+
+def apply_column_profile(dataframe: DataFrame, profile: str) -> DataFrame:
+    return apply_column_plan(dataframe, column_profile_plan(dataframe.columns, profile))
+
 
 # - - - - - - >
+# Qualtrics exports carry a lot of columns that are never used here (timings, IP address, location,
+# embedded data...). Only the COLNAME_PREFIX_* columns listed below, the numbered response columns
+# and the columns found through the header index are needed, so the column names, header row and
+# junk rows are read first and everything else is left out of the full read. The Division,
+# Programme and Year response columns repeat the same few values, so they are read as categories;
+# everything else is read as text, which is all that the request builders ever do with it anyway.
+
+REQUIRED_COLNAME_PREFIXES: List[str] = REQUEST_COLNAME_PREFIXES + [COLNAME_PREFIX_RESPONSEID]
+
+CATEGORY_COLUMN_SUFFIXES: List[str] = [COLNAME_SUFFIX_DIVISION, COLNAME_SUFFIX_PROGRAMME, COLNAME_SUFFIX_COURSEYEAR]
 
-def show_help_windows():
-    pass
 
 # - - - - - - >
+# Work out which columns of the export to read (as positions) and their dtypes (by column name),
+# given a preview of its first few rows and the column profile it was written with. The columns are
+# picked out of the preview once it has been translated into the current layout, and then traced
+# back to where they are in the export itself. Any missing COLNAME_PREFIX_* columns have already
+# been reported (all together) by resolve_qualtrics_columns() before this is called.
 
-def destroy_window():
-    print(f"[{current_datetime()}] Closing down...")
-    parent.destroy()
+def qualtrics_projection(preview: DataFrame, profile: str = DEFAULT_COLUMN_PROFILE) -> Tuple[List[int], Dict[str, any]]:
+    sources, names = column_profile_plan(preview.columns, profile)
+    current:     DataFrame = apply_column_plan(preview, (sources, names))
+    positions:   set = set(names.index(prefix) for prefix in REQUIRED_COLNAME_PREFIXES if prefix in names)
+    categorical: set = set()
+
+    for group in locate_response_columns(current, display_index = False, response_max = 100, quiet = True).values():
+        positions.update(group)
+        categorical.update(group[RESPONSE_COLUMN_INDICES[suffix]] for suffix in CATEGORY_COLUMN_SUFFIXES
+                           if RESPONSE_COLUMN_INDICES[suffix] < len(group))
+
+    for indices in build_header_index(extract_top_row(current)).values():
+        positions.update(indices)
+
+    colnames: List[str] = list(preview.columns)
+    usecols:  List[int] = sorted(set(sources[position] for position in positions if sources[position] >= 0))
+    dtypes:   Dict[str, any] = {colnames[sources[position]]: ("category" if position in categorical else str)
+                                for position in positions if sources[position] >= 0}
+    return usecols, dtypes
+
+
+# - - - - - - >
+# Read an export, translated into the current layout from the column profile it was written with
+# (detected from its columns, unless one is given). The cache directory is only used to remember
+# which profile goes with which set of columns, see detect_column_profile().
+
+def read_qualtrics_file(filepath: str, projected: bool = True, excel_engine: str = None, column_profile: str = None,
+                        cache_directory: str = None) -> DataFrame:
+    _, extension = os.path.splitext(filepath)
+
+    if "csv" in extension:
+        preview: DataFrame = pandas.read_csv(filepath, nrows = 1 + QUALTRICS_JUNK_SCAN_ROWS)
+        profile: str = choose_column_profile(preview.columns, column_profile, cache_directory)
+        if not projected:
+            return apply_column_profile(pandas.read_csv(filepath), profile)
+
+        resolve_qualtrics_columns(column_profile_plan(preview.columns, profile)[1])
+        usecols, dtypes = qualtrics_projection(preview, profile)
+        LOGGER.info(f"Reading {len(usecols)} of the {len(preview.columns)} columns in '{os.path.basename(filepath)}'")
+        return apply_column_profile(pandas.read_csv(filepath, usecols = usecols, dtype = dtypes), profile)
+
+    # The cells of a '.xlsx' are already typed, and a numeric 0 has to stay falsy for the Division and
+    # DASS checks, so only the column projection is applied there - the dtypes are for '.csv' text
+    workbook, sheet = open_qualtrics_workbook(filepath, excel_engine)
+    with workbook:
+        preview: DataFrame = workbook.parse(sheet, nrows = 1 + QUALTRICS_JUNK_SCAN_ROWS)
+        profile: str = choose_column_profile(preview.columns, column_profile, cache_directory)
+        if not projected:
+            return apply_column_profile(workbook.parse(sheet), profile)
+
+        resolve_qualtrics_columns(column_profile_plan(preview.columns, profile)[1])
+        usecols, _ = qualtrics_projection(preview, profile)
+        LOGGER.info(f"Reading {len(usecols)} of the {len(preview.columns)} columns in '{os.path.basename(filepath)}'")
+        return apply_column_profile(workbook.parse(sheet, usecols = usecols), profile)
+
+
+# - - - - - - >
+# Coordinators tend to re-run the same export many times over (chasing a column name error, trying
+# different options...), so the cleaned export - after the read, the column projection and the junk
+# row removal - is kept in an on-disk cache keyed by a hash of the file's contents. A changed export
+# has a different hash and so is simply a cache miss. Snapshots are pickled rather than written as
+# Parquet/Feather: the columns of a '.xlsx' hold a mix of numbers and text, which Arrow would turn
+# into text, and a numeric 0 has to stay falsy for the Division and DASS checks. The cache holds at
+# most QUALTRICS_CACHE_MAX_ENTRIES snapshots, evicting the least recently used (by file mtime, which
+# is bumped on every hit). Bump QUALTRICS_CACHE_VERSION whenever the cleaning steps change.
+# Several worker processes can share one cache directory (see process_qualtrics_files()), so the
+# cache is only ever best-effort: an entry that another process has just evicted or replaced is
+# simply skipped, and each process writes its snapshot under its own partial name.
+
+QUALTRICS_CACHE_DIRECTORY:   str = os.path.join(os.path.expanduser("~"), ".mitcircs", "cache")
+QUALTRICS_CACHE_MAX_ENTRIES: int = 8
+QUALTRICS_CACHE_VERSION:     int = 2
+QUALTRICS_CACHE_EXTENSION:   str = ".pkl"
+
+
+def qualtrics_cache_key(filepath: str, projected: bool, column_profile: str = None) -> str:
+    # The projected columns are part of the key, so that adding a column to REQUIRED_COLNAME_PREFIXES
+    # does not pick up a snapshot that was taken without it - as are the column profiles, since the
+    # snapshot has already been translated into the current layout with one of them
+    digest = hashlib.sha256("|".join(REQUIRED_COLNAME_PREFIXES if projected else []).encode())
+    digest.update(f"{column_profile or 'detected'}|{json.dumps(COLUMN_PROFILES, sort_keys = True)}".encode())
+    with open(filepath, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+
+    return f"v{QUALTRICS_CACHE_VERSION}-{'projected' if projected else 'all'}-{digest.hexdigest()}"
+
+
+# ~ ~ ~ >
+# Returns None on a cache miss (or an unreadable snapshot, which is deleted)
+
+def load_cached_qualtrics(directory: str, key: str) -> DataFrame:
+    path: str = os.path.join(directory, key + QUALTRICS_CACHE_EXTENSION)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        qualtrics: DataFrame = pandas.read_pickle(path)
+    except FileNotFoundError:
+        return None
+    except Exception as expt:
+        LOGGER.warning(f"Discarding unreadable cache entry '{path}': {type(expt).__name__}: {expt}")
+        with contextlib.suppress(OSError):
+            os.remove(path)
+        return None
+
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return qualtrics
+
+
+# ~ ~ ~ >
+
+
+def store_cached_qualtrics(directory: str, key: str, qualtrics: DataFrame, max_entries: int = QUALTRICS_CACHE_MAX_ENTRIES) -> None:
+    path:    str = os.path.join(directory, key + QUALTRICS_CACHE_EXTENSION)
+    partial: str = f"{path}.{os.getpid()}.partial"
+    try:
+        os.makedirs(directory, exist_ok = True)
+        qualtrics.to_pickle(partial, protocol = pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, path)
+    except OSError as oserr:
+        LOGGER.warning(f"Could not write to the input cache '{directory}': {oserr}")
+        with contextlib.suppress(OSError):
+            os.remove(partial)
+        return
+
+    if QUALTRICS_CACHE_EVICTING:
+        evict_cached_qualtrics(directory, max_entries)
+
+
+# ~ ~ ~ >
+# Worker processes for several exports leave this to the process that started them, which evicts
+# once they have all finished (see process_qualtrics_files())
+
+QUALTRICS_CACHE_EVICTING: bool = True
+
+
+def evict_cached_qualtrics(directory: str, max_entries: int = QUALTRICS_CACHE_MAX_ENTRIES) -> None:
+    # Entries which disappear part-way through (evicted by another process) are left out
+    mtimes: Dict[str, float] = {}
+    for name in os.listdir(directory):
+        if name.endswith(QUALTRICS_CACHE_EXTENSION):
+            with contextlib.suppress(OSError):
+                mtimes[os.path.join(directory, name)] = os.path.getmtime(os.path.join(directory, name))
+
+    for stale in sorted(mtimes, key = mtimes.get, reverse = True)[max_entries:]:
+        LOGGER.info(f"Evicting cache entry '{os.path.basename(stale)}'")
+        with contextlib.suppress(OSError):
+            os.remove(stale)
+
+
+# - - - - - - >
+# Read an export and strip its junk rows, going through the cache unless cache_directory is None.
+
+def read_cleaned_qualtrics(filepath: str, projected: bool = True, excel_engine: str = None,
+                           cache_directory: str = QUALTRICS_CACHE_DIRECTORY, column_profile: str = None) -> DataFrame:
+    if cache_directory is not None:
+        with PROFILER.stage("read (cache)") as stage:
+            key:       str = qualtrics_cache_key(filepath, projected, column_profile)
+            qualtrics: DataFrame = load_cached_qualtrics(cache_directory, key)
+            stage["rows"] = None if qualtrics is None else len(qualtrics)
+        if qualtrics is not None:
+            LOGGER.info(f"Using the cached copy of '{os.path.basename(filepath)}' ({key})")
+            return qualtrics
+
+    with PROFILER.stage("read") as stage:
+        qualtrics: DataFrame = read_qualtrics_file(filepath, projected, excel_engine, column_profile, cache_directory)
+        stage["rows"] = len(qualtrics)
+
+    # The new version of the Qualtrics output appears to contain some Qualtrics-specific junk in
+    # Excel row 3 - regardless of whether the user has asked for this to be cleaned, we need to
+    # check for it and ensure it is removed otherwise it will produce mess in the output
+    with PROFILER.stage("drop junk rows", len(qualtrics)):
+        qualtrics = drop_junk_rows(qualtrics)
+
+    if cache_directory is not None:
+        with PROFILER.stage("cache store", len(qualtrics)):
+            store_cached_qualtrics(cache_directory, key, qualtrics)
+
+    return qualtrics
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Incremental runs. Each Qualtrics export contains every submission ever made to the form, but from
+# week to week only the newest few hundred of these need to go into a Tracker. An incremental run
+# keeps a small state file in the output directory recording how far it has got - the latest
+# RecordedDate seen (the "watermark") and the ResponseId of every submission already processed -
+# and only processes submissions that are newer than the watermark or have not been seen before
+# (e.g. a response that Qualtrics recorded late). The state is only updated once the Tracker for
+# the new submissions has been written, so a failed run can simply be re-run.
+
+INCREMENTAL_STATE_FILENAME: str = "MitCircs Incremental State.json"
+
+
+def load_incremental_state(directory: str) -> Dict[str, any]:
+    path: str = os.path.join(directory, INCREMENTAL_STATE_FILENAME)
+    if not os.path.exists(path):
+        LOGGER.info(f"No incremental state in '{directory}' - every submission is new")
+        return {"watermark": None, "response_ids": set()}
+
+    with open(path, "r", encoding = "utf-8") as file:
+        saved: Dict[str, any] = json.load(file)
+
+    LOGGER.info(f"Incremental state: {len(saved['response_ids'])} submissions seen, up to {saved['watermark']}")
+    return {"watermark":    pandas.Timestamp(saved["watermark"]) if saved["watermark"] else None,
+            "response_ids": set(saved["response_ids"])}
+
+
+# ~ ~ ~ >
+
+
+def save_incremental_state(directory: str, state: Dict[str, any]) -> None:
+    path:  str = os.path.join(directory, INCREMENTAL_STATE_FILENAME)
+    saved: Dict[str, any] = {"watermark":    state["watermark"].isoformat() if state["watermark"] is not None else None,
+                             "response_ids": sorted(state["response_ids"]),
+                             "updated":      current_datetime()}
+
+    with open(path + ".partial", "w", encoding = "utf-8") as file:
+        json.dump(saved, file, indent = 1)
+    os.replace(path + ".partial", path)
+
+
+# - - - - - - >
+# Dates which cannot be read (NaT) never count as newer than the watermark, so whether those
+# submissions are new is decided by their ResponseId alone
+
+def submission_dates(students: DataFrame) -> Series:
+    return pandas.to_datetime(students[COLNAME_PREFIX_DATESUBMITTED], errors = "coerce", format = "ISO8601")
+
+
+# ~ ~ ~ >
+# Which of the student rows (i.e. with the header row already removed) have not been processed before
+
+def new_submissions_mask(students: DataFrame, state: Dict[str, any]) -> Series:
+    resolve_qualtrics_columns(students.columns, [COLNAME_PREFIX_RESPONSEID])
+    new: Series = ~students[COLNAME_PREFIX_RESPONSEID].astype(str).isin(state["response_ids"])
+    if state["watermark"] is not None:
+        new = new | (submission_dates(students) > state["watermark"])
+
+    return new
+
+
+# ~ ~ ~ >
+# Add the (newly processed) student rows to the state - their IDs, and the watermark moved up to
+# the latest of their dates
+
+def record_submissions(state: Dict[str, any], students: DataFrame) -> None:
+    state["response_ids"].update(students[COLNAME_PREFIX_RESPONSEID].astype(str))
+
+    latest = submission_dates(students).max()
+    if pandas.notna(latest) and (state["watermark"] is None or latest > state["watermark"]):
+        state["watermark"] = latest
+
+
+# - - - - - - >
+# Parse the (cleaned) raw Qualtrics output data into a request frame - one row per student containing
+# all of the information on their application (Name, ID, Year and Programme, Assessments applied for,
+# Unit Codes, Circumstances leading to their application, etc.)
+# The "rows" engine is the original StudentRequest-per-row loop and is kept for comparison with
+# the column-wise engine, which is much faster on large exports but should give identical output.
+# With more than one job, a large enough export is built in parallel - see below.
+
+def build_qualtrics_request_frame(qualtrics: DataFrame, display: bool, engine: str = "columns", jobs: int = None) -> DataFrame:
+    if jobs is not None and jobs > 1 and len(qualtrics) > PARALLEL_ROW_THRESHOLDS[engine]:
+        return build_request_frame_in_parallel(qualtrics, display, engine, jobs)
+
+    if engine == "rows":
+        with PROFILER.stage("build requests", len(qualtrics) - 1):
+            requests: List[StudentRequest] = build_student_requests(qualtrics, display)
+        with PROFILER.stage("request frame", len(requests)):
+            return requests_to_frame(requests)
+    return build_request_frame(qualtrics, display)
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Building the requests in parallel. Once the header index and the response columns have been found,
+# every student row can be built independently of the others, so the student rows are split into
+# contiguous partitions which are built in worker processes and stuck back together in their original
+# order. The header index, response columns and required columns are handed to each worker once, when it
+# starts up (PARTITION_CONTEXT), rather than being sent along with every partition.
+# Starting the workers takes a second or so (each one has to import pandas), so this is only worth it
+# for exports with more than PARALLEL_ROW_THRESHOLDS rows - far fewer for the slow row-by-row engine.
+# Each worker gets PARTITIONS_PER_JOB partitions so that one slow partition does not hold up the rest.
+
+PARALLEL_ROW_THRESHOLDS: Dict[str, int] = {"columns": 50000, "rows": 1000}
+PARTITIONS_PER_JOB:      int = 2
+PARTITION_CONTEXT:       Dict[str, object] = {}
+
+
+def set_partition_context(header: Dict[str, List[int]], Q_cols: Dict[str, List[int]], columns: Dict[str, int],
+                          engine: str, catalogue: UnitCodeCatalogue = None, records: any = None, level: int = logging.NOTSET) -> None:
+    PARTITION_CONTEXT.update({"header": header, "Q_cols": Q_cols, "columns": columns, "engine": engine})
+    set_unit_catalogue(catalogue)
+    start_worker_logging(records, level)
+
+
+# ~ ~ ~ >
+# Worker - both engines build their partition from the header index, response columns and required
+# columns that were found once in the parent
+
+
+def build_partition_request_frame(partition: DataFrame) -> DataFrame:
+    if PARTITION_CONTEXT["engine"] == "rows":
+        return requests_to_frame(build_student_request_rows(partition, PARTITION_CONTEXT["header"], PARTITION_CONTEXT["Q_cols"],
+                                                            PARTITION_CONTEXT["columns"], False))
+    return build_request_chunk(partition, PARTITION_CONTEXT["header"], PARTITION_CONTEXT["Q_cols"], PARTITION_CONTEXT["columns"], False)
+
+
+# - - - - - - >
+
+
+def build_request_frame_in_parallel(qualtrics: DataFrame, display: bool, engine: str, jobs: int) -> DataFrame:
+    columns:    Dict[str, int] = resolve_qualtrics_columns(qualtrics.columns)
+    header:     Dict[str, List[int]] = build_header_index(extract_top_row(qualtrics))
+    students:   DataFrame = delete_top_row(qualtrics)
+    Q_cols:     Dict[str, List[int]] = locate_response_columns(students, display_index = True,
+                                                               response_max = 100)
+    bounds:     List[Array] = numpy.array_split(numpy.arange(len(students)), jobs * PARTITIONS_PER_JOB)
+    partitions: List[DataFrame] = [students.iloc[positions] for positions in bounds if len(positions)]
+    LOGGER.info(f"Building {len(students)} requests in {len(partitions)} partitions across {jobs} worker processes")
+
+    with PROFILER.stage("build requests (parallel)", len(students)), worker_logging() as (records, level):
+        with ProcessPoolExecutor(max_workers = jobs, mp_context = multiprocessing.get_context("spawn"), initializer = set_partition_context,
+                                 initargs = (header, Q_cols, columns, engine, UNIT_CATALOGUE, records, level)) as pool:
+            frames: List[DataFrame] = []
+            for built in pool.map(build_partition_request_frame, partitions):
+                frames.append(built)
+                PROGRESS.rows(sum(len(part) for part in frames), len(students))
+            frame: DataFrame = pandas.concat(frames, ignore_index = True)
+
+    # The workers log the requests they build (see worker_logging()), but do not display them, so
+    # that is done here instead
+    if display:
+        for req in requests_from_frame(frame):
+            print(req)
+
+    return frame
+
+
+# - - - - - - >
+# Write the parsed Student Requests out to a spreadsheet, formatted following the "Tracker" (or the
+# one-row-per-assessment alternative, if that layout was asked for), merged into an existing Tracker
+# if one is given. Returns the path of the written Tracker.
+
+def emit_tracker(frame: DataFrame, output_directory: str, layout: str = "students", width_sample: int = None,
+                 incremental: bool = False, merge_into: str = None) -> str:
+    with PROFILER.stage("build tracker", len(frame)):
+        tracker:        DataFrame = build_tracker(frame, layout)
+        N_applications: int = len(frame)
+
+    if merge_into is not None:
+        with PROFILER.stage("merge", len(tracker)):
+            tracker = merge_trackers(read_existing_tracker(merge_into), tracker)
+            N_applications = count_tracker_applications(tracker)
+
+    output_filename: str = create_output_filename(output_directory, N_applications, layout, incremental)
+
+    print(f"Emitting to: {os.path.basename(output_filename)}")
+
+    write_tracker_spreadsheet(tracker, output_filename, width_sample, N_applications)
+    return output_filename
+
+
+# - - - - - - >
+# Run the whole pipeline on a single Qualtrics export: read it, strip the junk rows, build the
+# StudentRequests and write the Tracker spreadsheet to the output directory. The path of the
+# written Tracker is returned. Any missing columns are raised as a ColumnNameError so that the
+# caller can decide how to report them (message-box in the GUI, exit code in batch mode).
+
+def process_qualtrics_file(qualtrics_path: str, output_directory: str, display: bool, engine: str = "columns", projected: bool = True,
+                           excel_engine: str = None, cache_directory: str = QUALTRICS_CACHE_DIRECTORY, width_sample: int = None,
+                           layout: str = "students", incremental: bool = False, merge_into: str = None, jobs: int = None,
+                           column_profile: str = None) -> str:
+    LOGGER.info(f"Starting up: [{current_datetime()}]")
+
+    ensure_reader_dependencies()
+    qualtrics: DataFrame = read_cleaned_qualtrics(qualtrics_path, projected, excel_engine, cache_directory, column_profile)
+
+    # For an incremental run, drop every student row that an earlier run has already processed - if
+    # there are none left then there is nothing to write (and None is returned instead of a filename)
+    if incremental:
+        state:    Dict[str, any] = load_incremental_state(output_directory)
+        students: DataFrame = delete_top_row(qualtrics)
+        students = students[new_submissions_mask(students, state)]
+        LOGGER.info(f"{len(students)} new submissions since the last run")
+
+        if len(students) == 0:
+            print("No new submissions since the last run - nothing to write")
+            return None
+        qualtrics = pandas.concat([extract_top_row(qualtrics), students])
+
+    # Parse the raw Qualtrics output data into the Tracker layout, and write it out
+    frame:           DataFrame = build_qualtrics_request_frame(qualtrics, display, engine, jobs)
+    output_filename: str = emit_tracker(frame, output_directory, layout, width_sample, incremental, merge_into)
+
+    if incremental:
+        record_submissions(state, students)
+        save_incremental_state(output_directory, state)
+
+    LOGGER.info(f"Closing down: [{current_datetime()}]")
+
+    return output_filename
+
+
+# - - - - - - >
+# CSV exports can instead be processed a chunk of rows at a time, so that neither the whole export
+# nor the whole Tracker ever has to be held in memory - only CSV_CHUNK_ROWS rows (or as many as fit
+# within a memory limit, if one is given) at a time. The header row and the ImportId junk are at the
+# top of the first chunk, so they are dealt with once there, and every later chunk is student rows.
+# Every column is read as strings: left to guess, pandas can decide that e.g. the Student IDs in one
+# chunk are numbers (and then write them as "12345678.0") when they were text in the chunk before.
+# CHUNK_MEMORY_OVERHEAD is a rough allowance for the copies made while building each chunk, and
+# with a memory limit the first chunk is only CSV_PROBE_ROWS long so that it can be measured safely.
+
+CSV_CHUNK_ROWS:        int = 5000
+CSV_CHUNK_MINIMUM:     int = 2 + QUALTRICS_JUNK_SCAN_ROWS
+CSV_PROBE_ROWS:        int = 200
+CHUNK_MEMORY_OVERHEAD: int = 4
+
+
+# - - - - - - >
+# How many rows to read per chunk to stay within memory_limit (in MB), judging by the size of the
+# first chunk. Without a limit this is simply the requested chunksize.
+
+def rows_within_memory_limit(chunk: DataFrame, memory_limit: float, chunksize: int) -> int:
+    if not memory_limit or len(chunk) == 0:
+        return chunksize
+
+    bytes_per_row: float = chunk.memory_usage(deep = True).sum() / len(chunk)
+    rows: int = int((memory_limit * 1024 * 1024) / (bytes_per_row * CHUNK_MEMORY_OVERHEAD))
+    return max(CSV_CHUNK_MINIMUM, min(rows, chunksize))
+
+
+# - - - - - - >
+
+
+def process_qualtrics_csv_in_chunks(qualtrics_path: str, output_directory: str, display: bool,
+                                    chunksize: int = CSV_CHUNK_ROWS, memory_limit: float = None, projected: bool = True,
+                                    width_sample: int = None, layout: str = "students", incremental: bool = False,
+                                    merge_into: str = None, column_profile: str = None) -> str:
+    LOGGER.info(f"Starting up: [{current_datetime()}] (reading '{os.path.basename(qualtrics_path)}' in chunks)")
+
+    preview: DataFrame = pandas.read_csv(qualtrics_path, nrows = 1 + QUALTRICS_JUNK_SCAN_ROWS, dtype = str)
+    profile: str = choose_column_profile(preview.columns, column_profile)
+    usecols: List[int] = None
+    dtypes:  Dict[str, any] = str
+    if projected:
+        usecols, dtypes = qualtrics_projection(preview, profile)
+
+    # Every chunk has the same columns, so how to translate them into the current layout is worked out once
+    plan:    Tuple[List[int], List[str]] = None
+    header:  Dict[str, List[int]] = None
+    Q_cols:  Dict[str, List[int]] = None
+    columns: Dict[str, int] = None
+    writer:  TrackerStreamWriter = None
+    state:   Dict[str, any] = load_incremental_state(output_directory) if incremental else None
+    done:    List[DataFrame] = []
+    existing: DataFrame = read_existing_tracker(merge_into) if merge_into is not None else None
+    rows:    int = max(chunksize, CSV_CHUNK_MINIMUM)
+    first:   int = min(rows, CSV_PROBE_ROWS) if memory_limit else rows
+
+    try:
+        with pandas.read_csv(qualtrics_path, usecols = usecols, dtype = dtypes, chunksize = rows) as reader:
+            while True:
+                try:
+                    with PROFILER.stage("read") as stage:
+                        chunk: DataFrame = reader.get_chunk(rows if header is not None else first)
+                        stage["rows"] = len(chunk)
+                except StopIteration:
+                    break
+
+                if plan is None:
+                    plan = column_profile_plan(chunk.columns, profile)
+                chunk = apply_column_plan(chunk, plan)
+
+                # First chunk only - remove the junk, take the header off the top and find the response columns
+                if header is None:
+                    with PROFILER.stage("drop junk rows", len(chunk)):
+                        chunk  = drop_junk_rows(chunk)
+                    with PROFILER.stage("locate response columns"):
+                        columns = resolve_qualtrics_columns(chunk.columns)
+                        header = build_header_index(extract_top_row(chunk))
+                        chunk  = delete_top_row(chunk)
+                        Q_cols = locate_response_columns(chunk, display_index = True, response_max = 100)
+                    rows   = rows_within_memory_limit(chunk, memory_limit, rows)
+                    LOGGER.info(f"Reading {rows} rows per chunk")
+
+                if incremental:
+                    chunk = chunk[new_submissions_mask(chunk, state)]
+                    done.append(chunk[[COLNAME_PREFIX_RESPONSEID, COLNAME_PREFIX_DATESUBMITTED]])
+
+                with PROFILER.stage("build requests", len(chunk)):
+                    frame:   DataFrame = build_request_chunk(chunk, header, Q_cols, columns, display)
+                with PROFILER.stage("build tracker", len(frame)):
+                    tracker: DataFrame = build_tracker(frame, layout)
+                N_applications: int = len(frame)
+                if writer is None:
+                    colnames: List[str] = list(tracker.columns)
+                    if existing is not None:
+                        colnames = colnames + [colname for colname in existing.columns if colname not in colnames]
+                    writer = TrackerStreamWriter(output_directory, colnames, width_sample, layout, incremental)
+
+                    # When merging, the existing Tracker goes in first (as it is), then only the new rows
+                    if existing is not None:
+                        writer.write(existing, count_tracker_applications(existing))
+                if existing is not None:
+                    with PROFILER.stage("merge", len(tracker)):
+                        tracker = new_tracker_rows(existing, tracker)
+                        N_applications = tracker.index.nunique()
+                with PROFILER.stage("write xlsx", len(tracker)):
+                    writer.write(tracker, N_applications)
+                LOGGER.info(f"Written {writer.students} students so far")
+
+    except BaseException:
+        if writer is not None:
+            writer.discard()
+        raise
+
+    if writer is None:
+        raise ValueError(f"'{os.path.basename(qualtrics_path)}' does not contain any rows")
+
+    if incremental and writer.students == 0:
+        writer.discard()
+        print("No new submissions since the last run - nothing to write")
+        return None
+
+    with PROFILER.stage("finish xlsx", writer.rows):
+        output_filename: str = writer.close()
+
+    if incremental:
+        record_submissions(state, pandas.concat(done))
+        save_incremental_state(output_directory, state)
+
+    print(f"Emitting to: {os.path.basename(output_filename)}")
+    LOGGER.info(f"Closing down: [{current_datetime()}]")
+    return output_filename
 
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Several exports at once. Exports often come separately per division or per semester, so the batch
+# entry point also takes a directory or a glob of them. Reading a '.xlsx' is CPU-bound (and pandas
+# only uses the one core for it), so each export is read and parsed in its own worker process of a
+# ProcessPoolExecutor. Either every export gets its own Tracker, in a sub-directory of the output
+# directory named after it (so that their filenames, and incremental states, cannot clash), or the
+# workers hand their request frames back and a single merged Tracker is written from all of them.
+# Workers are always started with "spawn" - the default on Windows, where this is normally run - so
+# that they behave the same everywhere, and do not inherit the parent's logfile handlers.
+
+MULTIPLE_EXPORT_SKIP_PREFIXES: List[str] = ["~$", "Mitigating Circumstances Tracker"]
+
+
+def expand_input_paths(inputs: List[str]) -> List[str]:
+    paths: List[str] = []
+
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            matches: List[str] = sorted(os.path.join(pattern, name) for name in os.listdir(pattern)
+                                        if os.path.splitext(name)[1] in VALID_INPUT_EXTENSIONS)
+        elif glob.has_magic(pattern):
+            matches: List[str] = sorted(glob.glob(pattern))
+        else:
+            matches: List[str] = [pattern]
+
+        # Skip Excel's lock files, and any Trackers which have been written alongside the exports
+        for path in matches:
+            if path not in paths and not any(os.path.basename(path).startswith(prefix) for prefix in MULTIPLE_EXPORT_SKIP_PREFIXES):
+                paths.append(path)
+
+    return paths
+
+
+# - - - - - - >
+# Name of the sub-directory each export's Tracker is written to - the export's own name, numbered
+# if two exports share a name (e.g. the '.csv' and '.xlsx' of the same export)
+
+def export_subdirectories(qualtrics_paths: List[str]) -> Dict[str, str]:
+    names: Dict[str, str] = {}
+
+    for path in qualtrics_paths:
+        stem:  str = os.path.splitext(os.path.basename(path))[0]
+        name:  str = stem
+        count: int = 1
+        while name in names.values():
+            count = count + 1
+            name  = f"{stem} ({count})"
+        names[path] = name
+
+    return names
+
+
+# - - - - - - >
+# Worker for the merged Tracker: read and parse one export, and return its request frame
+
+
+def read_export_request_frame(qualtrics_path: str, engine: str, projected: bool, excel_engine: str, cache_directory: str,
+                              column_profile: str = None) -> DataFrame:
+    ensure_reader_dependencies()
+    qualtrics: DataFrame = read_cleaned_qualtrics(qualtrics_path, projected, excel_engine, cache_directory, column_profile)
+    return build_qualtrics_request_frame(qualtrics, False, engine)
+
+
+# ~ ~ ~ >
+# Worker for one Tracker per export
+
+
+def process_export_to_subdirectory(qualtrics_path: str, subdirectory: str, options: Dict[str, any]) -> str:
+    os.makedirs(subdirectory, exist_ok = True)
+    return process_qualtrics_file(qualtrics_path, subdirectory, False, **options)
+
+
+# ~ ~ ~ >
+# Initializer for the export workers - they share the cache directory, so do not evict from it
+
+
+def start_export_worker(catalogue: UnitCodeCatalogue, records: any = None, level: int = logging.NOTSET) -> None:
+    global QUALTRICS_CACHE_EVICTING
+    QUALTRICS_CACHE_EVICTING = False
+    set_unit_catalogue(catalogue)
+    start_worker_logging(records, level)
+
+
+# - - - - - - >
+# Process every one of the exports, using up to "jobs" worker processes. Returns the written Tracker
+# filenames, and the exception raised for each export that could not be processed (a failure in one
+# export does not stop the others). With merge_outputs, a merged Tracker is only written if every
+# export could be read.
+
+def process_qualtrics_files(qualtrics_paths: List[str], output_directory: str, jobs: int = None, merge_outputs: bool = False,
+                            engine: str = "columns", projected: bool = True, excel_engine: str = None,
+                            cache_directory: str = QUALTRICS_CACHE_DIRECTORY, width_sample: int = None,
+                            layout: str = "students", incremental: bool = False, merge_into: str = None,
+                            column_profile: str = None) -> Tuple[List[str], Dict[str, Exception]]:
+    workers:  int = max(1, min(jobs or os.cpu_count() or 1, len(qualtrics_paths)))
+    outputs:  List[str] = []
+    failures: Dict[str, Exception] = {}
+    results:  Dict[str, any] = {}
+    LOGGER.info(f"Processing {len(qualtrics_paths)} exports with {workers} worker processes")
+
+    with PROFILER.stage("process exports (workers)"), worker_logging() as (records, level), \
+         ProcessPoolExecutor(max_workers = workers, mp_context = multiprocessing.get_context("spawn"),
+                             initializer = start_export_worker, initargs = (UNIT_CATALOGUE, records, level)) as pool:
+        if merge_outputs:
+            futures = {path: pool.submit(read_export_request_frame, path, engine, projected, excel_engine, cache_directory, column_profile)
+                       for path in qualtrics_paths}
+        else:
+            options: Dict[str, any] = {"engine": engine, "projected": projected, "excel_engine": excel_engine, "cache_directory": cache_directory,
+                                       "width_sample": width_sample, "layout": layout, "incremental": incremental, "column_profile": column_profile}
+            subdirectories: Dict[str, str] = export_subdirectories(qualtrics_paths)
+            futures = {path: pool.submit(process_export_to_subdirectory, path, os.path.join(output_directory, subdirectories[path]), options)
+                       for path in qualtrics_paths}
+
+        for path, future in futures.items():
+            try:
+                results[path] = future.result()
+                LOGGER.info(f"Finished '{os.path.basename(path)}'")
+            except Exception as expt:
+                LOGGER.error(f"Failed to process '{path}': {type(expt).__name__}: {expt}")
+                failures[path] = expt
+
+    if cache_directory is not None and os.path.isdir(cache_directory):
+        evict_cached_qualtrics(cache_directory)
+
+    if not merge_outputs:
+        return [output for output in results.values() if output is not None], failures
+
+    if not failures:
+        # The frames are concatenated in the order the exports were given, so the merged Tracker
+        # is in the same order as it would be if the exports had been pasted together by hand
+        frame: DataFrame = pandas.concat([results[path] for path in qualtrics_paths], ignore_index = True)
+        outputs.append(emit_tracker(frame, output_directory, layout, width_sample, False, merge_into))
+
+    return outputs, failures
+
+
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
-# Set up the main window - ensure the window always displays on top (-topmost), and disable
-# resizing in the X and Y directions
-parent = tk.Tk()
-parent.title("Mitigating Circumstances")
-parent.geometry("360x375")
-parent.call('wm', 'attributes', '.', '-topmost', '1')
-parent.resizable(width = False, height = False)
-
-
-# Attempt to apply a background image to the main window
-# By default, there *should* be a folder named "Assets" in the same directory as this
-# source file. If the file does exist in this subfolder, then place this on the parent
-# window. Otherwise, do nothing / leave the parent window background plain grey
-current_directory: str = os.getcwd()
-previous_directory: str = os.path.dirname(current_directory)
-background_imagepath: str = os.path.join(previous_directory, "Mitigations", "Assets", "background2.png")
-
-if object_exists(background_imagepath, suppress = False):
-    background_image = tk.PhotoImage(file = background_imagepath)
-    background_label = tk.Label(parent, image = background_image)
-    background_label.place(x = 0, y = 0)
-
-
-# Entry box & button for the filepath to the mitigating circumstances Excel file
-# this should be the raw file as emitted by Qualtrics
-input_requests_label = tk.Label(parent, text = "MitCircs Qualtrics Input Excel File:")
-input_requests_label.pack()
-input_requests_entry = tk.Entry(parent)
-input_requests_entry.pack()
-input_requests_button = tk.Button(parent, text = "Select", command = select_spreadsheet_file_window)
-input_requests_button.pack()
-
-
-# Entry box & button for the path to the directory where the cleaned-up / processed
-# output spreadsheet should be written to. If no Output location is selected, then
-# this will default to the same folder that contains the Mitigating Circumstances file
-output_directory_label = tk.Label(parent, text = "Output Folder Location:")
-output_directory_label.pack()
-output_directory_entry = tk.Entry(parent)
-output_directory_entry.pack()
-output_directory_button = tk.Button(parent, text = "Browse...", command = select_output_folder_window)
-output_directory_button.pack()
-
-
-# The "verbose" option - causes the program to display iteration-by-iteration information
-# printed to the terminal as the request-builder and cleanup functions run. Only really
-# relevant during debugging and while adding program features so can be enabled / disabled
-# with this checkbox to run the program "quietly"
-display_running_information = tk.BooleanVar()
-display_running_information_checkbox = tk.Checkbutton(parent, text = "Display Information as Program Runs?",
-                                                      variable = display_running_information, onvalue = True, offvalue = False,
-                                                      command = check_verbose_running_flag)
-display_running_information_checkbox.pack()
-
-
-# Useful information on each request can be written to a logfile - the user can select
-# here whether they would like this to be done. If so, a logfile will be created in the
-# specified output folder with the current date and time as filename
-write_logfile_flag = tk.BooleanVar()
-write_logfile_flag_checkbox = tk.Checkbutton(parent, text = "Write Cleanup Info. to Logfile?",
-                                             variable = write_logfile_flag, onvalue = True, offvalue = False,
-                                             command = check_logfile_flag)
-write_logfile_flag_checkbox.pack()
-
-
-# Two possible formats for the output spreadsheet were provided - in the first, each
-# assessment that the student applies for is written to a separate cell in the output
-# sheet, with their name and identifying information on only the top row.
-# In the second, all of the assessments that the student applies for are written into
-# the *same* cell so that everything is kept on one row, with assessments separated
-# only by newlines within the cell.
-# Apparently the second format is preferable, but this toggle allows the user to select
-# the first, separate-row output format if they would prefer
-alternative_output_format = tk.BooleanVar()
-alternative_output_format_checkbox = tk.Checkbutton(parent, text = "Use Alternative Output Format?",
-                                                    variable = alternative_output_format, onvalue = True, offvalue = False,
-                                                    command = check_alternative_output_flag)
-#alternative_output_format_checkbox.pack()
-
-
-# In the new (Nov. 2024) test data, there is an additional 3rd row below the header
-# which appears to basically contain junk from the Qualtrics export. This option
-# indicates whether we should attempt to search for and delete this junk row - if
-# not, we can simply continue with the extraction as expected (1: Rowname, 2: Header,
-# 3: Start of data rows).
-# NOTE: As of the new Q4 2024 / Q1 2025 version this is automatically checked for and
-#       deleted if found - there should be no reason for the user to think about this
-#       themselves, so this code will be commented out until I'm absolutely sure it
-#       is safe to be removed
-delete_junk_rows = tk.BooleanVar()
-delete_junk_rows_checkbox = tk.Checkbutton(parent, text = "Clean Qualtrics junk from input?",
-                                           variable = delete_junk_rows, onvalue = True, offvalue = False,
-                                           command = check_clean_input_flag)
-# delete_junk_rows_checkbox.pack()
-
-
-# Show some useful help windows and images to show expected file and formatting.
-# If the program is reporting issues and errors with the inputs, then start here!
-help_window_button = tk.Button(parent, text = "Show Help", command = show_help_windows)
-#help_window_button.pack()
-
-
-# Run the MitCircs processing program with the inputs specified
-# Firstly checks to ensure that all required inputs are present and can be found
-# on the system. If any inputs are missing or not provided, message-boxes will
-# inform you of the problem and then return to the parent main-loop for you to fix them
-run_main_button = tk.Button(parent, text = "Run!", command = main)
-run_main_button.pack()
-
-
-# Destroy parent window and children, exiting the program
-quit_button = tk.Button(parent, text = "Exit...", command = destroy_window)
-quit_button.pack()
-
-
-# Begin running the parent main-loop, awaiting inputs
-parent.mainloop()
\ No newline at end of file
+# Non-interactive equivalent of the GUI's run_startup_checks(): the same checks are made on the
+# input file and output directory, but problems are written to stderr and returned as an exit
+# code rather than shown in a message-box. There is nobody to ask whether a missing output
+# directory should be created, so this is decided up-front by the create_output flag.
+
+def run_batch_startup_checks(qualtrics: str, output: str, create_output: bool) -> int:
+    _, extension = os.path.splitext(qualtrics)
+
+    if extension not in VALID_INPUT_EXTENSIONS:
+        print(f"Error: File '{os.path.basename(qualtrics)}' is not of the required type! Compatible files are '.xlsx' or '.csv'", file = sys.stderr)
+        return EXIT_INPUT_FILETYPE
+
+    if not object_exists(qualtrics, suppress = True):
+        print(f"Error: Qualtrics file '{qualtrics}' missing! Check path and retry...", file = sys.stderr)
+        return EXIT_INPUT_MISSING
+
+    if not object_exists(output, suppress = True):
+        if not create_output:
+            print(f"Error: Output directory '{output}' does not exist.", file = sys.stderr)
+            return EXIT_OUTPUT_DIRECTORY
+        try:
+            os.makedirs(output)
+        except OSError as oserr:
+            print(f"Error: Could not create output directory '{output}'\n  > {oserr}", file = sys.stderr)
+            return EXIT_OUTPUT_DIRECTORY
+
+    return EXIT_SUCCESS
+
+
+# - - - - - - >
+
+
+def parse_arguments(argv: List[str]) -> Arguments:
+    parser = argparse.ArgumentParser(prog = "mitcircs", description = "Convert Qualtrics Mitigating Circumstances exports into a Tracker spreadsheet.")
+    subparsers = parser.add_subparsers(dest = "command", required = True)
+
+    process = subparsers.add_parser("process", help = "Process a Qualtrics export without opening the GUI")
+    process.add_argument("input", nargs = "+", help = "Path to the Qualtrics export ('.xlsx' or '.csv'), or several exports / directories / globs of them")
+    process.add_argument("--out", required = True, help = "Directory the Tracker spreadsheet is written to")
+    process.add_argument("--verbose", action = "store_true", help = "Print each request to the console as it is built")
+    process.add_argument("--log", action = "store_true", help = "Write cleanup information to a logfile in the output directory")
+    process.add_argument("--log-level", choices = LOG_LEVELS, default = "DEBUG", help = "Least severe messages written to the logfile (default: everything)")
+    process.add_argument("--log-json", action = "store_true", help = "Write the logfile as JSON lines rather than plain text")
+    process.add_argument("--log-flush", type = int, default = LOG_FLUSH_EVERY, metavar = "N", help = f"Write the logfile out every N messages (default: {LOG_FLUSH_EVERY})")
+    process.add_argument("--no-create-output", action = "store_true", help = "Fail rather than create a missing output directory")
+    process.add_argument("--engine", choices = REQUEST_ENGINES, default = "columns", help = "Request builder to use: column-wise (default) or the original row-by-row loop")
+    process.add_argument("--chunksize", type = int, metavar = "ROWS", help = f"Read a '.csv' export this many rows at a time, writing the Tracker as it goes (default when --max-memory is given: {CSV_CHUNK_ROWS})")
+    process.add_argument("--max-memory", type = float, metavar = "MB", help = "Read a '.csv' export in chunks sized to stay roughly within this much memory")
+    process.add_argument("--all-columns", action = "store_true", help = "Read every column of the export, not just the ones the Tracker needs")
+    process.add_argument("--layout", choices = TRACKER_LAYOUTS, default = "students", help = "One row per student (default), or one row per assessment ('Option 2')")
+    process.add_argument("--incremental", action = "store_true", help = "Only process submissions that earlier --incremental runs into the same output directory have not")
+    process.add_argument("--merge-into", metavar = "TRACKER", help = "Keep every row of this existing Tracker (with the panel's edits) and append only the applications it does not have yet")
+    process.add_argument("--width-sample", type = int, metavar = "ROWS", help = "Size the Tracker columns from a random sample of this many rows rather than every row")
+    process.add_argument("--no-cache", action = "store_true", help = "Always re-read the export rather than using a cached copy from an earlier run")
+    process.add_argument("--cache-dir", default = QUALTRICS_CACHE_DIRECTORY, metavar = "DIR", help = f"Where cached copies of exports are kept (default: {QUALTRICS_CACHE_DIRECTORY})")
+    process.add_argument("--jobs", type = int, metavar = "N", help = "Worker processes to use: one export per worker for several exports (default: one per "
+                                                                      "CPU core), or partitions of the rows of one large export (default: no workers)")
+    process.add_argument("--merge-outputs", action = "store_true", help = "Write one merged Tracker for all of the exports, rather than one each")
+    process.add_argument("--unit-catalogue", metavar = "CSV", help = f"Resolve malformed unit codes against this catalogue of real ones (a '{UNIT_CATALOGUE_CODE_COLUMN}' column, "
+                                                                      f"and optionally {' / '.join(repr(colname) for colname in UNIT_CATALOGUE_NAME_COLUMNS)})")
+    process.add_argument("--profile", action = "store_true", help = "Print how long each stage took (and its peak memory) and write this to a JSON report in the output directory")
+    process.add_argument("--tracemalloc", action = "store_true", help = "As --profile, and also record the peak of Python's own memory allocations in each stage")
+    process.add_argument("--cprofile", action = "store_true", help = "As --profile, and also profile every function call with cProfile and write the statistics to a '.prof' file")
+    process.add_argument("--column-profile", choices = list(COLUMN_PROFILES), help = "Version of the Qualtrics form the export was written with (default: detected from its columns)")
+    process.add_argument("--excel-engine", choices = list(XLSX_READER_ENGINES), help = "Engine used to read a '.xlsx' export (default: the fastest one installed)")
+
+    subparsers.add_parser("gui", help = "Open the Mitigating Circumstances window (the default with no arguments)")
+
+    return parser.parse_args(argv)
+
+
+# - - - - - - >
+# Entry point for "python -m mitcircs process <input> --out <dir>". Returns the exit code rather
+# than calling exit() itself so that it can also be driven from other scripts.
+
+def batch_main(arguments: Arguments) -> int:
+    inputs: List[str] = expand_input_paths(arguments.input)
+    if not inputs:
+        print(f"Error: No Qualtrics exports found in {arguments.input}", file = sys.stderr)
+        return EXIT_INPUT_MISSING
+
+    # --tracemalloc and --cprofile only add to the --profile report, so either one turns it on
+    arguments.profile = arguments.profile or arguments.tracemalloc or arguments.cprofile
+
+    if len(inputs) > 1 or arguments.merge_outputs:
+        return batch_main_multiple(arguments, inputs)
+
+    qualtrics: str = inputs[0]
+    status:    int = run_batch_startup_checks(qualtrics, arguments.out, not arguments.no_create_output)
+    if status != EXIT_SUCCESS:
+        return status
+
+    if arguments.merge_into is not None and not object_exists(arguments.merge_into, suppress = True):
+        print(f"Error: Tracker to merge into '{arguments.merge_into}' missing! Check path and retry...", file = sys.stderr)
+        return EXIT_INPUT_MISSING
+
+    if arguments.log:
+        configure_logging(arguments.out, arguments.log_level, arguments.log_json, arguments.log_flush)
+
+    # Loaded once the logfile is open, so that what was loaded is in it
+    if arguments.unit_catalogue is not None:
+        status: int = load_batch_unit_catalogue(arguments.unit_catalogue)
+        if status != EXIT_SUCCESS:
+            shutdown_logging()
+            return status
+
+    if arguments.profile:
+        configure_profiling(arguments.tracemalloc, arguments.cprofile)
+
+    chunked: bool = arguments.chunksize is not None or arguments.max_memory is not None
+    if chunked and not qualtrics.endswith(".csv"):
+        print("Warning: --chunksize / --max-memory only apply to '.csv' exports - reading the whole file instead", file = sys.stderr)
+        chunked = False
+
+    try:
+        if chunked:
+            output_filename: str = process_qualtrics_csv_in_chunks(qualtrics, arguments.out, arguments.verbose,
+                                                                   arguments.chunksize or CSV_CHUNK_ROWS, arguments.max_memory,
+                                                                   not arguments.all_columns, arguments.width_sample,
+                                                                   arguments.layout, arguments.incremental, arguments.merge_into,
+                                                                   arguments.column_profile)
+        else:
+            output_filename: str = process_qualtrics_file(qualtrics, arguments.out, arguments.verbose, arguments.engine,
+                                                          not arguments.all_columns, arguments.excel_engine,
+                                                          None if arguments.no_cache else arguments.cache_dir, arguments.width_sample,
+                                                          arguments.layout, arguments.incremental, arguments.merge_into,
+                                                          arguments.jobs, arguments.column_profile)
+    except ColumnNameError as cerr:
+        print(f"Column Name Error: {cerr}", file = sys.stderr)
+        return EXIT_COLUMN_ERROR
+    except Exception as expt:
+        LOGGER.exception(f"Failed to process '{qualtrics}'")
+        print(f"Error: Failed to process '{qualtrics}'\n  > {type(expt).__name__}: {expt}", file = sys.stderr)
+        return EXIT_FAILURE
+    finally:
+        finish_profiling(arguments.out, qualtrics)
+        shutdown_logging()
+
+    if output_filename is not None:
+        print(f"[{current_datetime()}] Tracker written to '{output_filename}'")
+    return EXIT_SUCCESS
+
+
+# - - - - - - >
+# Load the --unit-catalogue for batch_main(), reporting any problem with it as an exit code
+
+
+def load_batch_unit_catalogue(filepath: str) -> int:
+    if not object_exists(filepath, suppress = True):
+        print(f"Error: Unit catalogue '{filepath}' missing! Check path and retry...", file = sys.stderr)
+        return EXIT_INPUT_MISSING
+
+    try:
+        set_unit_catalogue(read_unit_catalogue(filepath))
+    except ColumnNameError as cerr:
+        print(f"Column Name Error: {cerr}", file = sys.stderr)
+        return EXIT_COLUMN_ERROR
+
+    LOGGER.info(f"Loaded {len(UNIT_CATALOGUE)} unit codes from '{filepath}'")
+    return EXIT_SUCCESS
+
+
+# - - - - - - >
+# batch_main() for several exports (or --merge-outputs). The exit code is that of the first export
+# that could not be processed, if any - the others are still processed and written regardless.
+
+def batch_main_multiple(arguments: Arguments, inputs: List[str]) -> int:
+    for qualtrics in inputs:
+        status: int = run_batch_startup_checks(qualtrics, arguments.out, not arguments.no_create_output)
+        if status != EXIT_SUCCESS:
+            return status
+
+    if arguments.merge_outputs and arguments.incremental:
+        print("Error: --incremental cannot be used with --merge-outputs", file = sys.stderr)
+        return EXIT_USAGE
+    if arguments.merge_into is not None and not arguments.merge_outputs:
+        print("Error: --merge-into needs --merge-outputs when there are several exports", file = sys.stderr)
+        return EXIT_USAGE
+    if arguments.merge_into is not None and not object_exists(arguments.merge_into, suppress = True):
+        print(f"Error: Tracker to merge into '{arguments.merge_into}' missing! Check path and retry...", file = sys.stderr)
+        return EXIT_INPUT_MISSING
+    if arguments.chunksize is not None or arguments.max_memory is not None:
+        print("Warning: --chunksize / --max-memory only apply to a single '.csv' export - reading the whole files instead", file = sys.stderr)
+
+    if arguments.log:
+        configure_logging(arguments.out, arguments.log_level, arguments.log_json, arguments.log_flush)
+
+    # Loaded once the logfile is open, so that what was loaded is in it
+    if arguments.unit_catalogue is not None:
+        status: int = load_batch_unit_catalogue(arguments.unit_catalogue)
+        if status != EXIT_SUCCESS:
+            shutdown_logging()
+            return status
+
+    if arguments.profile:
+        configure_profiling(arguments.tracemalloc, arguments.cprofile)
+
+    try:
+        outputs, failures = process_qualtrics_files(inputs, arguments.out, arguments.jobs, arguments.merge_outputs,
+                                                    arguments.engine, not arguments.all_columns, arguments.excel_engine,
+                                                    None if arguments.no_cache else arguments.cache_dir, arguments.width_sample,
+                                                    arguments.layout, arguments.incremental, arguments.merge_into,
+                                                    arguments.column_profile)
+    except Exception as expt:
+        LOGGER.exception("Failed to write the merged Tracker")
+        print(f"Error: Failed to write the merged Tracker\n  > {type(expt).__name__}: {expt}", file = sys.stderr)
+        return EXIT_FAILURE
+    finally:
+        finish_profiling(arguments.out, f"{len(inputs)} exports")
+        shutdown_logging()
+
+    for output_filename in outputs:
+        print(f"[{current_datetime()}] Tracker written to '{output_filename}'")
+
+    status: int = EXIT_SUCCESS
+    for qualtrics, expt in failures.items():
+        if isinstance(expt, ColumnNameError):
+            print(f"Column Name Error in '{qualtrics}': {expt}", file = sys.stderr)
+            status = status or EXIT_COLUMN_ERROR
+        else:
+            print(f"Error: Failed to process '{qualtrics}'\n  > {type(expt).__name__}: {expt}", file = sys.stderr)
+            status = status or EXIT_FAILURE
+
+    return status
+
+
+# - - - - - - >
+
+
+def main(argv: List[str] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Running with no arguments (e.g. double-clicking the script) keeps opening the GUI as before
+    if not argv or argv[0] == "gui":
+        import mitcircs_gui
+        mitcircs_gui.launch()
+        return EXIT_SUCCESS
+
+    return batch_main(parse_arguments(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
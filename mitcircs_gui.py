@@ -0,0 +1,449 @@
+"""
+Tkinter front-end for the Mitigating Circumstances program.
+The window is only built when launch() is called, so that mitcircs.py itself can be imported
+and run headless - see "python -m mitcircs process --help" for the batch equivalent.
+"""
+import os
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+from tkinter import filedialog
+from tkinter.messagebox import showinfo
+from mitcircs import (ColumnNameError, PipelineCancelled, LOGGER, PROGRESS, date_today, current_datetime, object_exists,
+                      process_qualtrics_file, configure_logging, shutdown_logging)
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+
+
+def run_startup_checks(qualtrics: str, output: str, logging: bool, verbose: bool) -> None:
+    startup_error: bool = False
+    info_message: str = date_today()
+
+    # Firstly, check whether the user selected an output directory. If not, prompt them
+    # again to select one. If, for whatever reason, they select 'No' here, then close down
+    # the window and exit the program. Return 0 as this is not technically an error.
+    if not output:
+        result = tk.messagebox.askquestion("Select Directory", "No Output folder was selected!\nSelect one now?", icon = "warning")
+        if result == "yes":
+            select_output_folder_window()
+            output = output_directory_entry.get()
+        else:
+            destroy_window()
+            exit(0)
+
+    # As with the Output directory above, we also prompt the user to select a Qualtrics file
+    # if they have not done this already, and exit the program if they choose not to do so.
+    if not qualtrics:
+        result = tk.messagebox.askquestion("Select Spreadsheet", "No Qualtrics Spreadsheet was selected!\nSelect one now?", icon = "warning")
+        if result == "yes":
+            select_spreadsheet_file_window()
+            qualtrics = input_requests_entry.get()
+        else:
+            destroy_window()
+            exit(0)
+    
+    # Second, ensure that the input Qualtrics file is actually of the expected type (an Excel .xlsx file, or 
+    # a Comma-Separated .csv file), and then ensure that the path actually points to a file that exists.
+    # Show a helpful error window and exit the program if any of these checks fail.
+    try:
+        _, extension = os.path.splitext(qualtrics)
+
+        if not extension in [".xlsx", ".csv"]:
+            filetype_error_message: str = f"File '{os.path.basename(qualtrics)}' is not of the required type!\nCompatible files are '.xlsx' or '.csv'"
+            tk.messagebox.showinfo(title = "Error!", message = filetype_error_message)
+            startup_error = True
+
+    except Exception as expt:
+        print(f"Filepath error!\n  > Exception: '{expt}'")
+        file_error_message: str = f"Path to file '{os.path.basename(qualtrics)}' is malformed!\nCheck the filepath and retry."
+        tk.messagebox.showinfo(title = "Error!", message = file_error_message)
+        startup_error = True
+
+    if object_exists(qualtrics, suppress = True):
+        info_message = info_message + f"\nQualtrics file '{os.path.basename(qualtrics)}': Found"
+    else:
+        info_message = info_message + f"\nQualtrics file '{os.path.basename(qualtrics)}' missing! Check path and retry..."
+        startup_error = True
+
+    # Finally, check if the selected Output directory currently exists. If it does
+    # not, then display a message box asking the user if they would like it to be
+    # created. If, for some reason, they select 'no', then this is considered a
+    # startup error which will cause the program to be shut down
+    if object_exists(output, suppress = True):
+        info_message = info_message + f"\nOutput directory '{output}': Found"
+    else:
+        info_message = info_message + f"\nNew Output directory '{output}' was created."
+        result = tk.messagebox.askquestion("Create Directory", "Create New Output Directory?", icon = "warning")
+        if result == 'yes':
+            print("New folder on the way!")
+            os.mkdir(output)
+        else:
+            print("No new folder will be created.\nExiting...")
+            startup_error = True
+            
+    # Once complete, check if we hit any major points of failure and exit if the program
+    # now if so. Otherwise, display the accrued startup information message to the user.            
+    if startup_error:
+        destroy_window()
+        exit(1)
+    else:
+        showinfo("Startup Information...", message = info_message)
+
+
+# - - - - - - >
+# The pipeline runs on a worker thread, so that the window keeps responding (and the run can be
+# cancelled) while a large export is read, built and written - before, the window would show as
+# "Not Responding" until it had finished. Tk is not thread-safe, so the worker never touches the
+# widgets itself: the PROGRESS events, and finally its result, go onto progress_events, which is
+# emptied by poll_progress() on the Tk main-loop every PROGRESS_POLL_MS.
+
+PROGRESS_POLL_MS: int = 100
+
+progress_events: queue.Queue = queue.Queue()
+current_stage:   str = ""
+
+
+def main() -> None:
+    # Run some basic startup checks and display results to the user in an information window
+    # Ensure that the input Qualtrics file exists, that the output folder exists / can be
+    # created, and whether the user has selected logging and / or verbose running.
+    run_startup_checks(input_requests_entry.get(), output_directory_entry.get(), write_logfile_flag.get(), display_running_information.get())
+
+    # Check if the user has requested logging of information as the program runs, and create
+    # this log.txt file in the output folder
+    if write_logfile_flag.get():
+        configure_logging(output_directory_entry.get())
+
+    # The pipeline itself is shared with the batch entry point in mitcircs.py
+    layout: str = "assessments" if alternative_output_format.get() else "students"
+    PROGRESS.reset(lambda *event: progress_events.put(event))
+    set_running(True)
+
+    worker = threading.Thread(target = run_pipeline, daemon = True,
+                              args = (input_requests_entry.get(), output_directory_entry.get(), display_running_information.get(), layout))
+    worker.start()
+    parent.after(PROGRESS_POLL_MS, poll_progress)
+
+
+# ~ ~ ~ >
+# Worker thread - the result is either ("done", <Tracker filename, or None>) or ("failed", <exception>)
+
+
+def run_pipeline(qualtrics: str, output: str, verbose: bool, layout: str) -> None:
+    try:
+        output_filename: str = process_qualtrics_file(qualtrics, output, verbose, layout = layout)
+        progress_events.put(("done", output_filename))
+    except Exception as expt:
+        if not isinstance(expt, (ColumnNameError, PipelineCancelled)):
+            LOGGER.exception(f"Failed to process '{qualtrics}'")
+        progress_events.put(("failed", expt))
+
+
+# ~ ~ ~ >
+
+
+def poll_progress() -> None:
+    global current_stage
+
+    while True:
+        try:
+            event = progress_events.get_nowait()
+        except queue.Empty:
+            break
+
+        # A stage without a row count is shown as busy; the row-by-row loops then fill in the bar
+        if event[0] == "stage":
+            current_stage = event[1].capitalize()
+            progress_label.config(text = f"{current_stage}...")
+            progress_bar.config(mode = "indeterminate")
+            progress_bar.start()
+        elif event[0] == "rows":
+            _, done, total = event
+            progress_bar.stop()
+            progress_bar.config(mode = "determinate", maximum = total, value = done)
+            progress_label.config(text = f"{current_stage}: {done} of {total} rows")
+        else:
+            finish_run(*event)
+            return
+
+    parent.after(PROGRESS_POLL_MS, poll_progress)
+
+
+# ~ ~ ~ >
+# Back on the Tk main-loop once the worker has finished. A missing column is still turned into a
+# message-box and closes the program, as it always has been
+
+
+def finish_run(outcome: str, result: any) -> None:
+    shutdown_logging()
+    PROGRESS.reset()
+    set_running(False)
+
+    if outcome == "done":
+        progress_label.config(text = "No new submissions" if result is None else f"Written: {os.path.basename(result)}")
+    elif isinstance(result, PipelineCancelled):
+        progress_label.config(text = "Cancelled")
+    elif isinstance(result, ColumnNameError):
+        tk.messagebox.showinfo(title = "Column Name Error...", message = str(result))
+        destroy_window()
+        exit(1)
+    else:
+        progress_label.config(text = "Failed!")
+        tk.messagebox.showinfo(title = "Error!", message = f"Failed to process '{os.path.basename(input_requests_entry.get())}'\n{type(result).__name__}: {result}")
+
+
+# ~ ~ ~ >
+
+
+def set_running(running: bool) -> None:
+    run_main_button.config(state = tk.DISABLED if running else tk.NORMAL)
+    cancel_button.config(state = tk.NORMAL if running else tk.DISABLED)
+    if not running:
+        progress_bar.stop()
+        progress_bar.config(mode = "determinate", value = 0)
+
+
+# ~ ~ ~ >
+# The worker stops at its next stage or progress report, see PROGRESS in mitcircs.py. Reading the
+# export is one call into pandas with nothing to report part-way through, so a cancel made while it
+# is being read only takes effect once the read has finished - the label says so.
+
+
+def cancel_run() -> None:
+    PROGRESS.cancel()
+    cancel_button.config(state = tk.DISABLED)
+    if current_stage.startswith("read"):
+        progress_label.config(text = "Cancelling once the export has been read...")
+    else:
+        progress_label.config(text = "Cancelling...")
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+#  Set up the main GUI interface with buttons and text-boxes for entering parameters, files, etc. >
+#       Specify functions to be called on button-press, and entry-point for the main program      >
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+
+def select_spreadsheet_file_window():
+    valid_filetypes = (("Excel", "*.xlsx"), ("CSV", "*.csv"), ("All files", "*.*"))
+    filename = filedialog.askopenfilename(title = "Select a spreadsheet...", filetypes = valid_filetypes)
+
+    # Only show the information window if the user actually selects a file here - if they Cancel out,
+    # this would otherwise just show a blank window which looks busted
+    if filename:
+        showinfo(title = "Reading file...", message = filename)
+
+    input_requests_entry.delete(0, tk.END)
+    input_requests_entry.insert(0, filename)
+
+# - - - - - - >
+
+def select_output_folder_window():
+    output_location = filedialog.askdirectory()
+    output_directory_entry.delete(0, tk.END)
+    output_directory_entry.insert(0, output_location)
+
+# - - - - - - >
+
+def check_verbose_running_flag():
+    check_flag_message: str = None
+
+    if display_running_information.get():
+        check_flag_message = "Additional information will be shown in the command window as the program runs.\nCheck for any issues / errors!"
+        tk.messagebox.showinfo(title = "Information...", message = check_flag_message)
+
+    del(check_flag_message)
+
+# - - - - - - >
+
+def check_logfile_flag():
+    check_logfile_flag_message: str = None
+
+    if write_logfile_flag.get():
+        check_logfile_flag_message = "Each step of the cleanup procedure will be logged to a text file.\nYou will find this in your chosen Output folder."
+        tk.messagebox.showinfo(title = "Information...", message = check_logfile_flag_message)
+
+    del(check_logfile_flag_message)
+
+# - - - - - - >
+
+def check_alternative_output_flag():
+    check_output_flag_message: str = None
+
+    if alternative_output_format.get():
+        check_output_flag_message = "Output spreadsheet will use the alternative formatting ('Option 2')\nThis means each assessment will be written to its own unique row."
+        tk.messagebox.showinfo(title = "Information...", message = check_output_flag_message)
+    
+    del(check_output_flag_message)
+
+# - - - - - - >
+
+def check_clean_input_flag():
+    check_cleaning_flag_message: str = None
+
+    if delete_junk_rows.get():
+        check_cleaning_flag_message = "Junk rows in Qualtrics output will be removed prior to processing (typically Excel Row 3)\n"
+        check_cleaning_flag_message = f"{check_cleaning_flag_message}If unsure, check the Qualtrics output to ensure this is right for your data."
+        tk.messagebox.showinfo(title = "Information...", message = check_cleaning_flag_message)
+
+    del(check_cleaning_flag_message)
+
+# - - - - - - >
+
+def show_help_windows():
+    pass
+
+# - - - - - - >
+
+def destroy_window():
+    print(f"[{current_datetime()}] Closing down...")
+    PROGRESS.cancel()
+    parent.destroy()
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - >
+# Build the window and hand over to the Tk main-loop. The widgets are still module-level globals
+# (the button callbacks above read them directly), they are just no longer created on import.
+
+def launch() -> None:
+    global parent, background_image, input_requests_entry, output_directory_entry
+    global display_running_information, write_logfile_flag, alternative_output_format, delete_junk_rows
+    global run_main_button, cancel_button, progress_bar, progress_label
+
+    # Set up the main window - ensure the window always displays on top (-topmost), and disable
+    # resizing in the X and Y directions
+    parent = tk.Tk()
+    parent.title("Mitigating Circumstances")
+    parent.geometry("360x450")
+    parent.call('wm', 'attributes', '.', '-topmost', '1')
+    parent.resizable(width = False, height = False)
+
+
+    # Attempt to apply a background image to the main window
+    # By default, there *should* be a folder named "Assets" in the same directory as this
+    # source file. If the file does exist in this subfolder, then place this on the parent
+    # window. Otherwise, do nothing / leave the parent window background plain grey
+    current_directory: str = os.getcwd()
+    previous_directory: str = os.path.dirname(current_directory)
+    background_imagepath: str = os.path.join(previous_directory, "Mitigations", "Assets", "background2.png")
+
+    if object_exists(background_imagepath, suppress = False):
+        background_image = tk.PhotoImage(file = background_imagepath)
+        background_label = tk.Label(parent, image = background_image)
+        background_label.place(x = 0, y = 0)
+
+
+    # Entry box & button for the filepath to the mitigating circumstances Excel file
+    # this should be the raw file as emitted by Qualtrics
+    input_requests_label = tk.Label(parent, text = "MitCircs Qualtrics Input Excel File:")
+    input_requests_label.pack()
+    input_requests_entry = tk.Entry(parent)
+    input_requests_entry.pack()
+    input_requests_button = tk.Button(parent, text = "Select", command = select_spreadsheet_file_window)
+    input_requests_button.pack()
+
+
+    # Entry box & button for the path to the directory where the cleaned-up / processed
+    # output spreadsheet should be written to. If no Output location is selected, then
+    # this will default to the same folder that contains the Mitigating Circumstances file
+    output_directory_label = tk.Label(parent, text = "Output Folder Location:")
+    output_directory_label.pack()
+    output_directory_entry = tk.Entry(parent)
+    output_directory_entry.pack()
+    output_directory_button = tk.Button(parent, text = "Browse...", command = select_output_folder_window)
+    output_directory_button.pack()
+
+
+    # The "verbose" option - causes the program to display iteration-by-iteration information
+    # printed to the terminal as the request-builder and cleanup functions run. Only really
+    # relevant during debugging and while adding program features so can be enabled / disabled
+    # with this checkbox to run the program "quietly"
+    display_running_information = tk.BooleanVar()
+    display_running_information_checkbox = tk.Checkbutton(parent, text = "Display Information as Program Runs?",
+                                                          variable = display_running_information, onvalue = True, offvalue = False,
+                                                          command = check_verbose_running_flag)
+    display_running_information_checkbox.pack()
+
+
+    # Useful information on each request can be written to a logfile - the user can select
+    # here whether they would like this to be done. If so, a logfile will be created in the
+    # specified output folder with the current date and time as filename
+    write_logfile_flag = tk.BooleanVar()
+    write_logfile_flag_checkbox = tk.Checkbutton(parent, text = "Write Cleanup Info. to Logfile?",
+                                                 variable = write_logfile_flag, onvalue = True, offvalue = False,
+                                                 command = check_logfile_flag)
+    write_logfile_flag_checkbox.pack()
+
+
+    # Two possible formats for the output spreadsheet were provided - in the first, each
+    # assessment that the student applies for is written to a separate cell in the output
+    # sheet, with their name and identifying information on only the top row.
+    # In the second, all of the assessments that the student applies for are written into
+    # the *same* cell so that everything is kept on one row, with assessments separated
+    # only by newlines within the cell.
+    # Apparently the second format is preferable, but this toggle allows the user to select
+    # the first, separate-row output format if they would prefer
+    alternative_output_format = tk.BooleanVar()
+    alternative_output_format_checkbox = tk.Checkbutton(parent, text = "Use Alternative Output Format?",
+                                                        variable = alternative_output_format, onvalue = True, offvalue = False,
+                                                        command = check_alternative_output_flag)
+    alternative_output_format_checkbox.pack()
+
+
+    # In the new (Nov. 2024) test data, there is an additional 3rd row below the header
+    # which appears to basically contain junk from the Qualtrics export. This option
+    # indicates whether we should attempt to search for and delete this junk row - if
+    # not, we can simply continue with the extraction as expected (1: Rowname, 2: Header,
+    # 3: Start of data rows).
+    # NOTE: As of the new Q4 2024 / Q1 2025 version this is automatically checked for and
+    #       deleted if found - there should be no reason for the user to think about this
+    #       themselves, so this code will be commented out until I'm absolutely sure it
+    #       is safe to be removed
+    delete_junk_rows = tk.BooleanVar()
+    delete_junk_rows_checkbox = tk.Checkbutton(parent, text = "Clean Qualtrics junk from input?",
+                                               variable = delete_junk_rows, onvalue = True, offvalue = False,
+                                               command = check_clean_input_flag)
+    # delete_junk_rows_checkbox.pack()
+
+
+    # Show some useful help windows and images to show expected file and formatting.
+    # If the program is reporting issues and errors with the inputs, then start here!
+    help_window_button = tk.Button(parent, text = "Show Help", command = show_help_windows)
+    #help_window_button.pack()
+
+
+    # Run the MitCircs processing program with the inputs specified
+    # Firstly checks to ensure that all required inputs are present and can be found
+    # on the system. If any inputs are missing or not provided, message-boxes will
+    # inform you of the problem and then return to the parent main-loop for you to fix them
+    run_main_button = tk.Button(parent, text = "Run!", command = main)
+    run_main_button.pack()
+
+
+    # While the program runs, show which stage it has got to (and, for the slower stages, how
+    # many of the rows it has been through) - the Cancel button stops it at the next stage, or the next
+    # progress report, so not until after the export has been read if it is pressed while reading
+    progress_label = tk.Label(parent, text = "")
+    progress_label.pack()
+    progress_bar = ttk.Progressbar(parent, orient = tk.HORIZONTAL, length = 250, mode = "determinate")
+    progress_bar.pack()
+    cancel_button = tk.Button(parent, text = "Cancel", command = cancel_run, state = tk.DISABLED)
+    cancel_button.pack()
+
+
+    # Destroy parent window and children, exiting the program
+    quit_button = tk.Button(parent, text = "Exit...", command = destroy_window)
+    quit_button.pack()
+
+
+    # Begin running the parent main-loop, awaiting inputs
+    parent.mainloop()
+
+
+if __name__ == "__main__":
+    launch()
@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the Mitigating Circumstances tests. Real exports contain student data and cannot
+be shared, so the tests run on the synthetic exports from benchmarks/synthetic_export.py - run from
+the repository root:
+    python -m pytest -q
+"""
+import os
+import sys
+import glob
+import subprocess
+import pytest
+from typing import List
+
+REPOSITORY: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY)
+sys.path.insert(0, os.path.join(REPOSITORY, "benchmarks"))
+
+from synthetic_export import make_synthetic_export, write_synthetic_export
+
+
+# - - - - - - >
+# A small export - enough students and groups to go through every path of both engines, while
+# still being quick to run through the slow row-by-row one
+
+
+@pytest.fixture(scope = "session")
+def synthetic_csv(tmp_path_factory) -> str:
+    return write_synthetic_export(make_synthetic_export(300, groups = 6, seed = 3),
+                                 str(tmp_path_factory.mktemp("exports") / "Synthetic Export.csv"))
+
+
+# - - - - - - >
+# Run "python mitcircs.py process" as the panel would (without touching the cache in the home
+# directory), and return the path of the Tracker it wrote
+
+
+def run_process(inputs: List[str], output_directory: str, *options: str) -> str:
+    completed = subprocess.run([sys.executable, os.path.join(REPOSITORY, "mitcircs.py"), "process", *inputs, "--out", output_directory,
+                                "--no-cache", *options], capture_output = True, text = True, cwd = REPOSITORY)
+    assert completed.returncode == 0, completed.stderr
+
+    trackers: List[str] = glob.glob(os.path.join(output_directory, "*.xlsx"))
+    assert len(trackers) == 1, trackers
+    return trackers[0]
+
+
+# ~ ~ ~ >
+# The cell values of a Tracker - the sheet name first, so that the student counts in it are compared too
+
+
+def tracker_cells(tracker: str) -> List[List[any]]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(tracker, read_only = True)
+    sheet    = workbook.worksheets[0]
+    cells: List[List[any]] = [[sheet.title]] + [list(row) for row in sheet.iter_rows(values_only = True)]
+    workbook.close()
+    return cells
@@ -0,0 +1,32 @@
+"""
+Detecting which version of the Qualtrics form an export was written with (COLUMN_PROFILES).
+"""
+import json
+import os
+import pandas
+
+import mitcircs
+
+
+# - - - - - - >
+# Only the most recently used COLUMN_PROFILE_CACHE_MAX_ENTRIES fingerprints are kept on disk, and
+# using one that is already there makes it the most recent again
+
+
+def test_column_profile_cache_is_pruned(synthetic_csv, tmp_path, monkeypatch):
+    monkeypatch.setattr(mitcircs, "COLUMN_PROFILE_FINGERPRINTS", {})
+    colnames: list = list(pandas.read_csv(synthetic_csv, nrows = 0).columns)
+    exports:  list = [colnames + [f"Embedded Data {number}"] for number in range(mitcircs.COLUMN_PROFILE_CACHE_MAX_ENTRIES + 5)]
+
+    for number, export in enumerate(exports):
+        assert mitcircs.detect_column_profile(export, str(tmp_path)) == mitcircs.DEFAULT_COLUMN_PROFILE
+        if number == 10:
+            mitcircs.detect_column_profile(exports[0], str(tmp_path))
+
+    with open(os.path.join(tmp_path, mitcircs.COLUMN_PROFILE_CACHE_FILENAME), encoding = "utf-8") as file:
+        cached: dict = json.load(file)
+
+    assert len(cached) == mitcircs.COLUMN_PROFILE_CACHE_MAX_ENTRIES
+    assert mitcircs.column_fingerprint(exports[0]) in cached
+    assert mitcircs.column_fingerprint(exports[1]) not in cached
+    assert mitcircs.column_fingerprint(exports[-1]) in cached
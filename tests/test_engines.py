@@ -0,0 +1,55 @@
+"""
+The column-wise request engine (the default) and the original row-by-row one (--engine rows) must
+write exactly the same Tracker - every change to one of them has to be made to the other as well.
+"""
+import pytest
+
+from conftest import run_process, tracker_cells, make_synthetic_export, write_synthetic_export
+
+
+# - - - - - - >
+
+
+@pytest.mark.parametrize("options", [
+    [],
+    ["--layout", "assessments"],
+    ["--chunksize", "70"],
+], ids = ["students", "assessments", "chunked"])
+def test_engines_write_identical_trackers(synthetic_csv, tmp_path, options):
+    columns = run_process([synthetic_csv], str(tmp_path / "columns"), *options)
+    rows    = run_process([synthetic_csv], str(tmp_path / "rows"), "--engine", "rows", *options)
+
+    assert len(tracker_cells(columns)) > 2
+    assert tracker_cells(columns) == tracker_cells(rows)
+
+
+# - - - - - - >
+# With --jobs, an export over PARALLEL_ROW_THRESHOLDS["rows"] has its rows built in partitions, in
+# worker processes, by the row-by-row engine - which must still agree with the (serial) default one
+
+
+def test_engines_agree_with_row_partitions(tmp_path):
+    from mitcircs import PARALLEL_ROW_THRESHOLDS
+
+    export:  str = write_synthetic_export(make_synthetic_export(PARALLEL_ROW_THRESHOLDS["rows"] + 200, groups = 4, seed = 5),
+                                          str(tmp_path / "Large Export.csv"))
+    columns = run_process([export], str(tmp_path / "columns"))
+    rows    = run_process([export], str(tmp_path / "rows"), "--engine", "rows", "--jobs", "2")
+
+    assert tracker_cells(columns) == tracker_cells(rows)
+
+
+# - - - - - - >
+# Merging into an existing Tracker (written by either engine - here the default one) keeps all of its
+# rows and appends the same new applications whichever engine built them
+
+
+def test_engines_merge_identically(synthetic_csv, tmp_path):
+    later: str = write_synthetic_export(make_synthetic_export(350, groups = 6, seed = 4), str(tmp_path / "Later Export.csv"))
+    existing: str = run_process([synthetic_csv], str(tmp_path / "existing"))
+
+    columns = run_process([later], str(tmp_path / "columns"), "--merge-into", existing)
+    rows    = run_process([later], str(tmp_path / "rows"), "--merge-into", existing, "--engine", "rows")
+
+    assert len(tracker_cells(columns)) > len(tracker_cells(existing))
+    assert tracker_cells(columns) == tracker_cells(rows)
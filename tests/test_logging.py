@@ -0,0 +1,44 @@
+"""
+The --log logfile, including what is logged in worker processes.
+"""
+import glob
+import os
+import subprocess
+import sys
+
+from conftest import REPOSITORY, run_process, make_synthetic_export, write_synthetic_export
+
+
+# - - - - - - >
+# Each export is read in its own worker process with --jobs, and what the workers log has to reach
+# the logfile written by the process that started them
+
+
+def test_export_workers_log_to_the_logfile(synthetic_csv, tmp_path):
+    second: str = write_synthetic_export(make_synthetic_export(40, groups = 3, seed = 6), str(tmp_path / "Second Export.csv"))
+    output: str = str(tmp_path / "out")
+    run_process([synthetic_csv, second], output, "--merge-outputs", "--jobs", "2", "--log")
+
+    logfiles: list = glob.glob(os.path.join(output, "MitCircLog_*.txt"))
+    assert len(logfiles) == 1
+    with open(logfiles[0], encoding = "utf-8") as file:
+        logged: str = file.read()
+
+    for export in (synthetic_csv, second):
+        assert f" columns in '{os.path.basename(export)}'" in logged
+    assert logged.count("Request instance") == 340
+
+
+# - - - - - - >
+# Where the logfile is being written is reported on stderr (and in the logfile), not on stdout
+
+
+def test_logfile_path_is_not_on_stdout(synthetic_csv, tmp_path):
+    output:    str = str(tmp_path / "out")
+    completed = subprocess.run([sys.executable, os.path.join(REPOSITORY, "mitcircs.py"), "process", synthetic_csv, "--out", output,
+                                "--no-cache", "--log"], capture_output = True, text = True, cwd = REPOSITORY)
+    assert completed.returncode == 0, completed.stderr
+
+    logfile: str = glob.glob(os.path.join(output, "MitCircLog_*.txt"))[0]
+    assert logfile not in completed.stdout
+    assert f"Logging to '{logfile}'" in completed.stderr
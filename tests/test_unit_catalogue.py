@@ -0,0 +1,73 @@
+"""
+Resolving the students' unit codes against a catalogue of the real ones (--unit-catalogue).
+"""
+import pandas
+import pytest
+from typing import List
+
+from conftest import run_process, tracker_cells
+
+
+# - - - - - - >
+# Every unit code the synthetic export's students entered (they all start "CODE12345: ...")
+
+
+def export_unit_codes(export: str) -> List[str]:
+    cells: pandas.Series = pandas.read_csv(export, dtype = str).stack()
+    return sorted(cells.str.extract(r"^([A-Z]{4}[0-9]{5}):", expand = False).dropna().unique())
+
+
+def write_catalogue(codes: List[str], path: str) -> str:
+    pandas.DataFrame({"Unit Code": codes, "Unit Title": [f"Unit {code}" for code in codes]}).to_csv(path, index = False)
+    return path
+
+
+# - - - - - - >
+# Both engines write the same Tracker with a catalogue - when every code is already in it (nothing to
+# resolve at all), and when every other code is only in it with its last digit changed (a guess)
+
+
+@pytest.mark.parametrize("near_misses", [False, True], ids = ["exact", "near-misses"])
+def test_engines_agree_with_catalogue(synthetic_csv, tmp_path, near_misses):
+    codes: List[str] = export_unit_codes(synthetic_csv)
+    if near_misses:
+        codes = [code if position % 2 else code[:-1] + str((int(code[-1]) + 1) % 10) for position, code in enumerate(codes)]
+    catalogue: str = write_catalogue(codes, str(tmp_path / "catalogue.csv"))
+
+    columns = run_process([synthetic_csv], str(tmp_path / "columns"), "--unit-catalogue", catalogue)
+    rows    = run_process([synthetic_csv], str(tmp_path / "rows"), "--unit-catalogue", catalogue, "--engine", "rows")
+
+    guessed: bool = any("(catalogue:" in str(cell) for row in tracker_cells(columns) for cell in row)
+    assert guessed == near_misses
+    assert tracker_cells(columns) == tracker_cells(rows)
+
+
+# - - - - - - >
+# UnitCodeCatalogue.lookup() on its own - NURS34555 and NURS34565 are one digit apart, so a code one
+# typo away from both of them is a tie, and is not resolved
+
+
+@pytest.fixture
+def catalogue():
+    from mitcircs import UnitCodeCatalogue
+    return UnitCodeCatalogue(["NURS34555", "NURS34565", "MEDN10101"], {"MEDN10101": ["Clinical Skills Portfolio"]})
+
+
+@pytest.mark.parametrize("cell, expected", [
+    ("NURS34555",                       "NURS34555"),
+    ("NURS34555: Essay",                "NURS34555"),
+    ("nurs 34555",                      "NURS34555"),
+    ("MEDN10111",                       "MEDN10111 (catalogue: MEDN10101?)"),
+    ("MEDN1010",                        "MEDN1010 (catalogue: MEDN10101?)"),
+    ("MDEN10101",                       "MDEN10101 (catalogue: MEDN10101?)"),
+    ("MEDX10101",                       "MEDX10101 (catalogue: MEDN10101?)"),
+    ("NRUS34555",                       "NRUS34555 (catalogue: NURS34555?)"),
+    ("Clinical skills portfolio essay", "Clinical  (catalogue: MEDN10101?)"),
+    ("NURS34575",                       None),
+    ("NURS3455",                        None),
+    ("PHYS20001",                       None),
+    ("My essay",                        None),
+], ids = ["exact", "exact-with-name", "exact-spaced", "digit-changed", "digit-dropped", "letters-swapped", "letter-changed",
+          "letters-swapped-2", "name-only", "digit-tie", "dropped-digit-tie", "not-in-catalogue", "nothing-like"])
+def test_lookup(catalogue, cell, expected):
+    assert catalogue.lookup(cell) == expected